@@ -111,7 +111,7 @@ class AgentTaskListFilters(SQLModel):
     unassigned: bool | None = None
 
 
-def _task_list_filters(
+async def _task_list_filters(
     status_filter: str | None = TASK_STATUS_QUERY,
     assigned_agent_id: UUID | None = None,
     unassigned: bool | None = None,
@@ -51,7 +51,7 @@ AGENT_AUTH_OPTIONAL_DEP = Depends(get_agent_auth_context_optional)
 SESSION_DEP = Depends(get_session)
 
 
-def require_admin_auth(auth: AuthContext = AUTH_DEP) -> AuthContext:
+async def require_admin_auth(auth: AuthContext = AUTH_DEP) -> AuthContext:
     """Require an authenticated admin user."""
     require_admin(auth)
     return auth
@@ -66,7 +66,7 @@ class ActorContext:
     agent: Agent | None = None
 
 
-def require_admin_or_agent(
+async def require_admin_or_agent(
     auth: AuthContext | None = AUTH_OPTIONAL_DEP,
     agent_auth: AgentAuthContext | None = AGENT_AUTH_OPTIONAL_DEP,
 ) -> ActorContext:
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import col
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import and_, or_
+from sqlmodel import col, select
 
 from app.api.deps import require_org_member
 from app.core.auth import get_auth_context
+from app.db.pagination import decode_keyset_cursor, encode_keyset_cursor
 from app.db.session import get_session
 from app.models.escalations import Escalation, EscalationCosigner
 from app.models.proposals import Proposal
@@ -26,10 +29,13 @@ from app.services.escalation_engine import (
     create_action_escalation,
     create_governance_escalation,
 )
-from app.services.audit import record_audit
+from app.services.audit import record_audit_in_new_session
 from app.services.organizations import OrganizationContext
-from app.services.permission_resolver import resolve_zone_permission
-from app.services.zone_auth import ZoneAuthContext, require_zone_permission
+from app.services.zone_auth import (
+    ZoneAuthContext,
+    require_zone_permission,
+    resolve_zone_permission_cached,
+)
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -40,24 +46,24 @@ router = APIRouter(prefix="/organizations/me", tags=["escalations"])
 SESSION_DEP = Depends(get_session)
 AUTH_DEP = Depends(get_auth_context)
 ORG_MEMBER_DEP = Depends(require_org_member)
+LIST_LIMIT_QUERY = Query(default=50, ge=1, le=500)
+LIST_CURSOR_QUERY = Query(default=None)
+_ESCALATION_LIST_ADAPTER = TypeAdapter(list[EscalationRead])
+_ESCALATION_READ_FIELDS = tuple(
+    name for name in EscalationRead.model_fields if name != "cosigners"
+)
+_COSIGNER_READ_FIELDS = tuple(EscalationCosignerRead.model_fields)
 
 
 async def _check_zone_perm(
     session: AsyncSession,
-    member: object,
-    zone_id: UUID,
+    ctx: OrganizationContext,
+    zone: TrustZone,
     action: str,
 ) -> None:
-    """Load zone and check permission, raising 403 on failure."""
-    from app.models.organization_members import OrganizationMember
-
-    zone = await TrustZone.objects.by_id(zone_id).first(session)
-    if zone is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Zone not found")
-    if not isinstance(member, OrganizationMember):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-    allowed = await resolve_zone_permission(
-        session, member=member, zone=zone, action=action,
+    """Check permission on an already-loaded zone, raising 403 on failure."""
+    allowed = await resolve_zone_permission_cached(
+        session, org_ctx=ctx, zone=zone, action=action,
     )
     if not allowed:
         raise HTTPException(
@@ -66,29 +72,88 @@ async def _check_zone_perm(
         )
 
 
-async def _get_escalation_or_404(
+async def _get_proposal_with_zone_or_404(
+    session: AsyncSession,
+    *,
+    proposal_id: UUID,
+    organization_id: UUID,
+) -> tuple[Proposal, TrustZone]:
+    """Load a proposal and its zone in one round trip, raising 404 when missing."""
+    statement = (
+        select(Proposal, TrustZone)
+        .join(TrustZone, col(TrustZone.id) == col(Proposal.zone_id))
+        .where(col(Proposal.id) == proposal_id)
+        .where(col(Proposal.organization_id) == organization_id)
+    )
+    row = (await session.exec(statement)).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    proposal, zone = row
+    return proposal, zone
+
+
+async def _get_escalation_with_cosigners_or_404(
     session: AsyncSession,
     *,
     escalation_id: UUID,
     organization_id: UUID,
-) -> Escalation:
-    escalation = await Escalation.objects.by_id(escalation_id).first(session)
-    if escalation is None or escalation.organization_id != organization_id:
+) -> tuple[Escalation, list[EscalationCosigner]]:
+    """Load an escalation and its co-signers in one round trip, raising 404 when missing."""
+    statement = (
+        select(Escalation, EscalationCosigner)
+        .outerjoin(
+            EscalationCosigner,
+            col(EscalationCosigner.escalation_id) == col(Escalation.id),
+        )
+        .where(col(Escalation.id) == escalation_id)
+        .where(col(Escalation.organization_id) == organization_id)
+        .order_by(col(EscalationCosigner.created_at))
+    )
+    rows = (await session.exec(statement)).all()
+    if not rows:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-    return escalation
+    cosigners = [cosigner for _, cosigner in rows if cosigner is not None]
+    return rows[0][0], cosigners
+
+
+async def _get_escalation_with_zone_or_404(
+    session: AsyncSession,
+    *,
+    escalation_id: UUID,
+    organization_id: UUID,
+) -> tuple[Escalation, TrustZone]:
+    """Load an escalation and its source zone in one round trip, raising 404 when missing."""
+    statement = (
+        select(Escalation, TrustZone)
+        .join(TrustZone, col(TrustZone.id) == col(Escalation.source_zone_id))
+        .where(col(Escalation.id) == escalation_id)
+        .where(col(Escalation.organization_id) == organization_id)
+    )
+    row = (await session.exec(statement)).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    escalation, zone = row
+    return escalation, zone
+
+
+def _cosigner_to_read(cosigner: EscalationCosigner) -> EscalationCosignerRead:
+    return EscalationCosignerRead.model_construct(
+        **{name: getattr(cosigner, name) for name in _COSIGNER_READ_FIELDS},
+    )
 
 
 def _escalation_to_read(
     escalation: Escalation,
     cosigners: list[EscalationCosigner] | None = None,
 ) -> EscalationRead:
-    model = EscalationRead.model_validate(escalation, from_attributes=True)
+    # Values come straight from typed DB rows, so construct without validating;
+    # FastAPI serializes response-model instances as-is.
+    values: dict[str, Any] = {
+        name: getattr(escalation, name) for name in _ESCALATION_READ_FIELDS
+    }
     if cosigners is not None:
-        model.cosigners = [
-            EscalationCosignerRead.model_validate(c, from_attributes=True)
-            for c in cosigners
-        ]
-    return model
+        values["cosigners"] = [_cosigner_to_read(c) for c in cosigners]
+    return EscalationRead.model_construct(**values)
 
 
 @router.post(
@@ -106,11 +171,12 @@ async def escalate_proposal(
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-    # Load proposal to get zone_id for permission check
-    proposal = await Proposal.objects.by_id(proposal_id).first(session)
-    if proposal is None or proposal.organization_id != ctx.organization.id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-    await _check_zone_perm(session, ctx.member, proposal.zone_id, "escalation.trigger")
+    proposal, zone = await _get_proposal_with_zone_or_404(
+        session,
+        proposal_id=proposal_id,
+        organization_id=ctx.organization.id,
+    )
+    await _check_zone_perm(session, ctx, zone, "escalation.trigger")
 
     escalation = await create_action_escalation(
         session,
@@ -118,6 +184,8 @@ async def escalate_proposal(
         escalator_id=auth.user.id,
         proposal_id=proposal_id,
         reason=payload.reason,
+        proposal=proposal,
+        zone=zone,
     )
 
     cosigners = await EscalationCosigner.objects.filter_by(
@@ -148,6 +216,7 @@ async def escalate_governance(
         escalator_id=auth.user.id,
         zone_id=zone_id,
         reason=payload.reason,
+        zone=zone_ctx.zone,
     )
 
     cosigners = await EscalationCosigner.objects.filter_by(
@@ -163,6 +232,7 @@ async def escalate_governance(
 async def cosign_escalation(
     escalation_id: UUID,
     payload: CosignPayload,
+    background: BackgroundTasks,
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
@@ -171,22 +241,23 @@ async def cosign_escalation(
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-    escalation = await _get_escalation_or_404(
+    escalation, zone = await _get_escalation_with_zone_or_404(
         session,
         escalation_id=escalation_id,
         organization_id=ctx.organization.id,
     )
 
-    await _check_zone_perm(session, ctx.member, escalation.source_zone_id, "escalation.trigger")
+    await _check_zone_perm(session, ctx, zone, "escalation.trigger")
 
     cosigner = await add_cosigner(
         session,
         escalation=escalation,
         user_id=auth.user.id,
+        zone=zone,
     )
 
-    await record_audit(
-        session,
+    background.add_task(
+        record_audit_in_new_session,
         organization_id=ctx.organization.id,
         actor_id=auth.user.id,
         actor_type="human",
@@ -196,15 +267,18 @@ async def cosign_escalation(
         target_id=escalation.id,
     )
 
-    return EscalationCosignerRead.model_validate(cosigner, from_attributes=True)
+    return _cosigner_to_read(cosigner)
 
 
 @router.get("/escalations", response_model=list[EscalationRead])
 async def list_escalations(
+    response: Response,
     session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
     escalation_type: str | None = None,
     escalation_status: str | None = None,
+    limit: int = LIST_LIMIT_QUERY,
+    cursor: str | None = LIST_CURSOR_QUERY,
 ) -> list[EscalationRead]:
     """List escalations in the active organization."""
     query = Escalation.objects.filter_by(organization_id=ctx.organization.id)
@@ -212,8 +286,26 @@ async def list_escalations(
         query = query.filter_by(escalation_type=escalation_type)
     if escalation_status is not None:
         query = query.filter(col(Escalation.status) == escalation_status)
-    escalations = await query.order_by(col(Escalation.created_at).desc()).all(session)
-    return [_escalation_to_read(e) for e in escalations]
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_keyset_cursor(cursor)
+        query = query.filter(
+            or_(
+                col(Escalation.created_at) < cursor_created_at,
+                and_(
+                    col(Escalation.created_at) == cursor_created_at,
+                    col(Escalation.id) < cursor_id,
+                ),
+            ),
+        )
+    escalations = await (
+        query.order_by(col(Escalation.created_at).desc(), col(Escalation.id).desc())
+        .limit(limit)
+        .all(session)
+    )
+    if len(escalations) == limit:
+        last = escalations[-1]
+        response.headers["X-Next-Cursor"] = encode_keyset_cursor(last.created_at, last.id)
+    return _ESCALATION_LIST_ADAPTER.validate_python(escalations, from_attributes=True)
 
 
 @router.get("/escalations/{escalation_id}", response_model=EscalationRead)
@@ -223,12 +315,9 @@ async def get_escalation(
     ctx: OrganizationContext = ORG_MEMBER_DEP,
 ) -> EscalationRead:
     """Get escalation detail with co-signers."""
-    escalation = await _get_escalation_or_404(
+    escalation, cosigners = await _get_escalation_with_cosigners_or_404(
         session,
         escalation_id=escalation_id,
         organization_id=ctx.organization.id,
     )
-    cosigners = await EscalationCosigner.objects.filter_by(
-        escalation_id=escalation.id,
-    ).all(session)
     return _escalation_to_read(escalation, cosigners)
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import col
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import and_, literal_column, or_, union_all
+from sqlalchemy.orm import defer
+from sqlmodel import col, select
 
 from app.api.deps import require_org_member
 from app.core.auth import get_auth_context
+from app.db.pagination import decode_keyset_cursor, encode_keyset_cursor
 from app.db.session import get_session
 from app.models.evaluations import Evaluation, EvaluationScore, IncentiveSignal
 from app.models.trust_zones import TrustZone
@@ -19,7 +23,6 @@ from app.schemas.evaluations import (
     EvaluationRead,
     EvaluationScoreCreate,
     EvaluationScoreRead,
-    IncentiveSignalRead,
 )
 from app.services.evaluations import (
     apply_incentive_signals,
@@ -28,9 +31,9 @@ from app.services.evaluations import (
     finalize_evaluation,
     submit_score,
 )
-from app.services.audit import record_audit
+from app.services.audit import record_audit_in_new_session
 from app.services.organizations import OrganizationContext
-from app.services.permission_resolver import resolve_zone_permission
+from app.services.zone_auth import resolve_zone_permission_cached
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -41,24 +44,23 @@ router = APIRouter(prefix="/organizations/me/evaluations", tags=["evaluations"])
 SESSION_DEP = Depends(get_session)
 AUTH_DEP = Depends(get_auth_context)
 ORG_MEMBER_DEP = Depends(require_org_member)
+LIST_LIMIT_QUERY = Query(default=50, ge=1, le=500)
+LIST_CURSOR_QUERY = Query(default=None)
+_EVALUATION_LIST_ADAPTER = TypeAdapter(list[EvaluationRead])
+_EVALUATION_READ_FIELDS = tuple(
+    name for name in EvaluationRead.model_fields if name not in {"scores", "incentive_signals"}
+)
 
 
 async def _check_zone_perm(
     session: AsyncSession,
-    member: object,
-    zone_id: UUID,
+    ctx: OrganizationContext,
+    zone: TrustZone,
     action: str,
 ) -> None:
-    """Load zone and check permission, raising 403 on failure."""
-    from app.models.organization_members import OrganizationMember
-
-    zone = await TrustZone.objects.by_id(zone_id).first(session)
-    if zone is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Zone not found")
-    if not isinstance(member, OrganizationMember):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-    allowed = await resolve_zone_permission(
-        session, member=member, zone=zone, action=action,
+    """Check permission on an already-loaded zone, raising 403 on failure."""
+    allowed = await resolve_zone_permission_cached(
+        session, org_ctx=ctx, zone=zone, action=action,
     )
     if not allowed:
         raise HTTPException(
@@ -67,6 +69,13 @@ async def _check_zone_perm(
         )
 
 
+async def _get_zone_or_404(session: AsyncSession, zone_id: UUID) -> TrustZone:
+    zone = await TrustZone.objects.by_id(zone_id).first(session)
+    if zone is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Zone not found")
+    return zone
+
+
 async def _get_evaluation_or_404(
     session: AsyncSession,
     *,
@@ -79,22 +88,79 @@ async def _get_evaluation_or_404(
     return evaluation
 
 
+async def _get_evaluation_with_zone_or_404(
+    session: AsyncSession,
+    *,
+    evaluation_id: UUID,
+    organization_id: UUID,
+    load_aggregate: bool = True,
+) -> tuple[Evaluation, TrustZone]:
+    """Load an evaluation and its zone in one round trip, raising 404 when missing.
+
+    Scoring paths never read `aggregate_result`, so they pass
+    `load_aggregate=False` to leave the JSON column out of the SELECT.
+    """
+    statement = (
+        select(Evaluation, TrustZone)
+        .join(TrustZone, col(TrustZone.id) == col(Evaluation.zone_id))
+        .where(col(Evaluation.id) == evaluation_id)
+        .where(col(Evaluation.organization_id) == organization_id)
+    )
+    if not load_aggregate:
+        statement = statement.options(
+            defer(Evaluation.aggregate_result),  # type: ignore[arg-type]
+        )
+    row = (await session.exec(statement)).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    evaluation, zone = row
+    return evaluation, zone
+
+
+async def _load_scores_and_signals(
+    session: AsyncSession,
+    evaluation_id: UUID,
+) -> tuple[list[EvaluationScore], list[IncentiveSignal]]:
+    """Load an evaluation's scores and incentive signals in a single round trip.
+
+    A two-row ``kind`` derived table drives the read: scores join only the first row and
+    signals only the second, so each child appears once without multiplying the other.
+    """
+    kind = union_all(
+        select(literal_column("1").label("kind")),
+        select(literal_column("2").label("kind")),
+    ).subquery("child_kind")
+    statement = (
+        select(EvaluationScore, IncentiveSignal)
+        .select_from(kind)
+        .outerjoin(
+            EvaluationScore,
+            and_(kind.c.kind == 1, col(EvaluationScore.evaluation_id) == evaluation_id),
+        )
+        .outerjoin(
+            IncentiveSignal,
+            and_(kind.c.kind == 2, col(IncentiveSignal.evaluation_id) == evaluation_id),
+        )
+        .order_by(kind.c.kind, col(EvaluationScore.created_at), col(IncentiveSignal.created_at))
+    )
+    rows = (await session.exec(statement)).all()
+    scores = [score for score, _ in rows if score is not None]
+    signals = [signal for _, signal in rows if signal is not None]
+    return scores, signals
+
+
 def _evaluation_to_read(
     evaluation: Evaluation,
     scores: list[EvaluationScore] | None = None,
     signals: list[IncentiveSignal] | None = None,
 ) -> EvaluationRead:
-    model = EvaluationRead.model_validate(evaluation, from_attributes=True)
-    if scores is not None:
-        model.scores = [
-            EvaluationScoreRead.model_validate(s, from_attributes=True) for s in scores
-        ]
-    if signals is not None:
-        model.incentive_signals = [
-            IncentiveSignalRead.model_validate(s, from_attributes=True)
-            for s in signals
-        ]
-    return model
+    # One validator call covers the evaluation and its nested children.
+    values: dict[str, Any] = {
+        name: getattr(evaluation, name) for name in _EVALUATION_READ_FIELDS
+    }
+    values["scores"] = scores or []
+    values["incentive_signals"] = signals or []
+    return EvaluationRead.model_validate(values, from_attributes=True)
 
 
 @router.post("", response_model=EvaluationRead)
@@ -108,7 +174,8 @@ async def create_evaluation_endpoint(
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-    await _check_zone_perm(session, ctx.member, payload.zone_id, "evaluation.create")
+    zone = await _get_zone_or_404(session, payload.zone_id)
+    await _check_zone_perm(session, ctx, zone, "evaluation.create")
 
     evaluation = await create_evaluation(
         session,
@@ -121,10 +188,13 @@ async def create_evaluation_endpoint(
 
 @router.get("", response_model=list[EvaluationRead])
 async def list_evaluations(
+    response: Response,
     session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
     zone_id: UUID | None = None,
     evaluation_status: str | None = None,
+    limit: int = LIST_LIMIT_QUERY,
+    cursor: str | None = LIST_CURSOR_QUERY,
 ) -> list[EvaluationRead]:
     """List evaluations in the active organization."""
     query = Evaluation.objects.filter_by(organization_id=ctx.organization.id)
@@ -132,8 +202,26 @@ async def list_evaluations(
         query = query.filter_by(zone_id=zone_id)
     if evaluation_status is not None:
         query = query.filter(col(Evaluation.status) == evaluation_status)
-    evaluations = await query.order_by(col(Evaluation.created_at).desc()).all(session)
-    return [_evaluation_to_read(e) for e in evaluations]
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_keyset_cursor(cursor)
+        query = query.filter(
+            or_(
+                col(Evaluation.created_at) < cursor_created_at,
+                and_(
+                    col(Evaluation.created_at) == cursor_created_at,
+                    col(Evaluation.id) < cursor_id,
+                ),
+            ),
+        )
+    evaluations = await (
+        query.order_by(col(Evaluation.created_at).desc(), col(Evaluation.id).desc())
+        .limit(limit)
+        .all(session)
+    )
+    if len(evaluations) == limit:
+        last = evaluations[-1]
+        response.headers["X-Next-Cursor"] = encode_keyset_cursor(last.created_at, last.id)
+    return _EVALUATION_LIST_ADAPTER.validate_python(evaluations, from_attributes=True)
 
 
 @router.get("/{evaluation_id}", response_model=EvaluationRead)
@@ -148,12 +236,7 @@ async def get_evaluation(
         evaluation_id=evaluation_id,
         organization_id=ctx.organization.id,
     )
-    scores = await EvaluationScore.objects.filter_by(
-        evaluation_id=evaluation.id,
-    ).all(session)
-    signals = await IncentiveSignal.objects.filter_by(
-        evaluation_id=evaluation.id,
-    ).all(session)
+    scores, signals = await _load_scores_and_signals(session, evaluation.id)
     return _evaluation_to_read(evaluation, scores, signals)
 
 
@@ -161,6 +244,7 @@ async def get_evaluation(
 async def submit_evaluation_score(
     evaluation_id: UUID,
     payload: EvaluationScoreCreate,
+    background: BackgroundTasks,
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
@@ -169,13 +253,14 @@ async def submit_evaluation_score(
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-    evaluation = await _get_evaluation_or_404(
+    evaluation, zone = await _get_evaluation_with_zone_or_404(
         session,
         evaluation_id=evaluation_id,
         organization_id=ctx.organization.id,
+        load_aggregate=False,
     )
 
-    await _check_zone_perm(session, ctx.member, evaluation.zone_id, "evaluation.submit")
+    await _check_zone_perm(session, ctx, zone, "evaluation.submit")
 
     score = await submit_score(
         session,
@@ -184,8 +269,8 @@ async def submit_evaluation_score(
         payload=payload,
     )
 
-    await record_audit(
-        session,
+    background.add_task(
+        record_audit_in_new_session,
         organization_id=ctx.organization.id,
         actor_id=auth.user.id,
         actor_type="human",
@@ -209,13 +294,13 @@ async def finalize_evaluation_endpoint(
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-    evaluation = await _get_evaluation_or_404(
+    evaluation, zone = await _get_evaluation_with_zone_or_404(
         session,
         evaluation_id=evaluation_id,
         organization_id=ctx.organization.id,
     )
 
-    await _check_zone_perm(session, ctx.member, evaluation.zone_id, "evaluation.submit")
+    await _check_zone_perm(session, ctx, zone, "evaluation.submit")
 
     evaluation = await finalize_evaluation(
         session,
@@ -226,13 +311,7 @@ async def finalize_evaluation_endpoint(
     # Apply incentive signals to reputation scores
     await apply_incentive_signals(session, evaluation=evaluation)
 
-    scores = await EvaluationScore.objects.filter_by(
-        evaluation_id=evaluation.id,
-    ).all(session)
-    signals = await IncentiveSignal.objects.filter_by(
-        evaluation_id=evaluation.id,
-    ).all(session)
-
+    scores, signals = await _load_scores_and_signals(session, evaluation.id)
     return _evaluation_to_read(evaluation, scores, signals)
 
 
@@ -247,17 +326,14 @@ async def auto_evaluate_endpoint(
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-    evaluation = await _get_evaluation_or_404(
+    evaluation, zone = await _get_evaluation_with_zone_or_404(
         session,
         evaluation_id=evaluation_id,
         organization_id=ctx.organization.id,
+        load_aggregate=False,
     )
 
-    await _check_zone_perm(session, ctx.member, evaluation.zone_id, "evaluation.submit")
-
-    zone = await TrustZone.objects.by_id(evaluation.zone_id).first(session)
-    if zone is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Zone not found")
+    await _check_zone_perm(session, ctx, zone, "evaluation.submit")
 
     scores = await auto_evaluate(session, evaluation, zone)
 
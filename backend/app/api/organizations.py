@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import secrets
+import time
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func
+from pydantic import TypeAdapter
+from sqlalchemy import Uuid, and_, any_, cast, func, literal, union_all
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import col, select
 
 from app.api.deps import require_org_admin, require_org_member
@@ -16,31 +20,16 @@ from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
 from app.db.session import get_session
-from app.models.activity_events import ActivityEvent
-from app.models.agents import Agent
-from app.models.approval_task_links import ApprovalTaskLink
-from app.models.approvals import Approval
-from app.models.board_group_memory import BoardGroupMemory
-from app.models.board_groups import BoardGroup
-from app.models.board_memory import BoardMemory
-from app.models.board_onboarding import BoardOnboardingSession
-from app.models.board_webhook_payloads import BoardWebhookPayload
-from app.models.board_webhooks import BoardWebhook
 from app.models.boards import Board
-from app.models.gateways import Gateway
 from app.models.organization_board_access import OrganizationBoardAccess
 from app.models.organization_invite_board_access import OrganizationInviteBoardAccess
 from app.models.organization_invites import OrganizationInvite
 from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
-from app.models.task_dependencies import TaskDependency
-from app.models.task_fingerprints import TaskFingerprint
-from app.models.tasks import Task
 from app.models.users import User
 from app.schemas.common import OkResponse
 from app.schemas.organizations import (
     OrganizationActiveUpdate,
-    OrganizationBoardAccessRead,
     OrganizationCreate,
     OrganizationInviteAccept,
     OrganizationInviteCreate,
@@ -50,7 +39,6 @@ from app.schemas.organizations import (
     OrganizationMemberRead,
     OrganizationMemberUpdate,
     OrganizationRead,
-    OrganizationUserRead,
 )
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.organizations import (
@@ -62,6 +50,7 @@ from app.services.organizations import (
     get_active_membership,
     get_member,
     is_org_admin,
+    mark_invite_accepted,
     normalize_invited_email,
     normalize_role,
     set_active_organization,
@@ -82,14 +71,86 @@ ORG_MEMBER_DEP = Depends(require_org_member)
 ORG_ADMIN_DEP = Depends(require_org_admin)
 
 
+_MEMBER_READ_FIELDS = tuple(
+    name for name in OrganizationMemberRead.model_fields if name not in {"user", "board_access"}
+)
+
+
+_MEMBER_LIST_ADAPTER = TypeAdapter(list[OrganizationMemberRead])
+_INVITE_LIST_ADAPTER = TypeAdapter(list[OrganizationInviteRead])
+
+# Per-process org-switcher cache: user id -> (active org id, loaded at, items).
+# Entries only match while the user's stored active org is unchanged, so a switch made
+# through another worker misses here too; membership changes invalidate explicitly.
+_ORG_LIST_TTL_SECONDS = 30.0
+_ORG_LIST_CACHE_MAX_ENTRIES = 1024
+_org_list_cache: dict[UUID, tuple[UUID | None, float, list[OrganizationListItem]]] = {}
+
+
+def _cached_org_list(user: User) -> list[OrganizationListItem] | None:
+    entry = _org_list_cache.get(user.id)
+    if entry is None:
+        return None
+    active_id, loaded_at, items = entry
+    if (
+        active_id != user.active_organization_id
+        or time.monotonic() - loaded_at >= _ORG_LIST_TTL_SECONDS
+    ):
+        # A stale entry can never hit again; drop it rather than keep it for the process.
+        del _org_list_cache[user.id]
+        return None
+    return list(items)
+
+
+def _store_org_list(
+    user_id: UUID,
+    active_id: UUID | None,
+    items: list[OrganizationListItem],
+) -> None:
+    now = time.monotonic()
+    for key in [
+        key
+        for key, (_, loaded_at, _) in _org_list_cache.items()
+        if now - loaded_at >= _ORG_LIST_TTL_SECONDS
+    ]:
+        del _org_list_cache[key]
+    # Re-insert so dict order tracks recency; evict the oldest users past the cap.
+    _org_list_cache.pop(user_id, None)
+    while len(_org_list_cache) >= _ORG_LIST_CACHE_MAX_ENTRIES:
+        _org_list_cache.pop(next(iter(_org_list_cache)))
+    _org_list_cache[user_id] = (active_id, now, items)
+
+
+def _invalidate_org_list(*user_ids: UUID) -> None:
+    """Drop cached org lists for the given users, or for everyone when none are given."""
+    if not user_ids:
+        _org_list_cache.clear()
+        return
+    for user_id in user_ids:
+        _org_list_cache.pop(user_id, None)
+
+
+def _member_values(
+    member: OrganizationMember,
+    user: User | None,
+    access_rows: Sequence[OrganizationBoardAccess] = (),
+) -> dict[str, Any]:
+    values: dict[str, Any] = {name: getattr(member, name) for name in _MEMBER_READ_FIELDS}
+    values["user"] = user
+    values["board_access"] = access_rows
+    return values
+
+
 def _member_to_read(
     member: OrganizationMember,
     user: User | None,
+    access_rows: Sequence[OrganizationBoardAccess] = (),
 ) -> OrganizationMemberRead:
-    model = OrganizationMemberRead.model_validate(member, from_attributes=True)
-    if user is not None:
-        model.user = OrganizationUserRead.model_validate(user, from_attributes=True)
-    return model
+    # One validator call covers the member and its nested user/access rows.
+    return OrganizationMemberRead.model_validate(
+        _member_values(member, user, access_rows),
+        from_attributes=True,
+    )
 
 
 async def _require_org_member(
@@ -98,19 +159,108 @@ async def _require_org_member(
     organization_id: UUID,
     member_id: UUID,
 ) -> OrganizationMember:
-    member = await OrganizationMember.objects.by_id(member_id).first(session)
+    member = await session.get(OrganizationMember, member_id)
     if member is None or member.organization_id != organization_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return member
 
 
+async def _require_org_member_with_user(
+    session: AsyncSession,
+    *,
+    organization_id: UUID,
+    member_id: UUID,
+) -> tuple[OrganizationMember, User | None]:
+    """Load a member and its user in one round trip, raising 404 when missing."""
+    statement = (
+        select(OrganizationMember, User)
+        .outerjoin(User, col(User.id) == col(OrganizationMember.user_id))
+        .where(col(OrganizationMember.id) == member_id)
+        .where(col(OrganizationMember.organization_id) == organization_id)
+    )
+    row = (await session.exec(statement)).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    member, user = row
+    return member, user
+
+
+async def _get_member_detail_or_404(
+    session: AsyncSession,
+    *,
+    organization_id: UUID,
+    member_id: UUID,
+) -> tuple[OrganizationMember, User | None, list[OrganizationBoardAccess]]:
+    """Load a member with its user and board access rows in one round trip."""
+    statement = (
+        select(OrganizationMember, User, OrganizationBoardAccess)
+        .outerjoin(User, col(User.id) == col(OrganizationMember.user_id))
+        .outerjoin(
+            OrganizationBoardAccess,
+            col(OrganizationBoardAccess.organization_member_id) == col(OrganizationMember.id),
+        )
+        .where(col(OrganizationMember.id) == member_id)
+        .where(col(OrganizationMember.organization_id) == organization_id)
+        .order_by(col(OrganizationBoardAccess.created_at))
+    )
+    rows = (await session.exec(statement)).all()
+    if not rows:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    member, user, _ = rows[0]
+    access_rows = [access for _, _, access in rows if access is not None]
+    return member, user, access_rows
+
+
+async def _require_org_boards(
+    session: AsyncSession,
+    *,
+    organization_id: UUID,
+    board_ids: set[UUID],
+) -> None:
+    """Raise 422 listing any board ids that do not belong to the organization."""
+    if not board_ids:
+        return
+    org_board_ids = select(col(Board.id)).where(col(Board.organization_id) == organization_id)
+    if session.get_bind().dialect.name == "postgresql":
+        # One uuid[] bind keeps the statement text (and its compiled-cache key) the same
+        # for any number of ids.
+        ids_param = literal(list(board_ids), ARRAY(Uuid()))
+        requested = select(func.unnest(ids_param, type_=Uuid()).label("id"))
+        org_board_ids = org_board_ids.where(col(Board.id) == any_(ids_param))
+    else:
+        # SQLite (tests) has no arrays; a UNION ALL of bound ids stands in for unnest.
+        requested = select(
+            union_all(
+                *(
+                    select(cast(literal(board_id, Uuid()), Uuid()).label("id"))
+                    for board_id in board_ids
+                ),
+            )
+            .subquery("requested_boards")
+            .c.id,
+        )
+        org_board_ids = org_board_ids.where(col(Board.id).in_(board_ids))
+    # The requested ids minus the organization's boards leaves only the unknown ids; the
+    # happy path reads no rows.
+    statement = requested.except_(org_board_ids)
+    missing = sorted((await session.execute(statement)).scalars(), key=str)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail={
+                "message": "Some selected boards are invalid for this organization.",
+                "invalid_board_ids": [str(value) for value in missing],
+            },
+        )
+
+
 async def _require_org_invite(
     session: AsyncSession,
     *,
     organization_id: UUID,
     invite_id: UUID,
 ) -> OrganizationInvite:
-    invite = await OrganizationInvite.objects.by_id(invite_id).first(session)
+    invite = await session.get(OrganizationInvite, invite_id)
     if invite is None or invite.organization_id != organization_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return invite
@@ -128,14 +278,10 @@ async def create_organization(
     name = payload.name.strip()
     if not name:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT)
-    existing = (
-        await session.exec(
-            select(Organization).where(
-                func.lower(col(Organization.name)) == name.lower(),
-            ),
-        )
-    ).first()
-    if existing is not None:
+    name_taken = await Organization.objects.filter(
+        func.lower(col(Organization.name)) == name.lower(),
+    ).exists(session)
+    if name_taken:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT)
 
     now = utcnow()
@@ -156,7 +302,7 @@ async def create_organization(
     await session.flush()
     await set_active_organization(session, user=auth.user, organization_id=org.id)
     await session.commit()
-    await session.refresh(org)
+    _invalidate_org_list(auth.user.id)
     return OrganizationRead.model_validate(org, from_attributes=True)
 
 
@@ -168,10 +314,14 @@ async def list_my_organizations(
     """List organizations where the current user is a member."""
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    cached = _cached_org_list(auth.user)
+    if cached is not None:
+        return cached
+    cache_key_active_id = auth.user.active_organization_id
 
-    await get_active_membership(session, auth.user)
-    db_user = await User.objects.by_id(auth.user.id).first(session)
-    active_id = db_user.active_organization_id if db_user else auth.user.active_organization_id
+    # The resolved membership already reflects the normalized active organization.
+    active_member = await get_active_membership(session, auth.user)
+    active_id = active_member.organization_id if active_member else None
 
     statement = (
         select(Organization, OrganizationMember)
@@ -182,16 +332,17 @@ async def list_my_organizations(
         .where(col(OrganizationMember.user_id) == auth.user.id)
         .order_by(func.lower(col(Organization.name)).asc())
     )
-    rows = list(await session.exec(statement))
-    return [
+    items = [
         OrganizationListItem(
             id=org.id,
             name=org.name,
             role=member.role,
             is_active=org.id == active_id,
         )
-        for org, member in rows
+        for org, member in await session.exec(statement)
     ]
+    _store_org_list(auth.user.id, cache_key_active_id, items)
+    return list(items)
 
 
 @router.patch("/me/active", response_model=OrganizationRead)
@@ -208,9 +359,8 @@ async def set_active_org(
         user=auth.user,
         organization_id=payload.organization_id,
     )
-    organization = await Organization.objects.by_id(member.organization_id).first(
-        session,
-    )
+    _invalidate_org_list(auth.user.id)
+    organization = await session.get(Organization, member.organization_id)
     if organization is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return OrganizationRead.model_validate(organization, from_attributes=True)
@@ -236,166 +386,18 @@ async def delete_my_org(
             detail="Only organization owners can delete organizations",
         )
 
-    org_id = ctx.organization.id
-    board_ids = select(Board.id).where(col(Board.organization_id) == org_id)
-    task_ids = select(Task.id).where(col(Task.board_id).in_(board_ids))
-    agent_ids = select(Agent.id).where(col(Agent.board_id).in_(board_ids))
-    member_ids = select(OrganizationMember.id).where(
-        col(OrganizationMember.organization_id) == org_id,
-    )
-    invite_ids = select(OrganizationInvite.id).where(
-        col(OrganizationInvite.organization_id) == org_id,
-    )
-    group_ids = select(BoardGroup.id).where(col(BoardGroup.organization_id) == org_id)
-
-    await crud.delete_where(
-        session,
-        ActivityEvent,
-        col(ActivityEvent.task_id).in_(task_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        ActivityEvent,
-        col(ActivityEvent.agent_id).in_(agent_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        TaskDependency,
-        col(TaskDependency.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        TaskFingerprint,
-        col(TaskFingerprint.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        ApprovalTaskLink,
-        col(ApprovalTaskLink.approval_id).in_(
-            select(Approval.id).where(col(Approval.board_id).in_(board_ids))
-        ),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        Approval,
-        col(Approval.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        BoardMemory,
-        col(BoardMemory.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        BoardWebhookPayload,
-        col(BoardWebhookPayload.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        BoardWebhook,
-        col(BoardWebhook.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        BoardOnboardingSession,
-        col(BoardOnboardingSession.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        OrganizationBoardAccess,
-        col(OrganizationBoardAccess.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        OrganizationInviteBoardAccess,
-        col(OrganizationInviteBoardAccess.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        OrganizationBoardAccess,
-        col(OrganizationBoardAccess.organization_member_id).in_(member_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        OrganizationInviteBoardAccess,
-        col(OrganizationInviteBoardAccess.organization_invite_id).in_(invite_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        Task,
-        col(Task.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        Agent,
-        col(Agent.board_id).in_(board_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        Board,
-        col(Board.organization_id) == org_id,
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        BoardGroupMemory,
-        col(BoardGroupMemory.board_group_id).in_(group_ids),
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        BoardGroup,
-        col(BoardGroup.organization_id) == org_id,
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        Gateway,
-        col(Gateway.organization_id) == org_id,
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        OrganizationInvite,
-        col(OrganizationInvite.organization_id) == org_id,
-        commit=False,
-    )
-    await crud.delete_where(
-        session,
-        OrganizationMember,
-        col(OrganizationMember.organization_id) == org_id,
-        commit=False,
-    )
-    await crud.update_where(
-        session,
-        User,
-        col(User.active_organization_id) == org_id,
-        active_organization_id=None,
-        commit=False,
-    )
+    # Boards, tasks, agents, memberships, invites, trust zones, governance records, tags,
+    # custom fields, skills and their dependents are removed by ON DELETE CASCADE
+    # foreign keys; users' active_organization_id is SET NULL.
     await crud.delete_where(
         session,
         Organization,
-        col(Organization.id) == org_id,
+        col(Organization.id) == ctx.organization.id,
         commit=False,
     )
     await session.commit()
+    # Every former member's list changes; deletes are rare, so drop the whole cache.
+    _invalidate_org_list()
     return OkResponse()
 
 
@@ -405,15 +407,12 @@ async def get_my_membership(
     ctx: OrganizationContext = ORG_MEMBER_DEP,
 ) -> OrganizationMemberRead:
     """Get the caller's membership record in the active organization."""
-    user = await User.objects.by_id(ctx.member.user_id).first(session)
-    access_rows = await OrganizationBoardAccess.objects.filter_by(
-        organization_member_id=ctx.member.id,
-    ).all(session)
-    model = _member_to_read(ctx.member, user)
-    model.board_access = [
-        OrganizationBoardAccessRead.model_validate(row, from_attributes=True) for row in access_rows
-    ]
-    return model
+    member, user, access_rows = await _get_member_detail_or_404(
+        session,
+        organization_id=ctx.organization.id,
+        member_id=ctx.member.id,
+    )
+    return _member_to_read(member, user, access_rows)
 
 
 @router.get(
@@ -432,11 +431,23 @@ async def list_org_members(
         .order_by(func.lower(col(User.email)).asc(), col(User.name).asc())
     )
 
-    def _transform(items: Sequence[Any]) -> Sequence[Any]:
-        output: list[OrganizationMemberRead] = []
-        for member, user in items:
-            output.append(_member_to_read(member, user))
-        return output
+    async def _transform(items: Sequence[Any]) -> Sequence[Any]:
+        # Fetch board access for the whole page in one IN query rather than per member.
+        member_ids = [member.id for member, _user in items]
+        access_by_member: dict[UUID, list[OrganizationBoardAccess]] = defaultdict(list)
+        if member_ids:
+            access_rows = await OrganizationBoardAccess.objects.filter(
+                col(OrganizationBoardAccess.organization_member_id).in_(member_ids),
+            ).all(session)
+            for row in access_rows:
+                access_by_member[row.organization_member_id].append(row)
+        return _MEMBER_LIST_ADAPTER.validate_python(
+            [
+                _member_values(member, user, access_by_member.get(member.id, ()))
+                for member, user in items
+            ],
+            from_attributes=True,
+        )
 
     return await paginate(session, statement, transformer=_transform)
 
@@ -448,22 +459,15 @@ async def get_org_member(
     ctx: OrganizationContext = ORG_MEMBER_DEP,
 ) -> OrganizationMemberRead:
     """Get a specific organization member by id."""
-    member = await _require_org_member(
+    # Non-admins may only read their own membership, so reject before touching the DB.
+    if not is_org_admin(ctx.member) and member_id != ctx.member.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+    member, user, access_rows = await _get_member_detail_or_404(
         session,
         organization_id=ctx.organization.id,
         member_id=member_id,
     )
-    if not is_org_admin(ctx.member) and member.user_id != ctx.member.user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-    user = await User.objects.by_id(member.user_id).first(session)
-    access_rows = await OrganizationBoardAccess.objects.filter_by(
-        organization_member_id=member.id,
-    ).all(session)
-    model = _member_to_read(member, user)
-    model.board_access = [
-        OrganizationBoardAccessRead.model_validate(row, from_attributes=True) for row in access_rows
-    ]
-    return model
+    return _member_to_read(member, user, access_rows)
 
 
 @router.patch("/me/members/{member_id}", response_model=OrganizationMemberRead)
@@ -474,7 +478,7 @@ async def update_org_member(
     ctx: OrganizationContext = ORG_ADMIN_DEP,
 ) -> OrganizationMemberRead:
     """Update a member's role in the organization."""
-    member = await _require_org_member(
+    member, user = await _require_org_member_with_user(
         session,
         organization_id=ctx.organization.id,
         member_id=member_id,
@@ -484,7 +488,7 @@ async def update_org_member(
         updates["role"] = normalize_role(updates["role"])
     updates["updated_at"] = utcnow()
     member = await crud.patch(session, member, updates)
-    user = await User.objects.by_id(member.user_id).first(session)
+    _invalidate_org_list(member.user_id)
     return _member_to_read(member, user)
 
 
@@ -496,29 +500,20 @@ async def update_member_access(
     ctx: OrganizationContext = ORG_ADMIN_DEP,
 ) -> OrganizationMemberRead:
     """Update board-level access settings for a member."""
-    member = await _require_org_member(
+    member, user = await _require_org_member_with_user(
         session,
         organization_id=ctx.organization.id,
         member_id=member_id,
     )
 
-    board_ids = {entry.board_id for entry in payload.board_access}
-    if board_ids:
-        valid_board_ids = {
-            board.id
-            for board in await Board.objects.filter_by(
-                organization_id=ctx.organization.id,
-            )
-            .filter(col(Board.id).in_(board_ids))
-            .all(session)
-        }
-        if valid_board_ids != board_ids:
-            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT)
+    await _require_org_boards(
+        session,
+        organization_id=ctx.organization.id,
+        board_ids={entry.board_id for entry in payload.board_access},
+    )
 
     await apply_member_access_update(session, member=member, update=payload)
     await session.commit()
-    await session.refresh(member)
-    user = await User.objects.by_id(member.user_id).first(session)
     return _member_to_read(member, user)
 
 
@@ -545,14 +540,13 @@ async def remove_org_member(
             detail="Only owners can remove owners",
         )
     if member.role == "owner":
-        owners = (
-            await OrganizationMember.objects.filter_by(
-                organization_id=ctx.organization.id,
-            )
-            .filter(col(OrganizationMember.role) == "owner")
-            .all(session)
+        owner_count_statement = (
+            select(func.count())
+            .select_from(OrganizationMember)
+            .where(col(OrganizationMember.organization_id) == ctx.organization.id)
+            .where(col(OrganizationMember.role) == "owner")
         )
-        if len(owners) <= 1:
+        if (await session.exec(owner_count_statement)).one() <= 1:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 detail="Organization must have at least one owner",
@@ -565,25 +559,30 @@ async def remove_org_member(
         commit=False,
     )
 
-    user = await User.objects.by_id(member.user_id).first(session)
-    if user is not None and user.active_organization_id == ctx.organization.id:
-        fallback_membership = (
-            await OrganizationMember.objects.filter(
-                col(OrganizationMember.user_id) == user.id,
+    # One query loads the departing user plus their oldest other membership, which becomes
+    # the fallback active organization if this one was active.
+    fallback_statement = (
+        select(User, OrganizationMember.organization_id)
+        .outerjoin(
+            OrganizationMember,
+            and_(
+                col(OrganizationMember.user_id) == col(User.id),
                 col(OrganizationMember.organization_id) != ctx.organization.id,
-            )
-            .order_by(col(OrganizationMember.created_at).asc())
-            .first(session)
+            ),
         )
-        if isinstance(fallback_membership, UUID):
-            user.active_organization_id = fallback_membership
-        else:
-            user.active_organization_id = (
-                fallback_membership.organization_id if fallback_membership is not None else None
-            )
-        session.add(user)
+        .where(col(User.id) == member.user_id)
+        .order_by(col(OrganizationMember.created_at).asc())
+        .limit(1)
+    )
+    row = (await session.exec(fallback_statement)).first()
+    if row is not None:
+        user, fallback_organization_id = row
+        if user.active_organization_id == ctx.organization.id:
+            user.active_organization_id = fallback_organization_id
+            session.add(user)
 
     await crud.delete(session, member)
+    _invalidate_org_list(member.user_id)
     return OkResponse()
 
 
@@ -602,7 +601,11 @@ async def list_org_invites(
         .order_by(col(OrganizationInvite.created_at).desc())
         .statement
     )
-    return await paginate(session, statement)
+
+    def _transform(items: Sequence[Any]) -> Sequence[Any]:
+        return _INVITE_LIST_ADAPTER.validate_python(items, from_attributes=True)
+
+    return await paginate(session, statement, transformer=_transform)
 
 
 @router.post("/me/invites", response_model=OrganizationInviteRead)
@@ -616,19 +619,26 @@ async def create_org_invite(
     if not email:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT)
 
-    existing_user = (
-        await session.exec(select(User).where(func.lower(col(User.email)) == email))
+    existing_user_id = (
+        await session.exec(select(User.id).where(func.lower(col(User.email)) == email))
     ).first()
-    if existing_user is not None:
+    if existing_user_id is not None:
         existing_member = await get_member(
             session,
-            user_id=existing_user.id,
+            user_id=existing_user_id,
             organization_id=ctx.organization.id,
         )
         if existing_member is not None:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT)
 
+    await _require_org_boards(
+        session,
+        organization_id=ctx.organization.id,
+        board_ids={entry.board_id for entry in payload.board_access},
+    )
+
     token = secrets.token_urlsafe(24)
+    now = utcnow()
     invite = OrganizationInvite(
         organization_id=ctx.organization.id,
         invited_email=email,
@@ -637,31 +647,17 @@ async def create_org_invite(
         all_boards_read=payload.all_boards_read,
         all_boards_write=payload.all_boards_write,
         created_by_user_id=ctx.member.user_id,
-        created_at=utcnow(),
-        updated_at=utcnow(),
+        created_at=now,
+        updated_at=now,
     )
     session.add(invite)
     await session.flush()
-
-    board_ids = {entry.board_id for entry in payload.board_access}
-    if board_ids:
-        valid_board_ids = {
-            board.id
-            for board in await Board.objects.filter_by(
-                organization_id=ctx.organization.id,
-            )
-            .filter(col(Board.id).in_(board_ids))
-            .all(session)
-        }
-        if valid_board_ids != board_ids:
-            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT)
     await apply_invite_board_access(
         session,
         invite=invite,
         entries=payload.board_access,
     )
     await session.commit()
-    await session.refresh(invite)
     return OrganizationInviteRead.model_validate(invite, from_attributes=True)
 
 
@@ -718,13 +714,18 @@ async def accept_org_invite(
     if existing is None:
         member = await accept_invite(session, invite, auth.user)
     else:
+        # Claim the invite first so a concurrent accept cannot apply its grants twice.
+        if not await mark_invite_accepted(
+            session,
+            invite=invite,
+            user_id=auth.user.id,
+            accepted_at=utcnow(),
+        ):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
         await apply_invite_to_member(session, member=existing, invite=invite)
-        invite.accepted_by_user_id = auth.user.id
-        invite.accepted_at = utcnow()
-        invite.updated_at = utcnow()
-        session.add(invite)
         await session.commit()
         member = existing
+    _invalidate_org_list(auth.user.id)
 
-    user = await User.objects.by_id(member.user_id).first(session)
-    return _member_to_read(member, user)
+    # The membership belongs to the accepting user, who is already loaded.
+    return _member_to_read(member, auth.user)
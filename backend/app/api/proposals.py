@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import col
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from pydantic import TypeAdapter
+from sqlmodel import col, select
 
 from app.api.deps import require_org_member
 from app.core.auth import AuthContext, get_auth_context
@@ -22,35 +24,47 @@ from app.schemas.proposals import (
     VotePayload,
 )
 from app.services.approval_engine import create_proposal, record_decision
-from app.services.audit import record_audit
+from app.services.audit import record_audit, record_audit_in_new_session
 from app.services.organizations import OrganizationContext
-from app.services.permission_resolver import check_resource_scope, resolve_zone_permission
+from app.services.zone_auth import resolve_zone_permission_cached
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(prefix="/organizations/me/proposals", tags=["proposals"])
 SESSION_DEP = Depends(get_session)
 AUTH_DEP = Depends(get_auth_context)
 ORG_MEMBER_DEP = Depends(require_org_member)
+_PROPOSAL_LIST_ADAPTER = TypeAdapter(list[ProposalRead])
+_PROPOSAL_READ_FIELDS = tuple(
+    name for name in ProposalRead.model_fields if name != "approval_requests"
+)
+_APPROVAL_REQUEST_READ_FIELDS = tuple(ApprovalRequestRead.model_fields)
 
 
-async def _check_zone_perm(
+async def _get_zone_or_404(
     session: AsyncSession,
-    member: object,
+    *,
     zone_id: UUID,
+    organization_id: UUID,
+) -> TrustZone:
+    zone = await session.get(TrustZone, zone_id)
+    if zone is None or zone.organization_id != organization_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Zone not found")
+    return zone
+
+
+async def _check_zone_perm(
+    session: AsyncSession,
+    ctx: OrganizationContext,
+    zone: TrustZone,
     action: str,
 ) -> None:
-    """Load zone and check permission, raising 403 on failure."""
-    from app.models.organization_members import OrganizationMember
-
-    zone = await TrustZone.objects.by_id(zone_id).first(session)
-    if zone is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Zone not found")
-    if not isinstance(member, OrganizationMember):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-    allowed = await resolve_zone_permission(
-        session, member=member, zone=zone, action=action,
+    """Check permission on an already-loaded zone, raising 403 on failure."""
+    allowed = await resolve_zone_permission_cached(
+        session, org_ctx=ctx, zone=zone, action=action,
     )
     if not allowed:
         raise HTTPException(
@@ -59,29 +73,81 @@ async def _check_zone_perm(
         )
 
 
-async def _get_proposal_or_404(
+async def _get_proposal_with_zone_or_404(
     session: AsyncSession,
     *,
     proposal_id: UUID,
     organization_id: UUID,
-) -> Proposal:
-    proposal = await Proposal.objects.by_id(proposal_id).first(session)
-    if proposal is None or proposal.organization_id != organization_id:
+) -> tuple[Proposal, TrustZone]:
+    """Load a proposal and its zone in one round trip, raising 404 when missing."""
+    statement = (
+        select(Proposal, TrustZone)
+        .join(TrustZone, col(TrustZone.id) == col(Proposal.zone_id))
+        .where(col(Proposal.id) == proposal_id)
+        .where(col(Proposal.organization_id) == organization_id)
+    )
+    row = (await session.exec(statement)).first()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-    return proposal
+    proposal, zone = row
+    return proposal, zone
+
+
+async def _get_proposal_with_requests_or_404(
+    session: AsyncSession,
+    *,
+    proposal_id: UUID,
+    organization_id: UUID,
+) -> tuple[Proposal, list[ApprovalRequest]]:
+    """Load a proposal and its approval requests in one round trip, raising 404 when missing."""
+    statement = (
+        select(Proposal, ApprovalRequest)
+        .outerjoin(
+            ApprovalRequest,
+            col(ApprovalRequest.proposal_id) == col(Proposal.id),
+        )
+        .where(col(Proposal.id) == proposal_id)
+        .where(col(Proposal.organization_id) == organization_id)
+        .order_by(col(ApprovalRequest.created_at))
+    )
+    rows = (await session.exec(statement)).all()
+    if not rows:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    requests = [request for _, request in rows if request is not None]
+    return rows[0][0], requests
+
+
+async def _approval_requests_by_proposal(
+    session: AsyncSession,
+    proposal_ids: Collection[UUID],
+) -> dict[UUID, list[ApprovalRequest]]:
+    """Load approval requests for many proposals in one query, grouped by proposal."""
+    grouped: dict[UUID, list[ApprovalRequest]] = defaultdict(list)
+    if not proposal_ids:
+        return grouped
+    requests = await ApprovalRequest.objects.filter(
+        col(ApprovalRequest.proposal_id).in_(proposal_ids),
+    ).all(session)
+    for request in requests:
+        grouped[request.proposal_id].append(request)
+    return grouped
+
+
+def _approval_request_to_read(request: ApprovalRequest) -> ApprovalRequestRead:
+    return ApprovalRequestRead.model_construct(
+        **{name: getattr(request, name) for name in _APPROVAL_REQUEST_READ_FIELDS},
+    )
 
 
 def _proposal_to_read(
     proposal: Proposal,
     approval_requests: list[ApprovalRequest] | None = None,
 ) -> ProposalRead:
-    model = ProposalRead.model_validate(proposal, from_attributes=True)
-    if approval_requests is not None:
-        model.approval_requests = [
-            ApprovalRequestRead.model_validate(r, from_attributes=True)
-            for r in approval_requests
-        ]
-    return model
+    # Values come straight from typed DB rows, so construct without validating;
+    # FastAPI serializes response-model instances as-is.
+    values: dict[str, Any] = {name: getattr(proposal, name) for name in _PROPOSAL_READ_FIELDS}
+    values["approval_requests"] = [_approval_request_to_read(r) for r in approval_requests or []]
+    return ProposalRead.model_construct(**values)
 
 
 @router.post("", response_model=ProposalRead)
@@ -95,30 +161,20 @@ async def create_proposal_endpoint(
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-    await _check_zone_perm(session, ctx.member, payload.zone_id, "proposal.create")
-
-    # Early resource scope validation for resource_allocation proposals
-    if payload.proposal_type == "resource_allocation" and payload.payload:
-        zone = await TrustZone.objects.by_id(payload.zone_id).first(session)
-        if zone is not None:
-            resource_ctx: dict[str, object] = {}
-            for key in ("budget_amount", "board_id", "agent_type"):
-                val = payload.payload.get(key)
-                if val is not None:
-                    resource_ctx[key] = val
-            if resource_ctx:
-                allowed, reason = check_resource_scope(zone, resource_ctx)
-                if not allowed:
-                    raise HTTPException(
-                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                        detail=f"Resource scope violation: {reason}",
-                    )
+    zone = await _get_zone_or_404(
+        session,
+        zone_id=payload.zone_id,
+        organization_id=ctx.organization.id,
+    )
+    await _check_zone_perm(session, ctx, zone, "proposal.create")
 
+    # create_proposal validates resource scope against the zone passed in here.
     proposal = await create_proposal(
         session,
         organization_id=ctx.organization.id,
         proposer_id=auth.user.id,
         payload=payload,
+        zone=zone,
     )
 
     await record_audit(
@@ -148,32 +204,29 @@ async def list_pending_reviews(
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-    # Find all approval requests assigned to this member that are undecided
-    undecided_requests = await ApprovalRequest.objects.filter_by(
-        reviewer_id=ctx.member.id,
+    # Pending proposals in this org where the member still has an undecided request.
+    # A semi-join keeps each proposal once without DISTINCT over its JSON columns.
+    undecided_proposal_ids = (
+        select(col(ApprovalRequest.proposal_id))
+        .where(col(ApprovalRequest.reviewer_id) == ctx.member.id)
+        .where(col(ApprovalRequest.decision).is_(None))
+    )
+    proposals = await Proposal.objects.filter_by(
+        organization_id=ctx.organization.id,
     ).filter(
-        col(ApprovalRequest.decision) == None,  # noqa: E711
-    ).all(session)
-
-    if not undecided_requests:
+        col(Proposal.status) == "pending_review",
+        col(Proposal.id).in_(undecided_proposal_ids),
+    ).order_by(col(Proposal.created_at).desc()).all(session)
+    if not proposals:
         return []
-
-    # Get the associated proposals that are pending_review and belong to the org
-    proposal_ids = {r.proposal_id for r in undecided_requests}
-    result: list[ProposalRead] = []
-    for pid in proposal_ids:
-        proposal = await Proposal.objects.by_id(pid).first(session)
-        if (
-            proposal is not None
-            and proposal.organization_id == ctx.organization.id
-            and proposal.status == "pending_review"
-        ):
-            requests = await ApprovalRequest.objects.filter_by(
-                proposal_id=proposal.id,
-            ).all(session)
-            result.append(_proposal_to_read(proposal, requests))
-
-    return result
+    requests_by_proposal = await _approval_requests_by_proposal(
+        session,
+        [proposal.id for proposal in proposals],
+    )
+    return [
+        _proposal_to_read(proposal, requests_by_proposal[proposal.id])
+        for proposal in proposals
+    ]
 
 
 @router.get("", response_model=list[ProposalRead])
@@ -190,7 +243,7 @@ async def list_proposals(
     if proposal_status is not None:
         query = query.filter(col(Proposal.status) == proposal_status)
     proposals = await query.order_by(col(Proposal.created_at).desc()).all(session)
-    return [_proposal_to_read(p) for p in proposals]
+    return _PROPOSAL_LIST_ADAPTER.validate_python(proposals, from_attributes=True)
 
 
 @router.get("/{proposal_id}", response_model=ProposalRead)
@@ -200,30 +253,35 @@ async def get_proposal(
     ctx: OrganizationContext = ORG_MEMBER_DEP,
 ) -> ProposalRead:
     """Get proposal detail with approval requests."""
-    proposal = await _get_proposal_or_404(
-        session, proposal_id=proposal_id, organization_id=ctx.organization.id
+    proposal, requests = await _get_proposal_with_requests_or_404(
+        session,
+        proposal_id=proposal_id,
+        organization_id=ctx.organization.id,
     )
-    requests = await ApprovalRequest.objects.filter_by(
-        proposal_id=proposal.id,
-    ).all(session)
     return _proposal_to_read(proposal, requests)
 
 
-@router.post("/{proposal_id}/approve", response_model=ApprovalRequestRead)
-async def approve_proposal(
+async def _cast_vote(
+    session: AsyncSession,
+    *,
+    background: BackgroundTasks,
+    auth: AuthContext,
+    ctx: OrganizationContext,
     proposal_id: UUID,
     payload: VotePayload,
-    session: AsyncSession = SESSION_DEP,
-    auth: AuthContext = AUTH_DEP,
-    ctx: OrganizationContext = ORG_MEMBER_DEP,
+    decision: str,
+    permission: str,
+    audit: bool = True,
 ) -> ApprovalRequestRead:
-    """Vote approve on a proposal."""
+    """Shared vote path: load, authorize, record the decision and commit once."""
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    proposal = await _get_proposal_or_404(
-        session, proposal_id=proposal_id, organization_id=ctx.organization.id
+    proposal, zone = await _get_proposal_with_zone_or_404(
+        session,
+        proposal_id=proposal_id,
+        organization_id=ctx.organization.id,
     )
-    await _check_zone_perm(session, ctx.member, proposal.zone_id, "proposal.approve")
+    await _check_zone_perm(session, ctx, zone, permission)
     if proposal.status != "pending_review":
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -233,87 +291,88 @@ async def approve_proposal(
         session,
         proposal=proposal,
         reviewer_id=ctx.member.id,
-        decision="approve",
+        decision=decision,
         rationale=payload.rationale,
+        commit=False,
     )
-    await record_audit(
+    # The vote and any resolution it triggers land in one commit.
+    await session.commit()
+    if audit:
+        background.add_task(
+            record_audit_in_new_session,
+            organization_id=ctx.organization.id,
+            actor_id=auth.user.id,
+            actor_type="human",
+            action=f"proposal.{decision}",
+            zone_id=proposal.zone_id,
+            target_type="proposal",
+            target_id=proposal.id,
+        )
+    return _approval_request_to_read(request)
+
+
+@router.post("/{proposal_id}/approve", response_model=ApprovalRequestRead)
+async def approve_proposal(
+    proposal_id: UUID,
+    payload: VotePayload,
+    background: BackgroundTasks,
+    session: AsyncSession = SESSION_DEP,
+    auth: AuthContext = AUTH_DEP,
+    ctx: OrganizationContext = ORG_MEMBER_DEP,
+) -> ApprovalRequestRead:
+    """Vote approve on a proposal."""
+    return await _cast_vote(
         session,
-        organization_id=ctx.organization.id,
-        actor_id=auth.user.id,
-        actor_type="human",
-        action="proposal.approve",
-        zone_id=proposal.zone_id,
-        target_type="proposal",
-        target_id=proposal.id,
+        background=background,
+        auth=auth,
+        ctx=ctx,
+        proposal_id=proposal_id,
+        payload=payload,
+        decision="approve",
+        permission="proposal.approve",
     )
-    return ApprovalRequestRead.model_validate(request, from_attributes=True)
 
 
 @router.post("/{proposal_id}/reject", response_model=ApprovalRequestRead)
 async def reject_proposal(
     proposal_id: UUID,
     payload: VotePayload,
+    background: BackgroundTasks,
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
 ) -> ApprovalRequestRead:
     """Vote reject on a proposal."""
-    if auth.user is None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    proposal = await _get_proposal_or_404(
-        session, proposal_id=proposal_id, organization_id=ctx.organization.id
-    )
-    await _check_zone_perm(session, ctx.member, proposal.zone_id, "proposal.reject")
-    if proposal.status != "pending_review":
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Proposal is not pending review",
-        )
-    request = await record_decision(
+    return await _cast_vote(
         session,
-        proposal=proposal,
-        reviewer_id=ctx.member.id,
+        background=background,
+        auth=auth,
+        ctx=ctx,
+        proposal_id=proposal_id,
+        payload=payload,
         decision="reject",
-        rationale=payload.rationale,
-    )
-    await record_audit(
-        session,
-        organization_id=ctx.organization.id,
-        actor_id=auth.user.id,
-        actor_type="human",
-        action="proposal.reject",
-        zone_id=proposal.zone_id,
-        target_type="proposal",
-        target_id=proposal.id,
+        permission="proposal.reject",
     )
-    return ApprovalRequestRead.model_validate(request, from_attributes=True)
 
 
 @router.post("/{proposal_id}/abstain", response_model=ApprovalRequestRead)
 async def abstain_proposal(
     proposal_id: UUID,
     payload: VotePayload,
+    background: BackgroundTasks,
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
 ) -> ApprovalRequestRead:
     """Vote abstain on a proposal."""
-    if auth.user is None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    proposal = await _get_proposal_or_404(
-        session, proposal_id=proposal_id, organization_id=ctx.organization.id
-    )
-    await _check_zone_perm(session, ctx.member, proposal.zone_id, "proposal.review")
-    if proposal.status != "pending_review":
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Proposal is not pending review",
-        )
-    request = await record_decision(
+    return await _cast_vote(
         session,
-        proposal=proposal,
-        reviewer_id=ctx.member.id,
+        background=background,
+        auth=auth,
+        ctx=ctx,
+        proposal_id=proposal_id,
+        payload=payload,
         decision="abstain",
-        rationale=payload.rationale,
+        permission="proposal.review",
+        audit=False,
     )
-    return ApprovalRequestRead.model_validate(request, from_attributes=True)
@@ -2,26 +2,42 @@
 
 from __future__ import annotations
 
-import ipaddress
+import asyncio
 import json
+import os
 import re
 import subprocess
+from collections.abc import Iterator
 from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, Iterator, TextIO
+from typing import TYPE_CHECKING, Any, TextIO
 from urllib.parse import unquote, urlparse
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from sqlalchemy import func, or_
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, cast, func, literal_column, or_
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import col, select
 
 from app.api.deps import require_org_admin
-from app.core.time import utcnow
+from app.core.config import settings
+from app.core.time import UtcNow, utcnow
+from app.db import crud
+from app.db.pagination import decode_keyset_cursor, encode_keyset_cursor
 from app.db.session import get_session
 from app.models.gateways import Gateway
-from app.models.skills import GatewayInstalledSkill, MarketplaceSkill, SkillPack
+from app.models.skills import (
+    MARKETPLACE_SKILL_SEARCH_COLUMNS,
+    GatewayInstalledSkill,
+    MarketplaceSkill,
+    SkillPack,
+)
 from app.schemas.common import OkResponse
 from app.schemas.skills_marketplace import (
     MarketplaceSkillActionResponse,
@@ -42,6 +58,9 @@ from app.services.openclaw.shared import GatewayAgentIdentity
 from app.services.organizations import OrganizationContext
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from sqlalchemy.sql import Select
     from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(prefix="/skills", tags=["skills"])
@@ -52,24 +71,46 @@ GATEWAY_ID_QUERY = Query(...)
 ALLOWED_PACK_SOURCE_SCHEMES = {"https"}
 GIT_CLONE_TIMEOUT_SECONDS = 30
 GIT_REV_PARSE_TIMEOUT_SECONDS = 10
+GIT_OUTPUT_LIMIT_BYTES = 16 * 1024
+# Never prompt for credentials and skip optional index locks in throwaway clones.
+GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_OPTIONAL_LOCKS": "0"}
+# Parent for temporary pack clones, e.g. a tmpfs mount; empty uses the system temp dir.
+SKILL_PACK_CLONE_DIR = settings.skill_pack_clone_dir or None
+# The canonical https://github.com/<owner>/<repo>[.git][/] form, accepted without urlparse.
+_GITHUB_PACK_URL_RE = re.compile(r"^https://github\.com/[^/?#\s]+/[^/?#\s]+?(?:\.git)?/?$")
+# Discovery only reads the root index and SKILL.md files; skip every other blob.
+PACK_SPARSE_CHECKOUT_PATTERNS = ("/skills_index.json", "SKILL.md")
+# (repo URL, branch) -> (tip commit, discovered skills, warnings) from the last clone.
+_PACK_SKILLS_CACHE_MAX_ENTRIES = 128
+_pack_skills_cache: dict[tuple[str, str], tuple[str, list[PackSkillCandidate], list[str]]] = {}
+# Bounds concurrent pack clones (and their temp checkouts) across requests.
+GIT_CLONE_CONCURRENCY = 4
+_GIT_CLONE_SEMAPHORE = asyncio.Semaphore(GIT_CLONE_CONCURRENCY)
+# Rows per multi-VALUES upsert during pack sync; keeps bind parameters well under
+# both the Postgres and SQLite limits.
+PACK_SYNC_UPSERT_BATCH_SIZE = 500
+# Rows fetched per round of an unlimited marketplace listing, which is streamed to the
+# client instead of being materialized.
+MARKETPLACE_STREAM_BATCH_SIZE = 50
 BRANCH_NAME_ALLOWED_RE = r"^[A-Za-z0-9._/\-]+$"
-SKILLS_INDEX_READ_CHUNK_BYTES = 16 * 1024
+SKILLS_INDEX_READ_CHUNK_BYTES = settings.skills_index_read_chunk_bytes
+# fullmatch() also rejects a trailing newline, which `$` alone would let through.
+_BRANCH_NAME_RE = re.compile(BRANCH_NAME_ALLOWED_RE)
 
 
+@lru_cache(maxsize=256)
 def _normalize_pack_branch(raw_branch: str | None) -> str:
     if not raw_branch:
         return "main"
     normalized = raw_branch.strip()
-    if not normalized:
+    if not normalized or normalized == "main":
         return "main"
-    if any(ch in normalized for ch in {"\n", "\r", "\t"}):
-        return "main"
-    if not re.match(BRANCH_NAME_ALLOWED_RE, normalized):
+    if _BRANCH_NAME_RE.fullmatch(normalized) is None:
         return "main"
     return normalized
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackSkillCandidate:
     """Single skill discovered in a pack repository."""
 
@@ -82,6 +123,7 @@ class PackSkillCandidate:
     metadata: dict[str, object] | None = None
 
 
+@lru_cache(maxsize=256)
 def _skills_install_dir(workspace_root: str) -> str:
     normalized = workspace_root.rstrip("/\\")
     if not normalized:
@@ -99,61 +141,54 @@ def _infer_skill_name(source_url: str) -> str:
     return "Skill"
 
 
-def _infer_skill_description(skill_file: Path) -> str | None:
-    try:
-        content = skill_file.read_text(encoding="utf-8", errors="ignore")
-    except OSError:
-        return None
-
-    lines = [line.strip() for line in content.splitlines()]
-    if not lines:
-        return None
-
-    in_frontmatter = False
-    for line in lines:
-        if line == "---":
-            in_frontmatter = not in_frontmatter
-            continue
-        if in_frontmatter:
-            if line.lower().startswith("description:"):
-                value = line.split(":", maxsplit=1)[-1].strip().strip("\"'")
-                return value or None
-            continue
-        if not line or line.startswith("#"):
-            continue
-        return line
+def _frontmatter_value(line: str) -> str:
+    return line.split(":", maxsplit=1)[-1].strip().strip("\"'")
 
-    return None
 
+def _parse_skill_header(skill_file: Path, fallback: str) -> tuple[str, str | None]:
+    """Return `(display_name, description)` from one read of a SKILL.md file.
 
-def _infer_skill_display_name(skill_file: Path, fallback: str) -> str:
+    The name is the first non-empty frontmatter `name:`, then the first heading, then
+    the fallback. The description is the frontmatter `description:` or the first body
+    line, whichever comes first.
+    """
     try:
         content = skill_file.read_text(encoding="utf-8", errors="ignore")
     except OSError:
         content = ""
 
+    frontmatter_name: str | None = None
+    heading: str | None = None
+    description: str | None = None
+    description_found = False
     in_frontmatter = False
     for raw_line in content.splitlines():
         line = raw_line.strip()
         if line == "---":
             in_frontmatter = not in_frontmatter
             continue
-        if in_frontmatter and line.lower().startswith("name:"):
-            value = line.split(":", maxsplit=1)[-1].strip().strip("\"'")
-            if value:
-                return value
-
-    for raw_line in content.splitlines():
-        line = raw_line.strip()
-        if line.startswith("#"):
-            heading = line.lstrip("#").strip()
-            if heading:
-                return heading
-
-    normalized_fallback = fallback.replace("-", " ").replace("_", " ").strip()
-    return normalized_fallback or "Skill"
-
-
+        if in_frontmatter:
+            lowered = line.lower()
+            if frontmatter_name is None and lowered.startswith("name:"):
+                frontmatter_name = _frontmatter_value(line) or None
+            elif not description_found and lowered.startswith("description:"):
+                description = _frontmatter_value(line) or None
+                description_found = True
+        elif not description_found and line and not line.startswith("#"):
+            description = line
+            description_found = True
+        if heading is None and line.startswith("#"):
+            heading = line.lstrip("#").strip() or None
+        if frontmatter_name is not None and description_found:
+            break
+
+    name = frontmatter_name or heading
+    if name is None:
+        name = fallback.replace("-", " ").replace("_", " ").strip() or "Skill"
+    return name, description
+
+
+@lru_cache(maxsize=1024)
 def _normalize_repo_source_url(source_url: str) -> str:
     normalized = source_url.strip().rstrip("/")
     if normalized.endswith(".git"):
@@ -171,11 +206,12 @@ def _validate_pack_source_url(source_url: str) -> None:
 
     The current implementation is intentionally conservative:
     - allow only https URLs
-    - block localhost
-    - block literal private/loopback/link-local IPs
+    - allow only github.com, which also rules out localhost and literal IP hosts
 
     Note: DNS-based private resolution is not checked here.
     """
+    if _GITHUB_PACK_URL_RE.match(source_url):
+        return
 
     parsed = urlparse(source_url)
     scheme = (parsed.scheme or "").lower()
@@ -200,14 +236,6 @@ def _validate_pack_source_url(source_url: str) -> None:
             "Pack source URL must be a GitHub repository URL (https://github.com/<owner>/<repo>)"
         )
 
-    try:
-        ip = ipaddress.ip_address(host)
-    except ValueError:
-        return
-
-    if ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved or ip.is_multicast:
-        raise ValueError("Pack source URL hostname is not allowed")
-
 
 def _to_tree_source_url(repo_source_url: str, branch: str, rel_path: str) -> str:
     repo_url = _normalize_repo_source_url(repo_source_url)
@@ -218,29 +246,6 @@ def _to_tree_source_url(repo_source_url: str, branch: str, rel_path: str) -> str
     return f"{repo_url}/tree/{safe_branch}/{rel}"
 
 
-def _repo_base_from_tree_source_url(source_url: str) -> str | None:
-    parsed = urlparse(source_url)
-    marker = "/tree/"
-    marker_index = parsed.path.find(marker)
-    if marker_index <= 0:
-        return None
-
-    repo_path = parsed.path[:marker_index]
-    if not repo_path:
-        return None
-    return _normalize_repo_source_url(f"{parsed.scheme}://{parsed.netloc}{repo_path}")
-
-
-def _build_skill_count_by_repo(skills: list[MarketplaceSkill]) -> dict[str, int]:
-    counts: dict[str, int] = {}
-    for skill in skills:
-        repo_base = _repo_base_from_tree_source_url(skill.source_url)
-        if repo_base is None:
-            continue
-        counts[repo_base] = counts.get(repo_base, 0) + 1
-    return counts
-
-
 def _normalize_repo_path(path_value: str) -> str:
     cleaned = path_value.strip().replace("\\", "/")
     while cleaned.startswith("./"):
@@ -256,37 +261,40 @@ def _normalize_repo_path(path_value: str) -> str:
     return cleaned
 
 
-def _coerce_index_entries(payload: object) -> list[dict[str, object]]:
-    if isinstance(payload, list):
-        return [entry for entry in payload if isinstance(entry, dict)]
-
+def _coerce_index_entries(payload: object) -> Iterator[dict[str, object]]:
     if isinstance(payload, dict):
-        entries = payload.get("skills")
-        if isinstance(entries, list):
-            return [entry for entry in entries if isinstance(entry, dict)]
-
-    return []
+        payload = payload.get("skills")
+    if isinstance(payload, (list, Iterator)):
+        for entry in payload:
+            if isinstance(entry, dict):
+                yield entry
 
 
 class _StreamingJSONReader:
     """Incrementally decode JSON content from a file object."""
 
-    def __init__(self, file_obj: TextIO):
+    def __init__(self, file_obj: TextIO, *, chunk_bytes: int = SKILLS_INDEX_READ_CHUNK_BYTES):
         self._file_obj = file_obj
+        self._chunk_bytes = chunk_bytes
         self._buffer = ""
         self._position = 0
         self._eof = False
         self._decoder = json.JSONDecoder()
 
-    def _fill_buffer(self) -> None:
+    def _fill_buffer(self, size: int | None = None) -> None:
         if self._eof:
             return
 
-        chunk = self._file_obj.read(SKILLS_INDEX_READ_CHUNK_BYTES)
+        chunk = self._file_obj.read(size or self._chunk_bytes)
         if not chunk:
             self._eof = True
             return
-        self._buffer += chunk
+        if self._position:
+            # Drop already-decoded text so the buffer holds only the unread window.
+            self._buffer = self._buffer[self._position :] + chunk
+            self._position = 0
+        else:
+            self._buffer += chunk
 
     def _peek(self) -> str | None:
         self._skip_whitespace()
@@ -319,7 +327,10 @@ class _StreamingJSONReader:
             except json.JSONDecodeError:
                 if self._eof:
                     raise RuntimeError("skills_index.json is not valid JSON")
-                self._fill_buffer()
+                # Double the unread window on each retry so a value spanning many
+                # chunks is re-decoded O(log n) times rather than once per chunk.
+                unread = len(self._buffer) - self._position
+                self._fill_buffer(max(self._chunk_bytes, unread))
                 self._skip_whitespace()
                 if self._position >= len(self._buffer):
                     if self._eof:
@@ -338,7 +349,7 @@ class _StreamingJSONReader:
             raise RuntimeError("skills_index.json is not valid JSON")
         self._position += 1
 
-    def read_top_level_entries(self) -> list[dict[str, object]]:
+    def read_top_level_entries(self) -> Iterator[dict[str, object]]:
         self._fill_buffer()
         self._skip_whitespace()
         first = self._peek()
@@ -347,10 +358,10 @@ class _StreamingJSONReader:
 
         if first == "[":
             self._position += 1
-            return list(self._read_array_values())
+            return self._read_array_values()
         if first == "{":
             self._position += 1
-            return list(self._read_skills_from_object())
+            return self._read_skills_from_object()
         raise RuntimeError("skills_index.json is not valid JSON")
 
     def _read_array_values(self) -> Iterator[dict[str, object]]:
@@ -431,6 +442,90 @@ class _StreamingJSONReader:
                 return
 
 
+def _pack_skill_from_index_entry(
+    entry: dict[str, object],
+    *,
+    source_url: str,
+    branch: str,
+) -> PackSkillCandidate | None:
+    indexed_path = entry.get("path")
+    has_indexed_path = False
+    rel_path = ""
+    resolved_skill_path: str | None = None
+    if isinstance(indexed_path, str) and indexed_path.strip():
+        has_indexed_path = True
+        rel_path = _normalize_repo_path(indexed_path)
+        resolved_skill_path = rel_path or None
+
+    indexed_source = entry.get("source_url")
+    candidate_source_url: str | None = None
+    resolved_metadata: dict[str, object] = {
+        "discovery_mode": "skills_index",
+        "pack_branch": branch,
+    }
+    if isinstance(indexed_source, str) and indexed_source.strip():
+        source_candidate = indexed_source.strip()
+        resolved_metadata["source_url"] = source_candidate
+        if source_candidate.startswith(("https://", "http://")):
+            parsed = urlparse(source_candidate)
+            if parsed.path:
+                marker = "/tree/"
+                marker_index = parsed.path.find(marker)
+                if marker_index > 0:
+                    tree_suffix = parsed.path[marker_index + len(marker) :]
+                    slash_index = tree_suffix.find("/")
+                    candidate_path = tree_suffix[slash_index + 1 :] if slash_index >= 0 else ""
+                    resolved_skill_path = _normalize_repo_path(candidate_path)
+            candidate_source_url = source_candidate
+        else:
+            indexed_rel = _normalize_repo_path(source_candidate)
+            resolved_skill_path = resolved_skill_path or indexed_rel
+            resolved_metadata["resolved_path"] = indexed_rel
+            if indexed_rel:
+                candidate_source_url = _to_tree_source_url(source_url, branch, indexed_rel)
+    elif has_indexed_path:
+        resolved_metadata["resolved_path"] = rel_path
+        candidate_source_url = _to_tree_source_url(source_url, branch, rel_path)
+        if rel_path:
+            resolved_skill_path = rel_path
+
+    if not candidate_source_url:
+        return None
+
+    indexed_name = entry.get("name")
+    if isinstance(indexed_name, str) and indexed_name.strip():
+        name = indexed_name.strip()
+    else:
+        fallback = Path(rel_path).name if rel_path else "Skill"
+        name = _infer_skill_name(fallback)
+
+    indexed_description = entry.get("description")
+    description = (
+        indexed_description.strip()
+        if isinstance(indexed_description, str) and indexed_description.strip()
+        else None
+    )
+    indexed_category = entry.get("category")
+    category = (
+        indexed_category.strip()
+        if isinstance(indexed_category, str) and indexed_category.strip()
+        else None
+    )
+    indexed_risk = entry.get("risk")
+    risk = indexed_risk.strip() if isinstance(indexed_risk, str) and indexed_risk.strip() else None
+    source_label = resolved_skill_path
+
+    return PackSkillCandidate(
+        name=name,
+        description=description,
+        source_url=candidate_source_url,
+        category=category,
+        risk=risk,
+        source=source_label,
+        metadata=resolved_metadata,
+    )
+
+
 def _collect_pack_skills_from_index(
     *,
     repo_dir: Path,
@@ -442,9 +537,19 @@ def _collect_pack_skills_from_index(
     if not index_file.is_file():
         return None
 
+    # Entries are consumed as they are decoded; the index is never held as a list.
+    found: dict[str, PackSkillCandidate] = {}
     try:
         with index_file.open(encoding="utf-8") as fp:
-            payload = _StreamingJSONReader(fp).read_top_level_entries()
+            entries = _StreamingJSONReader(fp).read_top_level_entries()
+            for entry in _coerce_index_entries(entries):
+                candidate = _pack_skill_from_index_entry(
+                    entry,
+                    source_url=source_url,
+                    branch=branch,
+                )
+                if candidate is not None:
+                    found[candidate.source_url] = candidate
     except OSError as exc:
         raise RuntimeError("unable to read skills_index.json") from exc
     except RuntimeError as exc:
@@ -452,88 +557,27 @@ def _collect_pack_skills_from_index(
             discovery_warnings.append(f"Failed to parse skills_index.json: {exc}")
         return None
 
-    found: dict[str, PackSkillCandidate] = {}
-    for entry in _coerce_index_entries(payload):
-        indexed_path = entry.get("path")
-        has_indexed_path = False
-        rel_path = ""
-        resolved_skill_path: str | None = None
-        if isinstance(indexed_path, str) and indexed_path.strip():
-            has_indexed_path = True
-            rel_path = _normalize_repo_path(indexed_path)
-            resolved_skill_path = rel_path or None
-
-        indexed_source = entry.get("source_url")
-        candidate_source_url: str | None = None
-        resolved_metadata: dict[str, object] = {
-            "discovery_mode": "skills_index",
-            "pack_branch": branch,
-        }
-        if isinstance(indexed_source, str) and indexed_source.strip():
-            source_candidate = indexed_source.strip()
-            resolved_metadata["source_url"] = source_candidate
-            if source_candidate.startswith(("https://", "http://")):
-                parsed = urlparse(source_candidate)
-                if parsed.path:
-                    marker = "/tree/"
-                    marker_index = parsed.path.find(marker)
-                    if marker_index > 0:
-                        tree_suffix = parsed.path[marker_index + len(marker) :]
-                        slash_index = tree_suffix.find("/")
-                        candidate_path = tree_suffix[slash_index + 1 :] if slash_index >= 0 else ""
-                        resolved_skill_path = _normalize_repo_path(candidate_path)
-                candidate_source_url = source_candidate
-            else:
-                indexed_rel = _normalize_repo_path(source_candidate)
-                resolved_skill_path = resolved_skill_path or indexed_rel
-                resolved_metadata["resolved_path"] = indexed_rel
-                if indexed_rel:
-                    candidate_source_url = _to_tree_source_url(source_url, branch, indexed_rel)
-        elif has_indexed_path:
-            resolved_metadata["resolved_path"] = rel_path
-            candidate_source_url = _to_tree_source_url(source_url, branch, rel_path)
-            if rel_path:
-                resolved_skill_path = rel_path
-
-        if not candidate_source_url:
-            continue
-
-        indexed_name = entry.get("name")
-        if isinstance(indexed_name, str) and indexed_name.strip():
-            name = indexed_name.strip()
-        else:
-            fallback = Path(rel_path).name if rel_path else "Skill"
-            name = _infer_skill_name(fallback)
-
-        indexed_description = entry.get("description")
-        description = (
-            indexed_description.strip()
-            if isinstance(indexed_description, str) and indexed_description.strip()
-            else None
-        )
-        indexed_category = entry.get("category")
-        category = (
-            indexed_category.strip()
-            if isinstance(indexed_category, str) and indexed_category.strip()
-            else None
-        )
-        indexed_risk = entry.get("risk")
-        risk = (
-            indexed_risk.strip() if isinstance(indexed_risk, str) and indexed_risk.strip() else None
-        )
-        source_label = resolved_skill_path
+    return list(found.values())
 
-        found[candidate_source_url] = PackSkillCandidate(
-            name=name,
-            description=description,
-            source_url=candidate_source_url,
-            category=category,
-            risk=risk,
-            source=source_label,
-            metadata=resolved_metadata,
-        )
 
-    return list(found.values())
+def _find_skill_md_files(repo_dir: Path) -> list[Path]:
+    """Return sorted `SKILL.md` paths, pruning hidden directories like `.git` unvisited."""
+    found: list[Path] = []
+    pending = [repo_dir]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.name == "SKILL.md":
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    return sorted(found)
 
 
 def _collect_pack_skills_from_repo(
@@ -553,17 +597,11 @@ def _collect_pack_skills_from_repo(
         return indexed
 
     found: dict[str, PackSkillCandidate] = {}
-    for skill_file in sorted(repo_dir.rglob("SKILL.md")):
-        rel_file_parts = skill_file.relative_to(repo_dir).parts
-        # Skip hidden folders like .git, .github, etc.
-        if any(part.startswith(".") for part in rel_file_parts):
-            continue
-
+    for skill_file in _find_skill_md_files(repo_dir):
         skill_dir = skill_file.parent
         rel_dir = "" if skill_dir == repo_dir else skill_dir.relative_to(repo_dir).as_posix()
         fallback_name = _infer_skill_name(source_url) if skill_dir == repo_dir else skill_dir.name
-        name = _infer_skill_display_name(skill_file, fallback=fallback_name)
-        description = _infer_skill_description(skill_file)
+        name, description = _parse_skill_header(skill_file, fallback=fallback_name)
         tree_url = _to_tree_source_url(source_url, branch, rel_dir)
         found[tree_url] = PackSkillCandidate(
             name=name,
@@ -582,19 +620,146 @@ def _collect_pack_skills_from_repo(
     return []
 
 
-def _collect_pack_skills(
+async def _read_capped(stream: asyncio.StreamReader | None) -> bytes:
+    """Drain a pipe to EOF, keeping only the first `GIT_OUTPUT_LIMIT_BYTES`."""
+    if stream is None:
+        return b""
+    kept = bytearray()
+    while chunk := await stream.read(64 * 1024):
+        if len(kept) < GIT_OUTPUT_LIMIT_BYTES:
+            kept.extend(chunk[: GIT_OUTPUT_LIMIT_BYTES - len(kept)])
+    return bytes(kept)
+
+
+async def _run_git(*args: str, timeout: float) -> str:
+    """Run git without blocking the event loop, raising like `subprocess.run(check=True)`."""
+    command = ["git", *args]
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=GIT_ENV,
+    )
+
+    async def _communicate() -> tuple[bytes, bytes]:
+        # Clone progress on stderr can run long; we only ever report its first line.
+        stdout, stderr = await asyncio.gather(
+            _read_capped(process.stdout),
+            _read_capped(process.stderr),
+        )
+        await process.wait()
+        return stdout, stderr
+
+    try:
+        stdout, stderr = await asyncio.wait_for(_communicate(), timeout=timeout)
+    except BaseException as exc:
+        # Timeouts and cancellation alike must not leave git writing into a clone
+        # directory that is about to be removed.
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        if isinstance(exc, TimeoutError):
+            raise subprocess.TimeoutExpired(command, timeout) from exc
+        raise
+    output = stdout.decode("utf-8", errors="ignore")
+    if process.returncode:
+        raise subprocess.CalledProcessError(
+            process.returncode,
+            command,
+            output=output,
+            stderr=stderr.decode("utf-8", errors="ignore"),
+        )
+    return output
+
+
+def _cached_pack_skills(
+    cache_key: tuple[str, str],
+    remote_sha: str | None,
+) -> tuple[list[PackSkillCandidate], list[str]] | None:
+    entry = _pack_skills_cache.get(cache_key)
+    if entry is None or remote_sha is None or entry[0] != remote_sha:
+        return None
+    return list(entry[1]), list(entry[2])
+
+
+def _store_pack_skills(
+    cache_key: tuple[str, str],
+    head_sha: str,
+    skills: list[PackSkillCandidate],
+    warnings: list[str],
+) -> None:
+    _pack_skills_cache.pop(cache_key, None)
+    while len(_pack_skills_cache) >= _PACK_SKILLS_CACHE_MAX_ENTRIES:
+        _pack_skills_cache.pop(next(iter(_pack_skills_cache)))
+    _pack_skills_cache[cache_key] = (head_sha, list(skills), list(warnings))
+
+
+def _invalidate_pack_skills_cache(source_url: str) -> None:
+    """Drop cached discovery results for every branch of a pack repository."""
+    repo_url = _normalize_repo_source_url(source_url)
+    for key in [key for key in _pack_skills_cache if key[0] == repo_url]:
+        del _pack_skills_cache[key]
+
+
+async def _remote_branch_sha(source_url: str, branch: str) -> str | None:
+    try:
+        output = await _run_git(
+            "ls-remote",
+            source_url,
+            f"refs/heads/{branch}",
+            timeout=GIT_REV_PARSE_TIMEOUT_SECONDS,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+        return None
+    fields = output.split()
+    return fields[0] if fields else None
+
+
+async def _clone_pack_repo(*, source_url: str, repo_dir: Path, branch: str | None) -> None:
+    """Shallow, blobless clone that checks out only the files skill discovery reads."""
+    branch_args = ("--single-branch", "--branch", branch) if branch else ()
+    await _run_git(
+        "clone",
+        "--depth",
+        "1",
+        *branch_args,
+        "--filter=blob:none",
+        "--no-checkout",
+        source_url,
+        str(repo_dir),
+        timeout=GIT_CLONE_TIMEOUT_SECONDS,
+    )
+    try:
+        await _run_git(
+            "-C",
+            str(repo_dir),
+            "sparse-checkout",
+            "set",
+            "--no-cone",
+            *PACK_SPARSE_CHECKOUT_PATTERNS,
+            timeout=GIT_REV_PARSE_TIMEOUT_SECONDS,
+        )
+    except subprocess.CalledProcessError:
+        # Git without non-cone sparse checkout still works; it just checks out everything.
+        pass
+    await _run_git("-C", str(repo_dir), "checkout", timeout=GIT_CLONE_TIMEOUT_SECONDS)
+
+
+async def _collect_pack_skills(
     *,
     source_url: str,
     branch: str = "main",
 ) -> list[PackSkillCandidate]:
     """Clone a pack repository and collect skills from index or `skills/**/SKILL.md`."""
-    return _collect_pack_skills_with_warnings(
-        source_url=source_url,
-        branch=branch,
+    return (
+        await _collect_pack_skills_with_warnings(
+            source_url=source_url,
+            branch=branch,
+        )
     )[0]
 
 
-def _collect_pack_skills_with_warnings(
+async def _collect_pack_skills_with_warnings(
     *,
     source_url: str,
     branch: str,
@@ -606,79 +771,100 @@ def _collect_pack_skills_with_warnings(
     requested_branch = _normalize_pack_branch(branch)
     discovery_warnings: list[str] = []
 
-    with TemporaryDirectory(prefix="skill-pack-sync-") as tmp_dir:
-        repo_dir = Path(tmp_dir)
-        used_branch = requested_branch
+    # An unchanged branch tip means an unchanged tree: one ls-remote instead of a clone.
+    cache_key = (_normalize_repo_source_url(source_url), requested_branch)
+    if cache_key in _pack_skills_cache:
+        cached = _cached_pack_skills(
+            cache_key,
+            await _remote_branch_sha(source_url, requested_branch),
+        )
+        if cached is not None:
+            return cached
+
+    async with _GIT_CLONE_SEMAPHORE:
         try:
-            subprocess.run(
-                [
-                    "git",
-                    "clone",
-                    "--depth",
-                    "1",
-                    "--single-branch",
-                    "--branch",
-                    requested_branch,
-                    source_url,
-                    str(repo_dir),
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=GIT_CLONE_TIMEOUT_SECONDS,
-            )
-        except FileNotFoundError as exc:
-            raise RuntimeError("git binary not available on the server") from exc
-        except subprocess.TimeoutExpired as exc:
-            raise RuntimeError("timed out cloning pack repository") from exc
-        except subprocess.CalledProcessError as exc:
-            if requested_branch != "main":
-                try:
-                    subprocess.run(
-                        ["git", "clone", "--depth", "1", source_url, str(repo_dir)],
-                        check=True,
-                        capture_output=True,
-                        text=True,
-                        timeout=GIT_CLONE_TIMEOUT_SECONDS,
-                    )
-                    used_branch = "main"
-                except (
-                    FileNotFoundError,
-                    subprocess.TimeoutExpired,
-                    subprocess.CalledProcessError,
-                ):
+            clone_dir = TemporaryDirectory(prefix="skill-pack-sync-", dir=SKILL_PACK_CLONE_DIR)
+        except OSError as exc:
+            # A missing or unwritable SKILL_PACK_CLONE_DIR is a server-side clone failure.
+            raise RuntimeError("pack clone directory is not available on the server") from exc
+        with clone_dir as tmp_dir:
+            repo_dir = Path(tmp_dir)
+            used_branch = requested_branch
+            try:
+                await _clone_pack_repo(
+                    source_url=source_url,
+                    repo_dir=repo_dir,
+                    branch=requested_branch,
+                )
+            except FileNotFoundError as exc:
+                raise RuntimeError("git binary not available on the server") from exc
+            except subprocess.TimeoutExpired as exc:
+                raise RuntimeError("timed out cloning pack repository") from exc
+            except subprocess.CalledProcessError as exc:
+                if requested_branch != "main":
+                    try:
+                        await _clone_pack_repo(
+                            source_url=source_url,
+                            repo_dir=repo_dir,
+                            branch=None,
+                        )
+                        used_branch = "main"
+                    except (
+                        FileNotFoundError,
+                        subprocess.TimeoutExpired,
+                        subprocess.CalledProcessError,
+                    ):
+                        stderr = (exc.stderr or "").strip()
+                        detail = "unable to clone pack repository"
+                        if stderr:
+                            detail = f"{detail}: {stderr.splitlines()[0][:200]}"
+                        raise RuntimeError(detail) from exc
+                else:
                     stderr = (exc.stderr or "").strip()
                     detail = "unable to clone pack repository"
                     if stderr:
                         detail = f"{detail}: {stderr.splitlines()[0][:200]}"
                     raise RuntimeError(detail) from exc
-            else:
-                stderr = (exc.stderr or "").strip()
-                detail = "unable to clone pack repository"
-                if stderr:
-                    detail = f"{detail}: {stderr.splitlines()[0][:200]}"
-                raise RuntimeError(detail) from exc
 
-        try:
-            discovered_branch = subprocess.run(
-                ["git", "-C", str(repo_dir), "rev-parse", "--abbrev-ref", "HEAD"],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=GIT_REV_PARSE_TIMEOUT_SECONDS,
-            ).stdout.strip()
-        except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
-            discovered_branch = used_branch or "main"
-
-        return (
-            _collect_pack_skills_from_repo(
+            try:
+                discovered_branch = (
+                    await _run_git(
+                        "-C",
+                        str(repo_dir),
+                        "rev-parse",
+                        "--abbrev-ref",
+                        "HEAD",
+                        timeout=GIT_REV_PARSE_TIMEOUT_SECONDS,
+                    )
+                ).strip()
+            except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+                discovered_branch = used_branch or "main"
+
+            try:
+                head_sha: str | None = (
+                    await _run_git(
+                        "-C",
+                        str(repo_dir),
+                        "rev-parse",
+                        "HEAD",
+                        timeout=GIT_REV_PARSE_TIMEOUT_SECONDS,
+                    )
+                ).strip()
+            except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+                head_sha = None
+
+            # The walk and index parse are blocking file I/O; keep them off the event loop.
+            skills = await asyncio.to_thread(
+                _collect_pack_skills_from_repo,
                 repo_dir=repo_dir,
                 source_url=source_url,
                 branch=_normalize_pack_branch(discovered_branch),
                 discovery_warnings=discovery_warnings,
-            ),
-            discovery_warnings,
-        )
+            )
+
+    if head_sha and used_branch == requested_branch:
+        _store_pack_skills(cache_key, head_sha, skills, discovery_warnings)
+    return skills, discovery_warnings
 
 
 def _install_instruction(*, skill: MarketplaceSkill, gateway: Gateway) -> str:
@@ -710,6 +896,24 @@ def _uninstall_instruction(*, skill: MarketplaceSkill, gateway: Gateway) -> str:
     )
 
 
+async def _stream_cards(
+    session: AsyncSession,
+    statement: Select[Any],
+) -> AsyncIterator[bytes]:
+    # The JSON array is framed by hand so only one `yield_per` batch of rows and cards is
+    # alive at a time, however large the catalog is.
+    result = await session.stream(
+        statement.execution_options(yield_per=MARKETPLACE_STREAM_BATCH_SIZE),
+    )
+    separator = b"["
+    async for partition in result.partitions():
+        for skill, installation in partition:
+            card = _as_card(skill=skill, installation=installation)
+            yield separator + card.model_dump_json(by_alias=True).encode()
+            separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
 def _as_card(
     *,
     skill: MarketplaceSkill,
@@ -736,6 +940,22 @@ def _as_card(
     )
 
 
+def _as_marketplace_skill_read(skill: MarketplaceSkill) -> MarketplaceSkillRead:
+    return MarketplaceSkillRead(
+        id=skill.id,
+        organization_id=skill.organization_id,
+        name=skill.name,
+        description=skill.description,
+        category=skill.category,
+        risk=skill.risk,
+        source=skill.source,
+        source_url=skill.source_url,
+        metadata_=skill.metadata_ or {},
+        created_at=skill.created_at,
+        updated_at=skill.updated_at,
+    )
+
+
 def _as_skill_pack_read(pack: SkillPack) -> SkillPackRead:
     return SkillPackRead(
         id=pack.id,
@@ -751,11 +971,6 @@ def _as_skill_pack_read(pack: SkillPack) -> SkillPackRead:
     )
 
 
-def _pack_skill_count(*, pack: SkillPack, count_by_repo: dict[str, int]) -> int:
-    repo_base = _normalize_repo_source_url(pack.source_url)
-    return count_by_repo.get(repo_base, 0)
-
-
 async def _require_gateway_for_org(
     *,
     gateway_id: UUID,
@@ -786,6 +1001,39 @@ async def _require_marketplace_skill_for_org(
     return skill
 
 
+async def _require_gateway_and_skill_for_org(
+    *,
+    gateway_id: UUID,
+    skill_id: UUID,
+    session: AsyncSession,
+    ctx: OrganizationContext,
+) -> tuple[Gateway, MarketplaceSkill]:
+    statement = (
+        select(Gateway, MarketplaceSkill)
+        .join(
+            MarketplaceSkill,
+            col(MarketplaceSkill.organization_id) == col(Gateway.organization_id),
+        )
+        .where(
+            col(Gateway.id) == gateway_id,
+            col(Gateway.organization_id) == ctx.organization.id,
+            col(MarketplaceSkill.id) == skill_id,
+        )
+    )
+    row = (await session.exec(statement)).first()
+    if row is None:
+        # Miss path only: the single lookups report which of the two is missing.
+        gateway = await _require_gateway_for_org(gateway_id=gateway_id, session=session, ctx=ctx)
+        skill = await _require_marketplace_skill_for_org(
+            skill_id=skill_id,
+            session=session,
+            ctx=ctx,
+        )
+        return gateway, skill
+    gateway, skill = row
+    return gateway, skill
+
+
 async def _require_skill_pack_for_org(
     *,
     pack_id: UUID,
@@ -819,25 +1067,156 @@ async def _dispatch_gateway_instruction(
     )
 
 
-async def _load_pack_skill_count_by_repo(
+async def _load_pack_skill_counts(
     *,
     session: AsyncSession,
     organization_id: UUID,
-) -> dict[str, int]:
-    skills = await MarketplaceSkill.objects.filter_by(organization_id=organization_id).all(session)
-    return _build_skill_count_by_repo(skills)
+    pack_id: UUID | None = None,
+) -> dict[UUID, int]:
+    # Synced rows carry their pack link, so the database does the counting on the
+    # (organization_id, pack_id) index.
+    statement = (
+        select(col(MarketplaceSkill.pack_id), func.count())
+        .where(
+            col(MarketplaceSkill.organization_id) == organization_id,
+            col(MarketplaceSkill.pack_id).is_not(None),
+        )
+        .group_by(col(MarketplaceSkill.pack_id))
+    )
+    if pack_id is not None:
+        statement = statement.where(col(MarketplaceSkill.pack_id) == pack_id)
+    return {
+        linked_pack_id: count
+        for linked_pack_id, count in await session.exec(statement)
+        if linked_pack_id is not None
+    }
 
 
 def _as_skill_pack_read_with_count(
     *,
     pack: SkillPack,
-    count_by_repo: dict[str, int],
+    count_by_pack: dict[UUID, int],
 ) -> SkillPackRead:
     return _as_skill_pack_read(pack).model_copy(
-        update={"skill_count": _pack_skill_count(pack=pack, count_by_repo=count_by_repo)},
+        update={"skill_count": count_by_pack.get(pack.id, 0)},
     )
 
 
+def _dialect_insert(session: AsyncSession) -> Callable[..., Any]:
+    # SQLite is only used by the test suite and shares the ON CONFLICT syntax.
+    return sqlite_insert if session.get_bind().dialect.name == "sqlite" else postgresql_insert
+
+
+async def _upsert_pack_skills(
+    *,
+    session: AsyncSession,
+    organization_id: UUID,
+    pack_id: UUID,
+    candidates: list[PackSkillCandidate],
+) -> tuple[int, int]:
+    """Upsert pack candidates and return `(created, updated)` row counts.
+
+    The conflict branch only fires when a synced field actually differs, so unchanged
+    skills are neither rewritten nor counted.
+    """
+    if not candidates:
+        return 0, 0
+    # New rows keep discovery order under the created_at DESC listing: each candidate is
+    # stamped one microsecond after the previous one, as per-row utcnow() calls used to.
+    now = utcnow()
+    rows = [
+        {
+            "id": uuid4(),
+            "organization_id": organization_id,
+            "source_url": candidate.source_url,
+            "pack_id": pack_id,
+            "name": candidate.name,
+            "description": candidate.description,
+            "category": candidate.category,
+            "risk": candidate.risk,
+            "source": candidate.source,
+            "metadata_": candidate.metadata or {},
+            "created_at": now + timedelta(microseconds=index),
+            "updated_at": now + timedelta(microseconds=index),
+        }
+        for index, candidate in enumerate(candidates)
+    ]
+    insert = _dialect_insert(session)
+    is_postgres = session.get_bind().dialect.name == "postgresql"
+    created = 0
+    updated = 0
+    for start in range(0, len(rows), PACK_SYNC_UPSERT_BATCH_SIZE):
+        batch = rows[start : start + PACK_SYNC_UPSERT_BATCH_SIZE]
+        existing_urls: set[str] = set()
+        if not is_postgres:
+            # SQLite has no xmax, so the test database tells inserts apart up front.
+            existing_urls = set(
+                await session.exec(
+                    select(col(MarketplaceSkill.source_url)).where(
+                        col(MarketplaceSkill.organization_id) == organization_id,
+                        col(MarketplaceSkill.source_url).in_(
+                            [row["source_url"] for row in batch],
+                        ),
+                    ),
+                ),
+            )
+        statement = insert(MarketplaceSkill).values(batch)
+        excluded = statement.excluded
+        stored_metadata: Any = col(MarketplaceSkill.metadata_)
+        incoming_metadata: Any = excluded["metadata"]
+        if is_postgres:
+            # Postgres `json` has no equality operator; `jsonb` compares by value.
+            stored_metadata = cast(stored_metadata, JSONB)
+            incoming_metadata = cast(incoming_metadata, JSONB)
+        changed = or_(
+            *(
+                col(getattr(MarketplaceSkill, field_name)).is_distinct_from(
+                    excluded[field_name],
+                )
+                for field_name in ("name", "description", "category", "risk", "source", "pack_id")
+            ),
+            stored_metadata.is_distinct_from(incoming_metadata),
+        )
+        upsert = statement.on_conflict_do_update(
+            index_elements=["organization_id", "source_url"],
+            set_={
+                "name": excluded.name,
+                "description": excluded.description,
+                "category": excluded.category,
+                "risk": excluded.risk,
+                "source": excluded.source,
+                "pack_id": excluded.pack_id,
+                "metadata": excluded["metadata"],
+                "updated_at": UtcNow(),
+            },
+            where=changed,
+        )
+        if is_postgres:
+            # A freshly inserted row has never been locked or updated, so its xmax is 0;
+            # this answers "created or updated" in the same statement and cannot race a
+            # concurrent sync the way a separate pre-read did.
+            inserted_flags: list[bool] = list(
+                (
+                    await session.exec(
+                        upsert.returning(
+                            (literal_column("xmax") == literal_column("0")).label("inserted"),
+                        ),
+                    )
+                ).scalars(),
+            )
+        else:
+            written_urls = (
+                await session.exec(upsert.returning(col(MarketplaceSkill.source_url)))
+            ).scalars()
+            inserted_flags = [source_url not in existing_urls for source_url in written_urls]
+        for inserted in inserted_flags:
+            if inserted:
+                created += 1
+            else:
+                updated += 1
+    return created, updated
+
+
 async def _sync_gateway_installation_state(
     *,
     session: AsyncSession,
@@ -845,26 +1224,30 @@ async def _sync_gateway_installation_state(
     skill_id: UUID,
     installed: bool,
 ) -> None:
-    installation = await GatewayInstalledSkill.objects.filter_by(
-        gateway_id=gateway_id,
-        skill_id=skill_id,
-    ).first(session)
-    if installed:
-        if installation is None:
-            session.add(
-                GatewayInstalledSkill(
-                    gateway_id=gateway_id,
-                    skill_id=skill_id,
-                ),
-            )
-            return
-
-        installation.updated_at = utcnow()
-        session.add(installation)
+    if not installed:
+        await crud.delete_where(
+            session,
+            GatewayInstalledSkill,
+            col(GatewayInstalledSkill.gateway_id) == gateway_id,
+            col(GatewayInstalledSkill.skill_id) == skill_id,
+        )
         return
 
-    if installation is not None:
-        await session.delete(installation)
+    # One round trip instead of select-then-insert/update; the unique constraint arbitrates.
+    now = utcnow()
+    statement = _dialect_insert(session)(GatewayInstalledSkill).values(
+        id=uuid4(),
+        gateway_id=gateway_id,
+        skill_id=skill_id,
+        created_at=now,
+        updated_at=now,
+    )
+    await session.exec(
+        statement.on_conflict_do_update(
+            index_elements=["gateway_id", "skill_id"],
+            set_={"updated_at": now},
+        ),
+    )
 
 
 async def _run_marketplace_skill_action(
@@ -875,9 +1258,13 @@ async def _run_marketplace_skill_action(
     gateway_id: UUID,
     installed: bool,
 ) -> MarketplaceSkillActionResponse:
-    gateway = await _require_gateway_for_org(gateway_id=gateway_id, session=session, ctx=ctx)
+    gateway, skill = await _require_gateway_and_skill_for_org(
+        gateway_id=gateway_id,
+        skill_id=skill_id,
+        session=session,
+        ctx=ctx,
+    )
     require_gateway_workspace_root(gateway)
-    skill = await _require_marketplace_skill_for_org(skill_id=skill_id, session=session, ctx=ctx)
     instruction = (
         _install_instruction(skill=skill, gateway=gateway)
         if installed
@@ -909,33 +1296,6 @@ async def _run_marketplace_skill_action(
     )
 
 
-def _apply_pack_candidate_updates(
-    *,
-    existing: MarketplaceSkill,
-    candidate: PackSkillCandidate,
-) -> bool:
-    changed = False
-    if existing.name != candidate.name:
-        existing.name = candidate.name
-        changed = True
-    if existing.description != candidate.description:
-        existing.description = candidate.description
-        changed = True
-    if existing.category != candidate.category:
-        existing.category = candidate.category
-        changed = True
-    if existing.risk != candidate.risk:
-        existing.risk = candidate.risk
-        changed = True
-    if existing.source != candidate.source:
-        existing.source = candidate.source
-        changed = True
-    if existing.metadata_ != (candidate.metadata or {}):
-        existing.metadata_ = candidate.metadata or {}
-        changed = True
-    return changed
-
-
 @router.get("/marketplace", response_model=list[MarketplaceSkillCardRead])
 async def list_marketplace_skills(
     response: Response,
@@ -945,11 +1305,20 @@ async def list_marketplace_skills(
     risk: str | None = Query(default=None),
     pack_id: UUID | None = Query(default=None, alias="pack_id"),
     limit: int | None = Query(default=None, ge=1, le=200),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(default=0, ge=0, deprecated=True),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False),
     session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
-) -> list[MarketplaceSkillCardRead]:
-    """List marketplace cards for an org and annotate install state for a gateway."""
+) -> list[MarketplaceSkillCardRead] | StreamingResponse:
+    """List marketplace cards for an org and annotate install state for a gateway.
+
+    Pages are keyed on `(created_at, id)`: pass the `X-Next-Cursor` header from one
+    response as `cursor` to fetch the next page. `offset` is kept for older clients
+    and ignored when a cursor is given. Limited responses carry `X-Has-More`; the
+    `X-Total-Count` aggregate is only computed when `include_total` is set. Without a
+    `limit` the same JSON array is streamed as rows arrive.
+    """
     gateway = await _require_gateway_for_org(gateway_id=gateway_id, session=session, ctx=ctx)
     skills_query = MarketplaceSkill.objects.filter_by(organization_id=ctx.organization.id)
 
@@ -957,10 +1326,7 @@ async def list_marketplace_skills(
     if normalized_category:
         if normalized_category == "uncategorized":
             skills_query = skills_query.filter(
-                or_(
-                    col(MarketplaceSkill.category).is_(None),
-                    func.trim(col(MarketplaceSkill.category)) == "",
-                ),
+                col(MarketplaceSkill.category_is_uncategorized).is_(True),
             )
         else:
             skills_query = skills_query.filter(
@@ -971,10 +1337,7 @@ async def list_marketplace_skills(
     if normalized_risk:
         if normalized_risk == "uncategorized":
             skills_query = skills_query.filter(
-                or_(
-                    col(MarketplaceSkill.risk).is_(None),
-                    func.trim(col(MarketplaceSkill.risk)) == "",
-                ),
+                col(MarketplaceSkill.risk_is_uncategorized).is_(True),
             )
         else:
             skills_query = skills_query.filter(
@@ -984,44 +1347,83 @@ async def list_marketplace_skills(
 
     if pack_id is not None:
         pack = await _require_skill_pack_for_org(pack_id=pack_id, session=session, ctx=ctx)
-        normalized_pack_source = _normalize_pack_source_url(pack.source_url)
-        skills_query = skills_query.filter(
-            col(MarketplaceSkill.source_url).ilike(f"{normalized_pack_source}%"),
-        )
+        skills_query = skills_query.filter(col(MarketplaceSkill.pack_id) == pack.id)
 
-    normalized_search = (search or "").strip()
+    normalized_search = (search or "").strip().lower()
     if normalized_search:
+        # `lower(column) LIKE` matches the `lower(column)` trigram indexes on the model.
         search_like = f"%{normalized_search}%"
         skills_query = skills_query.filter(
             or_(
-                col(MarketplaceSkill.name).ilike(search_like),
-                col(MarketplaceSkill.description).ilike(search_like),
-                col(MarketplaceSkill.category).ilike(search_like),
-                col(MarketplaceSkill.risk).ilike(search_like),
-                col(MarketplaceSkill.source).ilike(search_like),
+                *(
+                    func.lower(col(getattr(MarketplaceSkill, column_name))).like(search_like)
+                    for column_name in MARKETPLACE_SKILL_SEARCH_COLUMNS
+                ),
             ),
         )
 
-    if limit is not None:
-        count_statement = select(func.count()).select_from(
-            skills_query.statement.order_by(None).subquery()
+    ordered_query = skills_query.order_by(
+        col(MarketplaceSkill.created_at).desc(),
+        col(MarketplaceSkill.id).desc(),
+    )
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_keyset_cursor(cursor)
+        ordered_query = ordered_query.filter(
+            or_(
+                col(MarketplaceSkill.created_at) < cursor_created_at,
+                and_(
+                    col(MarketplaceSkill.created_at) == cursor_created_at,
+                    col(MarketplaceSkill.id) < cursor_id,
+                ),
+            ),
         )
-        total_count = int((await session.exec(count_statement)).one() or 0)
-        response.headers["X-Total-Count"] = str(total_count)
-        response.headers["X-Limit"] = str(limit)
-        response.headers["X-Offset"] = str(offset)
-
-    ordered_query = skills_query.order_by(col(MarketplaceSkill.created_at).desc())
+    elif offset:
+        ordered_query = ordered_query.offset(offset)
     if limit is not None:
-        ordered_query = ordered_query.offset(offset).limit(limit)
-    skills = await ordered_query.all(session)
-    installations = await GatewayInstalledSkill.objects.filter_by(gateway_id=gateway.id).all(
-        session
+        # One extra row answers "is there a next page" without counting the whole set.
+        ordered_query = ordered_query.limit(limit + 1)
+    # Install state for the page rides along on a LEFT JOIN instead of loading every
+    # installation on the gateway.
+    page_statement = ordered_query.statement.add_columns(GatewayInstalledSkill).outerjoin(
+        GatewayInstalledSkill,
+        and_(
+            col(GatewayInstalledSkill.skill_id) == col(MarketplaceSkill.id),
+            col(GatewayInstalledSkill.gateway_id) == gateway.id,
+        ),
     )
-    installed_by_skill_id = {record.skill_id: record for record in installations}
-    return [
-        _as_card(skill=skill, installation=installed_by_skill_id.get(skill.id)) for skill in skills
-    ]
+    if limit is None:
+        # Unlimited reads (filter options, installation lookups) cover the whole filtered
+        # catalog and carry no paging headers, so they can start sending immediately.
+        return StreamingResponse(
+            _stream_cards(session, page_statement),
+            media_type="application/json",
+        )
+    with_window_total = include_total and cursor is None
+    if with_window_total:
+        # `COUNT(*) OVER ()` is evaluated before LIMIT/OFFSET, so the page scan also
+        # yields the filtered total without a separate count round-trip.
+        page_statement = page_statement.add_columns(func.count().over().label("total_count"))
+    rows = (await session.execute(page_statement)).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    response.headers["X-Has-More"] = "true" if has_more else "false"
+    response.headers["X-Limit"] = str(limit)
+    response.headers["X-Offset"] = str(offset)
+    if has_more:
+        last = rows[-1][0]
+        response.headers["X-Next-Cursor"] = encode_keyset_cursor(last.created_at, last.id)
+    if include_total:
+        if with_window_total and rows:
+            total_count = int(rows[0][2])
+        else:
+            # Empty pages and cursor pages cannot see the full filtered set.
+            count_statement = select(func.count()).select_from(
+                skills_query.statement.order_by(None).subquery()
+            )
+            total_count = int((await session.exec(count_statement)).one() or 0)
+        response.headers["X-Total-Count"] = str(total_count)
+    return [_as_card(skill=row[0], installation=row[1]) for row in rows]
 
 
 @router.post("/marketplace", response_model=MarketplaceSkillRead)
@@ -1029,41 +1431,64 @@ async def create_marketplace_skill(
     payload: MarketplaceSkillCreate,
     session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
-) -> MarketplaceSkill:
+) -> MarketplaceSkillRead:
     """Register or update a direct marketplace skill URL in the catalog."""
     source_url = str(payload.source_url).strip()
-    existing = await MarketplaceSkill.objects.filter_by(
-        organization_id=ctx.organization.id,
-        source_url=source_url,
-    ).first(session)
-    if existing is not None:
-        changed = False
-        if payload.name and existing.name != payload.name:
-            existing.name = payload.name
-            changed = True
-        if payload.description is not None and existing.description != payload.description:
-            existing.description = payload.description
-            changed = True
-        if changed:
-            existing.updated_at = utcnow()
-            session.add(existing)
-            await session.commit()
-            await session.refresh(existing)
-        existing.metadata_ = existing.metadata_ or {}
-        return existing
-
-    skill = MarketplaceSkill(
+    now = utcnow()
+    statement = _dialect_insert(session)(MarketplaceSkill).values(
+        id=uuid4(),
         organization_id=ctx.organization.id,
         source_url=source_url,
         name=payload.name or _infer_skill_name(source_url),
         description=payload.description,
         metadata_={},
+        created_at=now,
+        updated_at=now,
     )
-    session.add(skill)
+    # Re-registering a URL only overwrites the fields the caller supplied, and only
+    # touches `updated_at` when one of them actually changes.
+    updates: dict[str, Any] = {}
+    if payload.name:
+        updates["name"] = statement.excluded.name
+    if payload.description is not None:
+        updates["description"] = statement.excluded.description
+    if updates:
+        upsert = statement.on_conflict_do_update(
+            index_elements=["organization_id", "source_url"],
+            set_={**updates, "updated_at": statement.excluded.updated_at},
+            where=or_(
+                *(
+                    col(getattr(MarketplaceSkill, field_name)).is_distinct_from(value)
+                    for field_name, value in updates.items()
+                ),
+            ),
+        )
+    else:
+        upsert = statement.on_conflict_do_nothing(
+            index_elements=["organization_id", "source_url"],
+        )
+    skill = (
+        (
+            await session.exec(
+                upsert.returning(MarketplaceSkill).execution_options(populate_existing=True),
+            )
+        )
+        .scalars()
+        .one_or_none()
+    )
+    if skill is None:
+        # The URL was already registered and nothing changed.
+        skill = await MarketplaceSkill.objects.filter_by(
+            organization_id=ctx.organization.id,
+            source_url=source_url,
+        ).one_or_none(session)
     await session.commit()
-    await session.refresh(skill)
-    skill.metadata_ = skill.metadata_ or {}
-    return skill
+    if skill is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Skill was removed while it was being registered",
+        )
+    return _as_marketplace_skill_read(skill)
 
 
 @router.delete("/marketplace/{skill_id}", response_model=OkResponse)
@@ -1133,12 +1558,12 @@ async def list_skill_packs(
         .order_by(col(SkillPack.created_at).desc())
         .all(session)
     )
-    count_by_repo = await _load_pack_skill_count_by_repo(
+    count_by_pack = await _load_pack_skill_counts(
         session=session,
         organization_id=ctx.organization.id,
     )
     return [
-        _as_skill_pack_read_with_count(pack=pack, count_by_repo=count_by_repo) for pack in packs
+        _as_skill_pack_read_with_count(pack=pack, count_by_pack=count_by_pack) for pack in packs
     ]
 
 
@@ -1150,11 +1575,12 @@ async def get_skill_pack(
 ) -> SkillPackRead:
     """Get one skill pack by ID."""
     pack = await _require_skill_pack_for_org(pack_id=pack_id, session=session, ctx=ctx)
-    count_by_repo = await _load_pack_skill_count_by_repo(
+    count_by_pack = await _load_pack_skill_counts(
         session=session,
         organization_id=ctx.organization.id,
+        pack_id=pack.id,
     )
-    return _as_skill_pack_read_with_count(pack=pack, count_by_repo=count_by_repo)
+    return _as_skill_pack_read_with_count(pack=pack, count_by_pack=count_by_pack)
 
 
 @router.post("/packs", response_model=SkillPackRead)
@@ -1194,11 +1620,12 @@ async def create_skill_pack(
             session.add(existing)
             await session.commit()
             await session.refresh(existing)
-        count_by_repo = await _load_pack_skill_count_by_repo(
+        count_by_pack = await _load_pack_skill_counts(
             session=session,
             organization_id=ctx.organization.id,
+            pack_id=existing.id,
         )
-        return _as_skill_pack_read_with_count(pack=existing, count_by_repo=count_by_repo)
+        return _as_skill_pack_read_with_count(pack=existing, count_by_pack=count_by_pack)
 
     pack = SkillPack(
         organization_id=ctx.organization.id,
@@ -1211,11 +1638,12 @@ async def create_skill_pack(
     session.add(pack)
     await session.commit()
     await session.refresh(pack)
-    count_by_repo = await _load_pack_skill_count_by_repo(
+    count_by_pack = await _load_pack_skill_counts(
         session=session,
         organization_id=ctx.organization.id,
+        pack_id=pack.id,
     )
-    return _as_skill_pack_read_with_count(pack=pack, count_by_repo=count_by_repo)
+    return _as_skill_pack_read_with_count(pack=pack, count_by_pack=count_by_pack)
 
 
 @router.patch("/packs/{pack_id}", response_model=SkillPackRead)
@@ -1243,6 +1671,14 @@ async def update_skill_pack(
             detail="A pack with this source URL already exists",
         )
 
+    if pack.source_url != source_url:
+        # Skills synced from the old repository no longer belong to this pack.
+        await crud.update_where(
+            session,
+            MarketplaceSkill,
+            col(MarketplaceSkill.pack_id) == pack.id,
+            pack_id=None,
+        )
     pack.source_url = source_url
     pack.name = payload.name or _infer_skill_name(source_url)
     pack.description = payload.description
@@ -1252,11 +1688,12 @@ async def update_skill_pack(
     session.add(pack)
     await session.commit()
     await session.refresh(pack)
-    count_by_repo = await _load_pack_skill_count_by_repo(
+    count_by_pack = await _load_pack_skill_counts(
         session=session,
         organization_id=ctx.organization.id,
+        pack_id=pack.id,
     )
-    return _as_skill_pack_read_with_count(pack=pack, count_by_repo=count_by_repo)
+    return _as_skill_pack_read_with_count(pack=pack, count_by_pack=count_by_pack)
 
 
 @router.delete("/packs/{pack_id}", response_model=OkResponse)
@@ -1267,8 +1704,15 @@ async def delete_skill_pack(
 ) -> OkResponse:
     """Delete one pack source from the organization."""
     pack = await _require_skill_pack_for_org(pack_id=pack_id, session=session, ctx=ctx)
+    await crud.update_where(
+        session,
+        MarketplaceSkill,
+        col(MarketplaceSkill.pack_id) == pack.id,
+        pack_id=None,
+    )
     await session.delete(pack)
     await session.commit()
+    _invalidate_pack_skills_cache(pack.source_url)
     return OkResponse()
 
 
@@ -1287,7 +1731,7 @@ async def sync_skill_pack(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     try:
-        discovered = _collect_pack_skills(
+        discovered = await _collect_pack_skills(
             source_url=pack.source_url,
         )
     except RuntimeError as exc:
@@ -1296,37 +1740,13 @@ async def sync_skill_pack(
             detail=str(exc),
         ) from exc
 
-    existing_skills = await MarketplaceSkill.objects.filter_by(
+    # One batched upsert per 500 candidates; the database decides which rows changed.
+    created, updated = await _upsert_pack_skills(
+        session=session,
         organization_id=ctx.organization.id,
-    ).all(session)
-    existing_by_source = {skill.source_url: skill for skill in existing_skills}
-
-    created = 0
-    updated = 0
-    for candidate in discovered:
-        existing = existing_by_source.get(candidate.source_url)
-        if existing is None:
-            session.add(
-                MarketplaceSkill(
-                    organization_id=ctx.organization.id,
-                    source_url=candidate.source_url,
-                    name=candidate.name,
-                    description=candidate.description,
-                    category=candidate.category,
-                    risk=candidate.risk,
-                    source=candidate.source,
-                    metadata_=candidate.metadata or {},
-                ),
-            )
-            created += 1
-            continue
-
-        changed = _apply_pack_candidate_updates(existing=existing, candidate=candidate)
-        if changed:
-            existing.updated_at = utcnow()
-            session.add(existing)
-            updated += 1
-
+        pack_id=pack.id,
+        candidates=discovered,
+    )
     await session.commit()
 
     return SkillPackSyncResponse(
@@ -12,6 +12,7 @@ from sqlmodel import col, select
 
 from app.api.deps import require_org_admin, require_org_member
 from app.core.time import utcnow
+from app.db import crud
 from app.db.session import get_session
 from app.models.boards import Board
 from app.models.task_custom_fields import (
@@ -62,6 +63,12 @@ async def _board_ids_by_definition_id(
                 col(BoardTaskCustomField.board_id),
             ).where(
                 col(BoardTaskCustomField.task_custom_field_definition_id).in_(definition_ids),
+            )
+            # UUIDs compare byte-wise in the database, which is the same order as their
+            # canonical strings, so each list arrives already sorted.
+            .order_by(
+                col(BoardTaskCustomField.task_custom_field_definition_id),
+                col(BoardTaskCustomField.board_id),
             ),
         )
     ).all()
@@ -70,8 +77,6 @@ async def _board_ids_by_definition_id(
     }
     for definition_id, board_id in rows:
         board_ids_by_definition_id.setdefault(definition_id, []).append(board_id)
-    for definition_id in board_ids_by_definition_id:
-        board_ids_by_definition_id[definition_id].sort(key=str)
     return board_ids_by_definition_id
 
 
@@ -258,27 +263,31 @@ async def update_org_custom_field(
     for key, value in updates.items():
         setattr(definition, key, value)
     if validated_board_ids is not None:
-        bindings = list(
+        current_board_ids = set(
             await session.exec(
-                select(BoardTaskCustomField).where(
+                select(col(BoardTaskCustomField.board_id)).where(
                     col(BoardTaskCustomField.task_custom_field_definition_id) == definition.id,
                 ),
             ),
         )
-        current_board_ids = {binding.board_id for binding in bindings}
-        target_board_ids = set(validated_board_ids)
-        for binding in bindings:
-            if binding.board_id not in target_board_ids:
-                await session.delete(binding)
-        for board_id in validated_board_ids:
-            if board_id in current_board_ids:
-                continue
-            session.add(
+        removed_board_ids = current_board_ids.difference(validated_board_ids)
+        if removed_board_ids:
+            await crud.delete_where(
+                session,
+                BoardTaskCustomField,
+                col(BoardTaskCustomField.task_custom_field_definition_id) == definition.id,
+                col(BoardTaskCustomField.board_id).in_(removed_board_ids),
+            )
+        session.add_all(
+            [
                 BoardTaskCustomField(
                     board_id=board_id,
                     task_custom_field_definition_id=definition.id,
-                ),
-            )
+                )
+                for board_id in validated_board_ids
+                if board_id not in current_board_ids
+            ],
+        )
     definition.updated_at = utcnow()
     session.add(definition)
 
@@ -316,28 +325,20 @@ async def delete_org_custom_field(
         ctx=ctx,
         definition_id=task_custom_field_definition_id,
     )
-    value_ids = (
-        await session.exec(
-            select(col(TaskCustomFieldValue.id)).where(
-                col(TaskCustomFieldValue.task_custom_field_definition_id) == definition.id,
-            ),
-        )
-    ).all()
-    if value_ids:
+    has_values = await TaskCustomFieldValue.objects.filter_by(
+        task_custom_field_definition_id=definition.id,
+    ).exists(session)
+    if has_values:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Cannot delete a custom field definition while task values exist.",
         )
 
-    bindings = list(
-        await session.exec(
-            select(BoardTaskCustomField).where(
-                col(BoardTaskCustomField.task_custom_field_definition_id) == definition.id,
-            ),
-        ),
+    await crud.delete_where(
+        session,
+        BoardTaskCustomField,
+        col(BoardTaskCustomField.task_custom_field_definition_id) == definition.id,
     )
-    for binding in bindings:
-        await session.delete(binding)
     await session.delete(definition)
     await session.commit()
     return OkResponse()
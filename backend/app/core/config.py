@@ -57,6 +57,16 @@ class Settings(BaseSettings):
 
     # Database lifecycle
     db_auto_migrate: bool = False
+    # Connection pool; a bounded wait fails fast instead of queueing requests indefinitely.
+    db_pool_size: int = Field(default=20, ge=1)
+    db_max_overflow: int = Field(default=10, ge=0)
+    db_pool_timeout: float = Field(default=5.0, gt=0)
+    db_pool_warm_connections: int = Field(default=5, ge=0)
+    db_pool_recycle_seconds: int = Field(default=1800, ge=-1)
+    # Behind PgBouncer (transaction mode) let the external pooler own connections.
+    db_external_pooler: bool = False
+    # Compiled-SQL cache entries per engine; sized above SQLAlchemy's default of 500.
+    db_query_cache_size: int = Field(default=1200, ge=0)
 
     # RQ queueing / dispatch
     rq_redis_url: str = "redis://localhost:6379/0"
@@ -66,8 +76,15 @@ class Settings(BaseSettings):
     rq_dispatch_retry_base_seconds: float = 10.0
     rq_dispatch_retry_max_seconds: float = 120.0
 
+    # Skill packs; larger index reads mean fewer read() calls per MiB of skills_index.json.
+    skills_index_read_chunk_bytes: int = Field(default=256 * 1024, ge=4096)
+    # Where pack clones are checked out (e.g. /dev/shm); empty means the system temp dir.
+    skill_pack_clone_dir: str = ""
+
     # Anthropic API (optional, for Gardener AI reviewer selection)
     anthropic_api_key: str = ""
+    # Upper bound on LLM criterion reviews one auto-evaluation sends at once.
+    auto_evaluate_llm_concurrency: int = Field(default=4, ge=1)
 
     # OpenClaw gateway runtime compatibility
     gateway_min_version: str = "2026.02.9"
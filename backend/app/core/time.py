@@ -3,9 +3,33 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 
 
 def utcnow() -> datetime:
     """Return a naive UTC datetime without using deprecated datetime.utcnow()."""
     # Keep naive UTC values for compatibility with existing DB schema/queries.
     return datetime.now(UTC).replace(tzinfo=None)
+
+
+class UtcNow(FunctionElement[datetime]):
+    """Database-side counterpart of `utcnow()` for set-based writes."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow)
+def _compile_utcnow(_element: UtcNow, _compiler: Any, **_kw: Any) -> str:
+    # SQLite (tests) reports CURRENT_TIMESTAMP in UTC already.
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(UtcNow, "postgresql")
+def _compile_utcnow_postgresql(_element: UtcNow, _compiler: Any, **_kw: Any) -> str:
+    # now() is timestamptz; convert so naive `timestamp` columns keep holding UTC.
+    return "(now() AT TIME ZONE 'UTC')"
@@ -161,7 +161,7 @@ async def list_by(
 
 async def exists(session: AsyncSession, model: type[ModelT], **lookup: object) -> bool:
     """Return whether any object exists for lookup values."""
-    return (await session.exec(_lookup_statement(model, lookup).limit(1))).first() is not None
+    return bool((await session.exec(select(_lookup_statement(model, lookup).exists()))).one())
 
 
 def _criteria_statement(
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, TypeVar
+from uuid import UUID
 
+from fastapi import HTTPException, status
 from fastapi_pagination.ext.sqlalchemy import paginate as _paginate
 
 from app.schemas.pagination import DefaultLimitOffsetPage
@@ -31,3 +36,23 @@ async def paginate(
     """Execute a paginated query and cast to the project page type alias."""
     page = await _paginate(session, statement, transformer=transformer)
     return DefaultLimitOffsetPage[T].model_validate(page)
+
+
+def encode_keyset_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode a `(created_at, id)` keyset position as an opaque cursor string."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor from `encode_keyset_cursor`, raising HTTP 422 when malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at_raw, row_id_raw = raw.split("|", 1)
+        return datetime.fromisoformat(created_at_raw), UUID(row_id_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Invalid pagination cursor",
+        ) from exc
@@ -71,8 +71,11 @@ class QuerySet(Generic[ModelT]):
         return (await session.exec(self.statement)).one_or_none()
 
     async def exists(self, session: AsyncSession) -> bool:
-        """Return whether the queryset yields at least one row."""
-        return await self.limit(1).first(session) is not None
+        """Return whether the queryset yields at least one row.
+
+        Issues `SELECT EXISTS (...)` so no row is hydrated.
+        """
+        return bool((await session.exec(select(self.statement.exists()))).one())
 
 
 def qs(model: type[ModelT]) -> QuerySet[ModelT]:
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import AsyncExitStack
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from alembic.config import Config
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -32,10 +35,28 @@ def _normalize_database_url(database_url: str) -> str:
     return database_url
 
 
-async_engine: AsyncEngine = create_async_engine(
-    _normalize_database_url(settings.database_url),
-    pool_pre_ping=True,
-)
+def _engine_options(database_url: str) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "pool_pre_ping": True,
+        "query_cache_size": settings.db_query_cache_size,
+    }
+    if database_url.startswith("sqlite"):
+        # SQLite engines use single-connection/static pools without sizing knobs.
+        return options
+    if settings.db_external_pooler:
+        options["poolclass"] = NullPool
+        return options
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle_seconds,
+    )
+    return options
+
+
+_DATABASE_URL = _normalize_database_url(settings.database_url)
+async_engine: AsyncEngine = create_async_engine(_DATABASE_URL, **_engine_options(_DATABASE_URL))
 async_session_maker = async_sessionmaker(
     async_engine,
     class_=AsyncSession,
@@ -72,9 +93,35 @@ async def init_db() -> None:
         logger.warning("No migration revisions found; falling back to create_all")
 
     async with async_engine.connect() as conn, conn.begin():
+        if conn.dialect.name == "postgresql":
+            # The marketplace search indexes use `gin_trgm_ops`.
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def warm_pool(
+    engine: AsyncEngine | None = None,
+    *,
+    connections: int | None = None,
+) -> None:
+    """Open pooled connections up front so early requests skip connection setup."""
+    engine = engine or async_engine
+    count = settings.db_pool_warm_connections if connections is None else connections
+    count = min(count, settings.db_pool_size)
+    if count <= 0 or isinstance(engine.pool, NullPool):
+        return
+    try:
+        # Hold every connection until all are open so the pool keeps `count` distinct ones.
+        async with AsyncExitStack() as stack:
+            for _ in range(count):
+                conn = await stack.enter_async_context(engine.connect())
+                await conn.execute(text("SELECT 1"))
+    except (SQLAlchemyError, OSError):
+        logger.warning("Database pool warm-up failed; continuing with a cold pool.", exc_info=True)
+        return
+    logger.info("Database pool warmed with %s connections", count)
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Yield a request-scoped async DB session with safe rollback on errors."""
     async with async_session_maker() as session:
@@ -40,7 +40,7 @@ from app.core.config import settings
 from app.core.error_handling import install_error_handling
 from app.core.logging import configure_logging, get_logger
 from app.core.security_headers import SecurityHeadersMiddleware
-from app.db.session import init_db
+from app.db.session import init_db, warm_pool
 from app.schemas.health import HealthStatusResponse
 
 if TYPE_CHECKING:
@@ -466,6 +466,7 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         settings.db_auto_migrate,
     )
     await init_db()
+    await warm_pool()
     logger.info("app.lifecycle.started")
     try:
         yield
@@ -488,7 +489,7 @@ if origins:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=["X-Total-Count", "X-Limit", "X-Offset"],
+        expose_headers=["X-Total-Count", "X-Limit", "X-Offset", "X-Next-Cursor", "X-Has-More"],
     )
     logger.info("app.cors.enabled origins_count=%s", len(origins))
 else:
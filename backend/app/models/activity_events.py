@@ -21,6 +21,16 @@ class ActivityEvent(QueryModel, table=True):
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     event_type: str = Field(index=True)
     message: str | None = None
-    agent_id: UUID | None = Field(default=None, foreign_key="agents.id", index=True)
-    task_id: UUID | None = Field(default=None, foreign_key="tasks.id", index=True)
+    agent_id: UUID | None = Field(
+        default=None,
+        foreign_key="agents.id",
+        index=True,
+        ondelete="CASCADE",
+    )
+    task_id: UUID | None = Field(
+        default=None,
+        foreign_key="tasks.id",
+        index=True,
+        ondelete="CASCADE",
+    )
     created_at: datetime = Field(default_factory=utcnow)
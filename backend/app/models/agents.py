@@ -21,7 +21,12 @@ class Agent(QueryModel, table=True):
     __tablename__ = "agents"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    board_id: UUID | None = Field(default=None, foreign_key="boards.id", index=True)
+    board_id: UUID | None = Field(
+        default=None,
+        foreign_key="boards.id",
+        index=True,
+        ondelete="CASCADE",
+    )
     gateway_id: UUID = Field(foreign_key="gateways.id", index=True)
     name: str = Field(index=True)
     status: str = Field(default="provisioning", index=True)
@@ -19,7 +19,7 @@ class ApprovalRequest(QueryModel, table=True):
     __tablename__ = "approval_requests"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    proposal_id: UUID = Field(foreign_key="proposals.id", index=True)
+    proposal_id: UUID = Field(foreign_key="proposals.id", index=True, ondelete="CASCADE")
     reviewer_id: UUID = Field(index=True)
     reviewer_type: str = Field(default="human")
     selection_reason: str = Field(default="")
@@ -27,6 +27,6 @@ class ApprovalTaskLink(QueryModel, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    approval_id: UUID = Field(foreign_key="approvals.id", index=True)
+    approval_id: UUID = Field(foreign_key="approvals.id", index=True, ondelete="CASCADE")
     task_id: UUID = Field(foreign_key="tasks.id", index=True)
     created_at: datetime = Field(default_factory=utcnow)
@@ -20,7 +20,7 @@ class AuditEntry(QueryModel, table=True):
     __tablename__ = "audit_entries"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     zone_id: UUID | None = Field(
         default=None, foreign_key="trust_zones.id", index=True
     )
@@ -20,7 +20,7 @@ class BoardGroupMemory(QueryModel, table=True):
     __tablename__ = "board_group_memory"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    board_group_id: UUID = Field(foreign_key="board_groups.id", index=True)
+    board_group_id: UUID = Field(foreign_key="board_groups.id", index=True, ondelete="CASCADE")
     content: str
     tags: list[str] | None = Field(default=None, sa_column=Column(JSON))
     is_chat: bool = Field(default=False, index=True)
@@ -20,7 +20,7 @@ class BoardOnboardingSession(QueryModel, table=True):
     __tablename__ = "board_onboarding_sessions"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    board_id: UUID = Field(foreign_key="boards.id", index=True, ondelete="CASCADE")
     session_key: str
     status: str = Field(default="active", index=True)
     messages: list[dict[str, object]] | None = Field(
@@ -20,7 +20,7 @@ class BoardWebhookPayload(QueryModel, table=True):
     __tablename__ = "board_webhook_payloads"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    board_id: UUID = Field(foreign_key="boards.id", index=True, ondelete="CASCADE")
     webhook_id: UUID = Field(foreign_key="board_webhooks.id", index=True)
     payload: dict[str, object] | list[object] | str | int | float | bool | None = Field(
         default=None,
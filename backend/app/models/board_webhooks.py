@@ -19,7 +19,7 @@ class BoardWebhook(QueryModel, table=True):
     __tablename__ = "board_webhooks"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    board_id: UUID = Field(foreign_key="boards.id", index=True, ondelete="CASCADE")
     agent_id: UUID | None = Field(default=None, foreign_key="agents.id", index=True)
     description: str
     enabled: bool = Field(default=True, index=True)
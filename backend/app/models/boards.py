@@ -20,7 +20,7 @@ class Board(TenantScoped, table=True):
     __tablename__ = "boards"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     name: str
     slug: str = Field(index=True)
     description: str = Field(default="")
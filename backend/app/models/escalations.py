@@ -20,7 +20,7 @@ class Escalation(QueryModel, table=True):
     __tablename__ = "escalations"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     escalation_type: str = Field(index=True)  # action | governance
     source_proposal_id: UUID | None = Field(
         default=None, foreign_key="proposals.id", index=True
@@ -46,6 +46,6 @@ class EscalationCosigner(QueryModel, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    escalation_id: UUID = Field(foreign_key="escalations.id", index=True)
+    escalation_id: UUID = Field(foreign_key="escalations.id", index=True, ondelete="CASCADE")
     user_id: UUID = Field(foreign_key="users.id", index=True)
     created_at: datetime = Field(default_factory=utcnow)
@@ -21,7 +21,7 @@ class Evaluation(QueryModel, table=True):
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     zone_id: UUID = Field(foreign_key="trust_zones.id", index=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     task_id: UUID | None = Field(default=None, index=True)
     proposal_id: UUID | None = Field(
         default=None, foreign_key="proposals.id", index=True
@@ -49,7 +49,7 @@ class EvaluationScore(QueryModel, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    evaluation_id: UUID = Field(foreign_key="evaluations.id", index=True)
+    evaluation_id: UUID = Field(foreign_key="evaluations.id", index=True, ondelete="CASCADE")
     evaluator_id: UUID = Field(index=True)
     criterion_name: str
     criterion_weight: float = Field(default=1.0)
@@ -64,7 +64,7 @@ class IncentiveSignal(QueryModel, table=True):
     __tablename__ = "incentive_signals"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    evaluation_id: UUID = Field(foreign_key="evaluations.id", index=True)
+    evaluation_id: UUID = Field(foreign_key="evaluations.id", index=True, ondelete="CASCADE")
     target_id: UUID = Field(index=True)
     signal_type: str = Field(index=True)  # positive | negative | neutral
     magnitude: float = Field(default=1.0)
@@ -19,7 +19,7 @@ class GardenerFeedback(QueryModel, table=True):
     __tablename__ = "gardener_feedback"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    proposal_id: UUID = Field(foreign_key="proposals.id", index=True)
+    proposal_id: UUID = Field(foreign_key="proposals.id", index=True, ondelete="CASCADE")
     reviewer_id: UUID = Field(index=True)
     selected_by: str = Field(index=True)  # rule_based | gardener_ai
     reviewed_in_time: bool | None = None
@@ -19,7 +19,7 @@ class Gateway(QueryModel, table=True):
     __tablename__ = "gateways"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     name: str
     url: str
     token: str | None = Field(default=None)
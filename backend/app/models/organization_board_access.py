@@ -30,8 +30,9 @@ class OrganizationBoardAccess(QueryModel, table=True):
     organization_member_id: UUID = Field(
         foreign_key="organization_members.id",
         index=True,
+        ondelete="CASCADE",
     )
-    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    board_id: UUID = Field(foreign_key="boards.id", index=True, ondelete="CASCADE")
     can_read: bool = Field(default=True)
     can_write: bool = Field(default=False)
     created_at: datetime = Field(default_factory=utcnow)
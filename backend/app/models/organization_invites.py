@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -18,12 +18,21 @@ class OrganizationInvite(QueryModel, table=True):
     """Invitation record granting prospective organization access."""
 
     __tablename__ = "organization_invites"  # pyright: ignore[reportAssignmentType]
-    __table_args__ = (UniqueConstraint("token", name="uq_org_invites_token"),)
+    __table_args__ = (
+        UniqueConstraint("token", name="uq_org_invites_token"),
+        # Covers the accept-invite lookup, which only ever targets pending invites.
+        Index(
+            "ix_organization_invites_pending_token",
+            "token",
+            postgresql_where=text("accepted_at IS NULL"),
+            sqlite_where=text("accepted_at IS NULL"),
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     invited_email: str = Field(index=True)
-    token: str = Field(index=True)
+    token: str
     role: str = Field(default="member", index=True)
     all_boards_read: bool = Field(default=False)
     all_boards_write: bool = Field(default=False)
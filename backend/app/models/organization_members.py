@@ -27,7 +27,7 @@ class OrganizationMember(QueryModel, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     user_id: UUID = Field(foreign_key="users.id", index=True)
     role: str = Field(default="member", index=True)
     all_boards_read: bool = Field(default=False)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index, text
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -17,6 +18,8 @@ class Organization(QueryModel, table=True):
     """Top-level organization tenant record."""
 
     __tablename__ = "organizations"  # pyright: ignore[reportAssignmentType]
+    # Not unique: every user's default "Personal" organization shares a name.
+    __table_args__ = (Index("ix_organizations_name_lower", text("lower(name)")),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     name: str = Field(index=True)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -18,9 +18,14 @@ class Proposal(QueryModel, table=True):
     """Zone-scoped proposal requiring approval through a decision model."""
 
     __tablename__ = "proposals"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        # Serves org-scoped listings filtered by status (pending_review is the hot one)
+        # and ordered newest first.
+        Index("ix_proposals_org_status_created", "organization_id", "status", "created_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     zone_id: UUID = Field(foreign_key="trust_zones.id", index=True)
     proposer_id: UUID = Field(foreign_key="users.id", index=True)
     title: str
@@ -5,8 +5,8 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column, UniqueConstraint
-from sqlmodel import Field
+from sqlalchemy import JSON, Boolean, Column, Computed, Index, UniqueConstraint, func, text
+from sqlmodel import Field, col
 
 from app.core.time import utcnow
 from app.models.base import QueryModel
@@ -14,6 +14,9 @@ from app.models.tenancy import TenantScoped
 
 RUNTIME_ANNOTATION_TYPES = (datetime,)
 
+# Free-text columns matched by the marketplace `search` filter.
+MARKETPLACE_SKILL_SEARCH_COLUMNS = ("name", "description", "category", "risk", "source")
+
 
 class MarketplaceSkill(TenantScoped, table=True):
     """A marketplace skill entry that can be installed onto one or more gateways."""
@@ -25,22 +28,66 @@ class MarketplaceSkill(TenantScoped, table=True):
             "source_url",
             name="uq_marketplace_skills_org_source_url",
         ),
+        # Serves the org-scoped marketplace listing ordered newest first and its
+        # `(created_at, id)` keyset cursor.
+        Index("ix_marketplace_skills_org_created_id", "organization_id", "created_at", "id"),
+        # Serve the `uncategorized` category/risk filters without evaluating trim() per row.
+        *(
+            Index(
+                f"ix_marketplace_skills_org_uncategorized_{column}",
+                "organization_id",
+                "created_at",
+                postgresql_where=text(f"{column}_is_uncategorized IS TRUE"),
+                sqlite_where=text(f"{column}_is_uncategorized IS TRUE"),
+            )
+            for column in ("category", "risk")
+        ),
+        # Serves the marketplace `pack_id` filter.
+        Index("ix_marketplace_skills_org_pack_id", "organization_id", "pack_id"),
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     name: str
     description: str | None = Field(default=None)
     category: str | None = Field(default=None)
     risk: str | None = Field(default=None)
     source: str | None = Field(default=None)
     source_url: str
+    # Set for skills discovered by a pack sync.
+    pack_id: UUID | None = Field(default=None, foreign_key="skill_packs.id", ondelete="SET NULL")
     metadata_: dict[str, object] = Field(
         default_factory=dict,
         sa_column=Column("metadata", JSON, nullable=False),
     )
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow)
+    # Maintained by the database; true when the column is NULL or blank.
+    category_is_uncategorized: bool | None = Field(
+        default=None,
+        sa_column=Column(
+            Boolean,
+            Computed("category IS NULL OR trim(category) = ''", persisted=True),
+        ),
+    )
+    risk_is_uncategorized: bool | None = Field(
+        default=None,
+        sa_column=Column(
+            Boolean,
+            Computed("risk IS NULL OR trim(risk) = ''", persisted=True),
+        ),
+    )
+
+
+# Trigram indexes on `lower(column)` let the `lower(column) LIKE '%term%'` search avoid a
+# sequential scan. Expression indexes need the mapped columns, so they follow the class.
+for _column_name in MARKETPLACE_SKILL_SEARCH_COLUMNS:
+    Index(
+        f"ix_marketplace_skills_{_column_name}_lower_trgm",
+        func.lower(col(getattr(MarketplaceSkill, _column_name))).label(f"{_column_name}_lower"),
+        postgresql_using="gin",
+        postgresql_ops={f"{_column_name}_lower": "gin_trgm_ops"},
+    )
 
 
 class SkillPack(TenantScoped, table=True):
@@ -56,7 +103,7 @@ class SkillPack(TenantScoped, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     name: str
     description: str | None = Field(default=None)
     source_url: str
@@ -82,7 +129,7 @@ class GatewayInstalledSkill(QueryModel, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    gateway_id: UUID = Field(foreign_key="gateways.id", index=True)
-    skill_id: UUID = Field(foreign_key="marketplace_skills.id", index=True)
+    gateway_id: UUID = Field(foreign_key="gateways.id", index=True, ondelete="CASCADE")
+    skill_id: UUID = Field(foreign_key="marketplace_skills.id", index=True, ondelete="CASCADE")
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow)
@@ -27,6 +27,6 @@ class TagAssignment(QueryModel, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    task_id: UUID = Field(foreign_key="tasks.id", index=True)
-    tag_id: UUID = Field(foreign_key="tags.id", index=True)
+    task_id: UUID = Field(foreign_key="tasks.id", index=True, ondelete="CASCADE")
+    tag_id: UUID = Field(foreign_key="tags.id", index=True, ondelete="CASCADE")
     created_at: datetime = Field(default_factory=utcnow)
@@ -27,7 +27,7 @@ class Tag(TenantScoped, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     name: str
     slug: str = Field(index=True)
     color: str = Field(default="9e9e9e")
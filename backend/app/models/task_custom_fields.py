@@ -35,7 +35,7 @@ class TaskCustomFieldDefinition(TenantScoped, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     field_key: str = Field(index=True)
     label: str
     field_type: str = Field(default="text")
@@ -61,10 +61,11 @@ class BoardTaskCustomField(TenantScoped, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    board_id: UUID = Field(foreign_key="boards.id", index=True, ondelete="CASCADE")
     task_custom_field_definition_id: UUID = Field(
         foreign_key="task_custom_field_definitions.id",
         index=True,
+        ondelete="CASCADE",
     )
     created_at: datetime = Field(default_factory=utcnow)
 
@@ -82,10 +83,11 @@ class TaskCustomFieldValue(TenantScoped, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    task_id: UUID = Field(foreign_key="tasks.id", index=True)
+    task_id: UUID = Field(foreign_key="tasks.id", index=True, ondelete="CASCADE")
     task_custom_field_definition_id: UUID = Field(
         foreign_key="task_custom_field_definitions.id",
         index=True,
+        ondelete="CASCADE",
     )
     value: object | None = Field(default=None, sa_column=Column(JSON))
     created_at: datetime = Field(default_factory=utcnow)
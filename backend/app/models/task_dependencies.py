@@ -31,7 +31,7 @@ class TaskDependency(TenantScoped, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    board_id: UUID = Field(foreign_key="boards.id", index=True, ondelete="CASCADE")
     task_id: UUID = Field(foreign_key="tasks.id", index=True)
     depends_on_task_id: UUID = Field(foreign_key="tasks.id", index=True)
     created_at: datetime = Field(default_factory=utcnow)
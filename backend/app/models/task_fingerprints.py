@@ -19,7 +19,7 @@ class TaskFingerprint(QueryModel, table=True):
     __tablename__ = "task_fingerprints"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    board_id: UUID = Field(foreign_key="boards.id", index=True, ondelete="CASCADE")
     fingerprint_hash: str = Field(index=True)
     task_id: UUID = Field(foreign_key="tasks.id")
     created_at: datetime = Field(default_factory=utcnow)
@@ -19,7 +19,12 @@ class Task(TenantScoped, table=True):
     __tablename__ = "tasks"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    board_id: UUID | None = Field(default=None, foreign_key="boards.id", index=True)
+    board_id: UUID | None = Field(
+        default=None,
+        foreign_key="boards.id",
+        index=True,
+        ondelete="CASCADE",
+    )
 
     title: str
     description: str | None = None
@@ -28,7 +28,7 @@ class TrustZone(QueryModel, table=True):
     __tablename__ = "trust_zones"  # pyright: ignore[reportAssignmentType]
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True, ondelete="CASCADE")
     parent_zone_id: UUID | None = Field(
         default=None,
         foreign_key="trust_zones.id",
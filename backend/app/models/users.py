@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index, text
 from sqlmodel import Field
 
 from app.models.base import QueryModel
@@ -13,6 +14,7 @@ class User(QueryModel, table=True):
     """Application user account and profile attributes."""
 
     __tablename__ = "users"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (Index("ix_users_email_lower", text("lower(email)")),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     clerk_user_id: str = Field(index=True, unique=True)
@@ -28,4 +30,5 @@ class User(QueryModel, table=True):
         default=None,
         foreign_key="organizations.id",
         index=True,
+        ondelete="SET NULL",
     )
@@ -28,8 +28,8 @@ class ZoneAssignment(QueryModel, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    zone_id: UUID = Field(foreign_key="trust_zones.id", index=True)
-    member_id: UUID = Field(foreign_key="organization_members.id", index=True)
+    zone_id: UUID = Field(foreign_key="trust_zones.id", index=True, ondelete="CASCADE")
+    member_id: UUID = Field(foreign_key="organization_members.id", index=True, ondelete="CASCADE")
     role: str = Field(index=True)
     assigned_by: UUID = Field(foreign_key="users.id", index=True)
     created_at: datetime = Field(default_factory=utcnow)
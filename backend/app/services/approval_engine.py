@@ -46,6 +46,8 @@ _PROPOSAL_TYPE_BASE_RISK: dict[str, str] = {
 }
 
 _RISK_LEVEL_ORDER = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+# Payload keys checked against a zone's resource_scope for resource_allocation proposals.
+_RESOURCE_SCOPE_KEYS = ("budget_amount", "board_id", "agent_type")
 
 
 def compute_risk_level(*, zone: TrustZone, proposal: Proposal) -> str:
@@ -117,15 +119,20 @@ async def create_proposal(
     organization_id: UUID,
     proposer_id: UUID,
     payload: ProposalCreate,
+    zone: TrustZone | None = None,
 ) -> Proposal:
-    """Create a proposal and select initial reviewers."""
+    """Create a proposal and select initial reviewers.
+
+    Callers that already loaded the target zone can pass it in to skip the lookup.
+    """
     if payload.proposal_type not in VALID_PROPOSAL_TYPES:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"Invalid proposal_type. Must be one of: {', '.join(sorted(VALID_PROPOSAL_TYPES))}",
         )
 
-    zone = await TrustZone.objects.by_id(payload.zone_id).first(session)
+    if zone is None or zone.id != payload.zone_id:
+        zone = await TrustZone.objects.by_id(payload.zone_id).first(session)
     if zone is None or zone.organization_id != organization_id:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -134,16 +141,11 @@ async def create_proposal(
 
     # Validate resource scope for resource_allocation proposals
     if payload.proposal_type == "resource_allocation" and payload.payload:
-        resource_ctx: dict[str, object] = {}
-        budget_amount = payload.payload.get("budget_amount")
-        if budget_amount is not None:
-            resource_ctx["budget_amount"] = budget_amount
-        board_id = payload.payload.get("board_id")
-        if board_id is not None:
-            resource_ctx["board_id"] = board_id
-        agent_type = payload.payload.get("agent_type")
-        if agent_type is not None:
-            resource_ctx["agent_type"] = agent_type
+        resource_ctx: dict[str, object] = {
+            key: value
+            for key in _RESOURCE_SCOPE_KEYS
+            if (value := payload.payload.get(key)) is not None
+        }
         if resource_ctx:
             allowed, reason = check_resource_scope(zone, resource_ctx)
             if not allowed:
@@ -348,8 +350,13 @@ async def record_decision(
     reviewer_id: UUID,
     decision: str,
     rationale: str = "",
+    commit: bool = True,
 ) -> ApprovalRequest:
-    """Record a reviewer's decision on a proposal."""
+    """Record a reviewer's decision on a proposal.
+
+    Pass `commit=False` to leave the transaction open so callers can add related
+    writes (such as the audit entry) and commit them together.
+    """
     requests = await ApprovalRequest.objects.filter_by(
         proposal_id=proposal.id,
         reviewer_id=reviewer_id,
@@ -377,8 +384,9 @@ async def record_decision(
     # Evaluate decision model
     await _evaluate_and_resolve(session, proposal=proposal)
 
-    await session.commit()
-    await session.refresh(request)
+    if commit:
+        await session.commit()
+        await session.refresh(request)
     return request
 
 
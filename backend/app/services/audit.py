@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.logging import get_logger
 from app.core.time import utcnow
+from app.db.session import async_session_maker
 from app.models.audit_entries import AuditEntry
 
 if TYPE_CHECKING:
@@ -12,6 +16,8 @@ if TYPE_CHECKING:
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+logger = get_logger(__name__)
+
 
 async def record_audit(
     session: AsyncSession,
@@ -43,3 +49,36 @@ async def record_audit(
         await session.commit()
         await session.refresh(entry)
     return entry
+
+
+async def record_audit_in_new_session(
+    *,
+    organization_id: UUID,
+    actor_id: UUID,
+    actor_type: str,
+    action: str,
+    zone_id: UUID | None = None,
+    target_type: str = "",
+    target_id: UUID | None = None,
+    payload: dict[str, object] | None = None,
+) -> None:
+    """Write an audit entry on its own session.
+
+    Intended for FastAPI `BackgroundTasks`, which run after the response is sent
+    and the request session has been closed.
+    """
+    try:
+        async with async_session_maker() as session:
+            await record_audit(
+                session,
+                organization_id=organization_id,
+                actor_id=actor_id,
+                actor_type=actor_type,
+                action=action,
+                zone_id=zone_id,
+                target_type=target_type,
+                target_id=target_id,
+                payload=payload,
+            )
+    except SQLAlchemyError:
+        logger.exception("Failed to record background audit entry for %s", action)
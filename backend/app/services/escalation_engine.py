@@ -34,12 +34,17 @@ async def create_action_escalation(
     escalator_id: UUID,
     proposal_id: UUID,
     reason: str = "",
+    proposal: Proposal | None = None,
+    zone: TrustZone | None = None,
 ) -> Escalation:
     """Create an action escalation from a proposal to its parent zone.
 
     Pauses the original proposal and creates a new proposal in the parent zone.
+    Callers that already loaded the proposal and its zone can pass them in to
+    skip the lookups.
     """
-    proposal = await Proposal.objects.by_id(proposal_id).first(session)
+    if proposal is None or proposal.id != proposal_id:
+        proposal = await Proposal.objects.by_id(proposal_id).first(session)
     if proposal is None or proposal.organization_id != organization_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -52,7 +57,8 @@ async def create_action_escalation(
             detail="Only pending proposals can be escalated",
         )
 
-    zone = await TrustZone.objects.by_id(proposal.zone_id).first(session)
+    if zone is None or zone.id != proposal.zone_id:
+        zone = await TrustZone.objects.by_id(proposal.zone_id).first(session)
     if zone is None:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -167,12 +173,15 @@ async def create_governance_escalation(
     escalator_id: UUID,
     zone_id: UUID,
     reason: str = "",
+    zone: TrustZone | None = None,
 ) -> Escalation:
     """Create a governance escalation on a zone.
 
-    Governance escalations require co-signers before activation.
+    Governance escalations require co-signers before activation. Callers that
+    already loaded the zone can pass it in to skip the lookup.
     """
-    zone = await TrustZone.objects.by_id(zone_id).first(session)
+    if zone is None or zone.id != zone_id:
+        zone = await TrustZone.objects.by_id(zone_id).first(session)
     if zone is None or zone.organization_id != organization_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -260,11 +269,13 @@ async def add_cosigner(
     *,
     escalation: Escalation,
     user_id: UUID,
+    zone: TrustZone | None = None,
 ) -> EscalationCosigner:
     """Add a co-signer to a governance escalation.
 
     If the co-signer threshold is met, activates the escalation
-    by creating a meta-proposal in the parent zone.
+    by creating a meta-proposal in the parent zone. `zone` is the escalation's
+    source zone when the caller already has it loaded.
     """
     if escalation.escalation_type != "governance":
         raise HTTPException(
@@ -303,7 +314,8 @@ async def add_cosigner(
     ).all(session)
     cosigner_count = len(all_cosigners) + 1  # include the one just added
 
-    zone = await TrustZone.objects.by_id(escalation.source_zone_id).first(session)
+    if zone is None or zone.id != escalation.source_zone_id:
+        zone = await TrustZone.objects.by_id(escalation.source_zone_id).first(session)
     required = _get_cosigner_threshold(zone)
 
     if cosigner_count >= required:
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable
 from typing import TYPE_CHECKING
 
 from fastapi import HTTPException, status
 
 from uuid import UUID
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.models.evaluations import Evaluation, EvaluationScore, IncentiveSignal
@@ -20,6 +23,9 @@ from app.services.governance_notifications.queue import GovernanceNotification,
 logger = get_logger(__name__)
 
 SYSTEM_EVALUATOR_ID = UUID("00000000-0000-0000-0000-000000000000")
+# Caps in-flight Anthropic requests per process so long criteria lists don't burst
+# the provider's rate limit.
+_LLM_REVIEW_SEMAPHORE = asyncio.Semaphore(settings.auto_evaluate_llm_concurrency)
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,15 +41,17 @@ async def create_evaluation(
     payload: EvaluationCreate,
 ) -> Evaluation:
     """Create a new evaluation for a completed task or proposal."""
-    zone = await TrustZone.objects.by_id(payload.zone_id).first(session)
-    if zone is None or zone.organization_id != organization_id:
+    zone_in_org = await TrustZone.objects.filter_by(
+        id=payload.zone_id,
+        organization_id=organization_id,
+    ).exists(session)
+    if not zone_in_org:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Zone not found in organization",
         )
 
-    user = await User.objects.by_id(payload.executor_id).first(session)
-    if user is None:
+    if not await User.objects.by_id(payload.executor_id).exists(session):
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="executor_id must reference a valid user ID",
@@ -437,9 +445,7 @@ async def _run_llm_review(
     try:
         import anthropic
 
-        from app.core.config import settings
-
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
 
         context = (
             f"Evaluation ID: {evaluation.id}\n"
@@ -449,20 +455,21 @@ async def _run_llm_review(
             f"Task ID: {evaluation.task_id or 'N/A'}\n"
         )
 
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=512,
-            messages=[
-                {
-                    "role": "user",
-                    "content": (
-                        f"{prompt}\n\n"
-                        f"Context:\n{context}\n\n"
-                        "Respond with a JSON object: {\"score\": <0.0-1.0>, \"rationale\": \"<explanation>\"}"
-                    ),
-                }
-            ],
-        )
+        async with _LLM_REVIEW_SEMAPHORE:
+            message = await client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=512,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": (
+                            f"{prompt}\n\n"
+                            f"Context:\n{context}\n\n"
+                            "Respond with a JSON object: {\"score\": <0.0-1.0>, \"rationale\": \"<explanation>\"}"
+                        ),
+                    }
+                ],
+            )
 
         import json
 
@@ -481,6 +488,11 @@ async def _run_llm_review(
         return 0.5, "LLM review failed"
 
 
+async def _completed(result: tuple[float, str]) -> tuple[float, str]:
+    """Wrap an already-computed review so it can be gathered with LLM reviews."""
+    return result
+
+
 async def auto_evaluate(
     session: AsyncSession,
     evaluation: Evaluation,
@@ -506,7 +518,13 @@ async def auto_evaluate(
     if not isinstance(criteria_list, list):
         return []
 
-    created_scores: list[EvaluationScore] = []
+    # Resolve every criterion first so LLM reviews run concurrently instead of
+    # one round-trip per criterion; scores are then submitted sequentially on
+    # the shared session. Review coroutines are only created once every name and
+    # weight has parsed, so a malformed criterion cannot strand un-awaited ones.
+    names: list[str] = []
+    weights: list[float] = []
+    resolved: list[tuple[str, dict[str, object]]] = []
 
     for criterion in criteria_list:
         if not isinstance(criterion, dict):
@@ -514,16 +532,29 @@ async def auto_evaluate(
 
         criterion_type = criterion.get("type")
         name = str(criterion.get("name", "unnamed"))
-        weight = float(criterion.get("weight", 1.0))
 
-        if criterion_type == "automated_check":
-            score_val, rationale = _run_automated_check(criterion, evaluation, zone)
-        elif criterion_type == "llm_review":
-            score_val, rationale = await _run_llm_review(criterion, evaluation, zone)
-        else:
+        if criterion_type not in ("automated_check", "llm_review"):
             logger.warning("Unknown criterion type '%s' for criterion '%s'", criterion_type, name)
             continue
 
+        weight = float(criterion.get("weight", 1.0))
+        names.append(name)
+        weights.append(weight)
+        resolved.append((str(criterion_type), criterion))
+
+    reviews: list[Awaitable[tuple[float, str]]] = [
+        (
+            _completed(_run_automated_check(criterion, evaluation, zone))
+            if criterion_type == "automated_check"
+            else _run_llm_review(criterion, evaluation, zone)
+        )
+        for criterion_type, criterion in resolved
+    ]
+
+    results = await asyncio.gather(*reviews)
+    created_scores: list[EvaluationScore] = []
+
+    for name, weight, (score_val, rationale) in zip(names, weights, results):
         score_payload = EvaluationScoreCreate(
             criterion_name=name,
             criterion_weight=weight,
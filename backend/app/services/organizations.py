@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -69,6 +69,12 @@ class OrganizationContext:
 
     organization: Organization
     member: OrganizationMember
+    # Request-scoped memo of zone permission checks keyed by (member, zone, action).
+    permission_cache: dict[tuple[UUID, UUID, str], bool] = field(
+        default_factory=dict,
+        compare=False,
+        repr=False,
+    )
 
 
 def is_org_admin(member: OrganizationMember) -> bool:
@@ -143,7 +149,7 @@ async def get_active_membership(
     user: User,
 ) -> OrganizationMember | None:
     """Resolve and normalize the user's currently active membership."""
-    db_user = await User.objects.by_id(user.id).first(session)
+    db_user = await session.get(User, user.id)
     if db_user is None:
         db_user = user
     if db_user.active_organization_id:
@@ -184,6 +190,34 @@ async def _find_pending_invite(
     )
 
 
+async def mark_invite_accepted(
+    session: AsyncSession,
+    *,
+    invite: OrganizationInvite,
+    user_id: UUID,
+    accepted_at: datetime,
+) -> bool:
+    """Stamp a pending invite as accepted in one guarded UPDATE.
+
+    Returns `False` when another request accepted the invite first.
+    """
+    claimed = await crud.update_where(
+        session,
+        OrganizationInvite,
+        col(OrganizationInvite.id) == invite.id,
+        col(OrganizationInvite.accepted_at).is_(None),
+        accepted_by_user_id=user_id,
+        accepted_at=accepted_at,
+        updated_at=accepted_at,
+    )
+    if claimed != 1:
+        return False
+    invite.accepted_by_user_id = user_id
+    invite.accepted_at = accepted_at
+    invite.updated_at = accepted_at
+    return True
+
+
 async def accept_invite(
     session: AsyncSession,
     invite: OrganizationInvite,
@@ -191,6 +225,13 @@ async def accept_invite(
 ) -> OrganizationMember:
     """Accept an invite and create membership plus scoped board access rows."""
     now = utcnow()
+    if not await mark_invite_accepted(
+        session,
+        invite=invite,
+        user_id=user.id,
+        accepted_at=now,
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     member = OrganizationMember(
         organization_id=invite.organization_id,
         user_id=user.id,
@@ -225,10 +266,6 @@ async def accept_invite(
                 ),
             )
 
-    invite.accepted_by_user_id = user.id
-    invite.accepted_at = now
-    invite.updated_at = now
-    session.add(invite)
     if user.active_organization_id is None:
         user.active_organization_id = invite.organization_id
         session.add(user)
@@ -592,15 +629,21 @@ async def apply_invite_to_member(
             ),
         ),
     )
-    for row in access_rows:
-        existing = (
-            await session.exec(
+    existing_by_board: dict[UUID, OrganizationBoardAccess] = {}
+    if access_rows:
+        existing_by_board = {
+            access.board_id: access
+            for access in await session.exec(
                 select(OrganizationBoardAccess).where(
                     col(OrganizationBoardAccess.organization_member_id) == member.id,
-                    col(OrganizationBoardAccess.board_id) == row.board_id,
+                    col(OrganizationBoardAccess.board_id).in_(
+                        [row.board_id for row in access_rows],
+                    ),
                 ),
             )
-        ).first()
+        }
+    for row in access_rows:
+        existing = existing_by_board.get(row.board_id)
         can_write = bool(row.can_write)
         can_read = bool(row.can_read or row.can_write)
         if existing is None:
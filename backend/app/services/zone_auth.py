@@ -18,6 +18,27 @@ if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
 
 
+async def resolve_zone_permission_cached(
+    session: AsyncSession,
+    *,
+    org_ctx: OrganizationContext,
+    zone: TrustZone,
+    action: str,
+) -> bool:
+    """Resolve a zone permission at most once per request for the active member."""
+    key = (org_ctx.member.id, zone.id, action)
+    allowed = org_ctx.permission_cache.get(key)
+    if allowed is None:
+        allowed = await resolve_zone_permission(
+            session,
+            member=org_ctx.member,
+            zone=zone,
+            action=action,
+        )
+        org_ctx.permission_cache[key] = allowed
+    return allowed
+
+
 @dataclass(frozen=True)
 class ZoneAuthContext:
     """Resolved zone + organization context after permission check."""
@@ -48,9 +69,9 @@ def require_zone_permission(action: str) -> ZoneAuthContext:  # type: ignore[ret
         if zone.organization_id != org_ctx.organization.id:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
 
-        allowed = await resolve_zone_permission(
+        allowed = await resolve_zone_permission_cached(
             session,
-            member=org_ctx.member,
+            org_ctx=org_ctx,
             zone=zone,
             action=action,
         )
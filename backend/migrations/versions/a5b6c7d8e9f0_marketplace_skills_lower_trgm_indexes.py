@@ -0,0 +1,49 @@
+"""Rebuild the marketplace skill trigram indexes on lower(column).
+
+Revision ID: a5b6c7d8e9f0
+Revises: f4a5b6c7d8e9
+Create Date: 2026-10-17 00:00:06.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a5b6c7d8e9f0"
+down_revision: Union[str, None] = "f4a5b6c7d8e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ("name", "description", "category", "risk", "source")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f"ix_marketplace_skills_{column}_trgm", table_name="marketplace_skills")
+        op.create_index(
+            f"ix_marketplace_skills_{column}_lower_trgm",
+            "marketplace_skills",
+            [sa.text(f"lower({column}) gin_trgm_ops")],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in SEARCH_COLUMNS:
+        op.drop_index(
+            f"ix_marketplace_skills_{column}_lower_trgm",
+            table_name="marketplace_skills",
+        )
+        op.create_index(
+            f"ix_marketplace_skills_{column}_trgm",
+            "marketplace_skills",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
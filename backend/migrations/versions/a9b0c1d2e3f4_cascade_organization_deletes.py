@@ -0,0 +1,87 @@
+"""Cascade organization-owned rows at the database level.
+
+Revision ID: a9b0c1d2e3f4
+Revises: f8a9b0c1d2e3
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9b0c1d2e3f4"
+down_revision: Union[str, None] = "f8a9b0c1d2e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referred table, ON DELETE action)
+_CASCADES: tuple[tuple[str, str, str, str], ...] = (
+    ("boards", "organization_id", "organizations", "CASCADE"),
+    ("board_groups", "organization_id", "organizations", "CASCADE"),
+    ("gateways", "organization_id", "organizations", "CASCADE"),
+    ("organization_invites", "organization_id", "organizations", "CASCADE"),
+    ("organization_members", "organization_id", "organizations", "CASCADE"),
+    ("users", "active_organization_id", "organizations", "SET NULL"),
+    ("tasks", "board_id", "boards", "CASCADE"),
+    ("agents", "board_id", "boards", "CASCADE"),
+    ("approvals", "board_id", "boards", "CASCADE"),
+    ("task_dependencies", "board_id", "boards", "CASCADE"),
+    ("task_fingerprints", "board_id", "boards", "CASCADE"),
+    ("board_memory", "board_id", "boards", "CASCADE"),
+    ("board_webhook_payloads", "board_id", "boards", "CASCADE"),
+    ("board_webhooks", "board_id", "boards", "CASCADE"),
+    ("board_onboarding_sessions", "board_id", "boards", "CASCADE"),
+    ("organization_board_access", "board_id", "boards", "CASCADE"),
+    ("organization_board_access", "organization_member_id", "organization_members", "CASCADE"),
+    ("organization_invite_board_access", "board_id", "boards", "CASCADE"),
+    (
+        "organization_invite_board_access",
+        "organization_invite_id",
+        "organization_invites",
+        "CASCADE",
+    ),
+    ("board_group_memory", "board_group_id", "board_groups", "CASCADE"),
+    ("activity_events", "task_id", "tasks", "CASCADE"),
+    ("activity_events", "agent_id", "agents", "CASCADE"),
+    ("approval_task_links", "approval_id", "approvals", "CASCADE"),
+)
+
+
+def _foreign_key_name(table: str, column: str, referred_table: str) -> str | None:
+    inspector = sa.inspect(op.get_bind())
+    for fk in inspector.get_foreign_keys(table):
+        if fk["constrained_columns"] == [column] and fk["referred_table"] == referred_table:
+            return fk["name"]
+    return None
+
+
+def _replace_foreign_key(
+    table: str,
+    column: str,
+    referred_table: str,
+    ondelete: str | None,
+) -> None:
+    # Constraint names differ between autogenerated and explicit revisions, so look them up.
+    existing = _foreign_key_name(table, column, referred_table)
+    if existing is not None:
+        op.drop_constraint(existing, table, type_="foreignkey")
+    op.create_foreign_key(
+        existing or f"fk_{table}_{column}_{referred_table}",
+        table,
+        referred_table,
+        [column],
+        ["id"],
+        ondelete=ondelete,
+    )
+
+
+def upgrade() -> None:
+    for table, column, referred_table, ondelete in _CASCADES:
+        _replace_foreign_key(table, column, referred_table, ondelete)
+
+
+def downgrade() -> None:
+    for table, column, referred_table, _ondelete in reversed(_CASCADES):
+        _replace_foreign_key(table, column, referred_table, None)
@@ -0,0 +1,27 @@
+"""Add functional lower() indexes for organization names and user emails.
+
+Revision ID: b0c1d2e3f4a5
+Revises: a9b0c1d2e3f4
+Create Date: 2026-10-17 00:00:01.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b0c1d2e3f4a5"
+down_revision: Union[str, None] = "a9b0c1d2e3f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_organizations_name_lower", "organizations", [sa.text("lower(name)")])
+    op.create_index("ix_users_email_lower", "users", [sa.text("lower(email)")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_email_lower", table_name="users")
+    op.drop_index("ix_organizations_name_lower", table_name="organizations")
@@ -0,0 +1,46 @@
+"""Add generated uncategorized flags and partial indexes to marketplace skills.
+
+Revision ID: b6c7d8e9f0a1
+Revises: a5b6c7d8e9f0
+Create Date: 2026-10-17 00:00:07.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6c7d8e9f0a1"
+down_revision: Union[str, None] = "a5b6c7d8e9f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FLAGGED_COLUMNS = ("category", "risk")
+
+
+def upgrade() -> None:
+    for column in FLAGGED_COLUMNS:
+        op.add_column(
+            "marketplace_skills",
+            sa.Column(
+                f"{column}_is_uncategorized",
+                sa.Boolean(),
+                sa.Computed(f"{column} IS NULL OR trim({column}) = ''", persisted=True),
+            ),
+        )
+        op.create_index(
+            f"ix_marketplace_skills_org_uncategorized_{column}",
+            "marketplace_skills",
+            ["organization_id", "created_at"],
+            postgresql_where=sa.text(f"{column}_is_uncategorized IS TRUE"),
+        )
+
+
+def downgrade() -> None:
+    for column in FLAGGED_COLUMNS:
+        op.drop_index(
+            f"ix_marketplace_skills_org_uncategorized_{column}",
+            table_name="marketplace_skills",
+        )
+        op.drop_column("marketplace_skills", f"{column}_is_uncategorized")
@@ -0,0 +1,38 @@
+"""Replace the full invite token index with a partial index on pending invites.
+
+Revision ID: c1d2e3f4a5b6
+Revises: b0c1d2e3f4a5
+Create Date: 2026-10-17 00:00:02.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c1d2e3f4a5b6"
+down_revision: Union[str, None] = "b0c1d2e3f4a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # uq_org_invites_token already indexes every token; the plain index duplicated it.
+    op.drop_index("ix_organization_invites_token", table_name="organization_invites")
+    op.create_index(
+        "ix_organization_invites_pending_token",
+        "organization_invites",
+        ["token"],
+        postgresql_where=sa.text("accepted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_organization_invites_pending_token", table_name="organization_invites")
+    op.create_index(
+        "ix_organization_invites_token",
+        "organization_invites",
+        ["token"],
+        unique=False,
+    )
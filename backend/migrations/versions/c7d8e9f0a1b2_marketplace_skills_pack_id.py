@@ -0,0 +1,64 @@
+"""Link marketplace skills to the pack that synced them.
+
+Revision ID: c7d8e9f0a1b2
+Revises: b6c7d8e9f0a1
+Create Date: 2026-10-17 00:00:08.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d8e9f0a1b2"
+down_revision: Union[str, None] = "b6c7d8e9f0a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("marketplace_skills", sa.Column("pack_id", sa.Uuid(), nullable=True))
+    op.create_foreign_key(
+        "fk_marketplace_skills_pack_id_skill_packs",
+        "marketplace_skills",
+        "skill_packs",
+        ["pack_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index(
+        "ix_marketplace_skills_org_pack_id",
+        "marketplace_skills",
+        ["organization_id", "pack_id"],
+    )
+    # Backfill from the URL prefix the pack filter used to match on; the longest pack URL
+    # wins when one repository URL is a prefix of another. `_` and `%` are legal in repo
+    # URLs, so the pack URL is escaped before it becomes a LIKE pattern.
+    op.execute(
+        r"""
+        UPDATE marketplace_skills
+        SET pack_id = (
+            SELECT skill_packs.id
+            FROM skill_packs
+            WHERE skill_packs.organization_id = marketplace_skills.organization_id
+              AND lower(marketplace_skills.source_url) LIKE replace(
+                  replace(replace(lower(skill_packs.source_url), '\', '\\'), '%', '\%'),
+                  '_',
+                  '\_'
+              ) || '/%' ESCAPE '\'
+            ORDER BY length(skill_packs.source_url) DESC
+            LIMIT 1
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_marketplace_skills_org_pack_id", table_name="marketplace_skills")
+    op.drop_constraint(
+        "fk_marketplace_skills_pack_id_skill_packs",
+        "marketplace_skills",
+        type_="foreignkey",
+    )
+    op.drop_column("marketplace_skills", "pack_id")
@@ -0,0 +1,28 @@
+"""Add a composite organization/status index for proposal listings.
+
+Revision ID: d2e3f4a5b6c7
+Revises: c1d2e3f4a5b6
+Create Date: 2026-10-17 00:00:03.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2e3f4a5b6c7"
+down_revision: Union[str, None] = "c1d2e3f4a5b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_proposals_org_status_created",
+        "proposals",
+        ["organization_id", "status", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_proposals_org_status_created", table_name="proposals")
@@ -0,0 +1,93 @@
+"""Cascade the remaining organization-owned tables at the database level.
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-17 00:00:09.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8e9f0a1b2c3"
+down_revision: Union[str, None] = "c7d8e9f0a1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referred table, ON DELETE action)
+_CASCADES: tuple[tuple[str, str, str, str], ...] = (
+    ("task_custom_field_definitions", "organization_id", "organizations", "CASCADE"),
+    ("tags", "organization_id", "organizations", "CASCADE"),
+    ("marketplace_skills", "organization_id", "organizations", "CASCADE"),
+    ("skill_packs", "organization_id", "organizations", "CASCADE"),
+    ("trust_zones", "organization_id", "organizations", "CASCADE"),
+    ("proposals", "organization_id", "organizations", "CASCADE"),
+    ("escalations", "organization_id", "organizations", "CASCADE"),
+    ("evaluations", "organization_id", "organizations", "CASCADE"),
+    ("audit_entries", "organization_id", "organizations", "CASCADE"),
+    ("board_task_custom_fields", "board_id", "boards", "CASCADE"),
+    (
+        "board_task_custom_fields",
+        "task_custom_field_definition_id",
+        "task_custom_field_definitions",
+        "CASCADE",
+    ),
+    ("task_custom_field_values", "task_id", "tasks", "CASCADE"),
+    (
+        "task_custom_field_values",
+        "task_custom_field_definition_id",
+        "task_custom_field_definitions",
+        "CASCADE",
+    ),
+    ("tag_assignments", "task_id", "tasks", "CASCADE"),
+    ("tag_assignments", "tag_id", "tags", "CASCADE"),
+    ("gateway_installed_skills", "gateway_id", "gateways", "CASCADE"),
+    ("gateway_installed_skills", "skill_id", "marketplace_skills", "CASCADE"),
+    ("zone_assignments", "zone_id", "trust_zones", "CASCADE"),
+    ("zone_assignments", "member_id", "organization_members", "CASCADE"),
+    ("approval_requests", "proposal_id", "proposals", "CASCADE"),
+    ("gardener_feedback", "proposal_id", "proposals", "CASCADE"),
+    ("escalation_cosigners", "escalation_id", "escalations", "CASCADE"),
+    ("evaluation_scores", "evaluation_id", "evaluations", "CASCADE"),
+    ("incentive_signals", "evaluation_id", "evaluations", "CASCADE"),
+)
+
+
+def _foreign_key_name(table: str, column: str, referred_table: str) -> str | None:
+    inspector = sa.inspect(op.get_bind())
+    for fk in inspector.get_foreign_keys(table):
+        if fk["constrained_columns"] == [column] and fk["referred_table"] == referred_table:
+            return fk["name"]
+    return None
+
+
+def _replace_foreign_key(
+    table: str,
+    column: str,
+    referred_table: str,
+    ondelete: str | None,
+) -> None:
+    # Constraint names differ between autogenerated and explicit revisions, so look them up.
+    existing = _foreign_key_name(table, column, referred_table)
+    if existing is not None:
+        op.drop_constraint(existing, table, type_="foreignkey")
+    op.create_foreign_key(
+        existing or f"fk_{table}_{column}_{referred_table}",
+        table,
+        referred_table,
+        [column],
+        ["id"],
+        ondelete=ondelete,
+    )
+
+
+def upgrade() -> None:
+    for table, column, referred_table, ondelete in _CASCADES:
+        _replace_foreign_key(table, column, referred_table, ondelete)
+
+
+def downgrade() -> None:
+    for table, column, referred_table, _ondelete in reversed(_CASCADES):
+        _replace_foreign_key(table, column, referred_table, None)
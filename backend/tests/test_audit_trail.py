@@ -9,7 +9,8 @@ from uuid import uuid4
 import pytest
 
 from app.models.audit_entries import AuditEntry
-from app.services.audit import record_audit
+from app.services import audit
+from app.services.audit import record_audit, record_audit_in_new_session
 
 
 @dataclass
@@ -95,6 +96,38 @@ async def test_record_audit_defaults() -> None:
     assert entry.payload is None
 
 
+@pytest.mark.asyncio
+async def test_record_audit_in_new_session_uses_dedicated_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _FakeSession()
+    opened: list[_FakeSession] = []
+
+    class _SessionFactory:
+        async def __aenter__(self) -> _FakeSession:
+            opened.append(session)
+            return session
+
+        async def __aexit__(self, *_args: object) -> None:
+            return None
+
+    monkeypatch.setattr(audit, "async_session_maker", _SessionFactory)
+    org_id = uuid4()
+
+    await record_audit_in_new_session(
+        organization_id=org_id,
+        actor_id=uuid4(),
+        actor_type="human",
+        action="escalation.cosign",
+    )
+
+    assert opened == [session]
+    assert len(session.added) == 1
+    assert session.added[0].organization_id == org_id
+    assert session.added[0].action == "escalation.cosign"
+    assert session.committed == 1
+
+
 def test_audit_entry_model_has_no_updated_at() -> None:
     """Audit entries are append-only and should not have updated_at."""
     entry = AuditEntry(
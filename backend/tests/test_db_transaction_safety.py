@@ -142,3 +142,71 @@ async def test_delete_where_rolls_back_when_commit_fails() -> None:
 
     assert session.exec_calls == 1
     assert session.rollback_calls == 1
+
+
+def test_engine_options_bound_pool_for_server_databases() -> None:
+    options = db_session._engine_options("postgresql+psycopg://u:p@localhost/db")
+
+    assert options["pool_pre_ping"] is True
+    assert options["pool_size"] == db_session.settings.db_pool_size
+    assert options["max_overflow"] == db_session.settings.db_max_overflow
+    assert options["pool_timeout"] == db_session.settings.db_pool_timeout
+    assert options["pool_recycle"] == db_session.settings.db_pool_recycle_seconds
+    assert options["query_cache_size"] == db_session.settings.db_query_cache_size
+    assert db_session._engine_options("sqlite+aiosqlite:///:memory:") == {
+        "pool_pre_ping": True,
+        "query_cache_size": db_session.settings.db_query_cache_size,
+    }
+
+
+def test_engine_options_defer_to_external_pooler(monkeypatch: pytest.MonkeyPatch) -> None:
+    from sqlalchemy.pool import NullPool
+
+    monkeypatch.setattr(db_session.settings, "db_external_pooler", True)
+
+    options = db_session._engine_options("postgresql+psycopg://u:p@localhost/db")
+
+    assert options == {
+        "pool_pre_ping": True,
+        "query_cache_size": db_session.settings.db_query_cache_size,
+        "poolclass": NullPool,
+    }
+
+
+def test_api_session_dependencies_share_one_cached_callable() -> None:
+    from fastapi.params import Depends
+
+    from app.api import deps, escalations, evaluations, proposals
+    from app.services import zone_auth
+
+    for module in (deps, escalations, evaluations, proposals):
+        assert isinstance(module.SESSION_DEP, Depends)
+        assert module.SESSION_DEP.dependency is db_session.get_session
+        assert module.SESSION_DEP.use_cache is True
+    assert zone_auth.get_session is db_session.get_session
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_opens_distinct_connections(tmp_path) -> None:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}")
+    try:
+        await db_session.warm_pool(engine, connections=3)
+        assert engine.pool.checkedin() == 3
+
+        await db_session.warm_pool(engine, connections=0)
+        assert engine.pool.checkedin() == 3
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_tolerates_unreachable_database(tmp_path) -> None:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'warm.db'}")
+    try:
+        await db_session.warm_pool(engine, connections=2)
+    finally:
+        await engine.dispose()
@@ -0,0 +1,266 @@
+# ruff: noqa
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import escalations
+from app.models.approvals import Approval  # noqa: F401 – FK target for proposals.legacy_approval_id
+from app.models.escalations import Escalation, EscalationCosigner
+from app.models.organizations import Organization
+from app.models.proposals import Proposal
+from app.models.trust_zones import TrustZone
+from app.models.users import User
+from app.services.escalation_engine import add_cosigner, create_governance_escalation
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(session: AsyncSession) -> tuple[Organization, User, TrustZone, TrustZone]:
+    org = Organization(name="test-org")
+    user = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="test@example.com")
+    session.add(org)
+    session.add(user)
+    await session.flush()
+    parent = TrustZone(organization_id=org.id, name="parent", slug="parent", created_by=user.id)
+    session.add(parent)
+    await session.flush()
+    child = TrustZone(
+        organization_id=org.id,
+        parent_zone_id=parent.id,
+        name="child",
+        slug="child",
+        created_by=user.id,
+    )
+    session.add(child)
+    await session.flush()
+    return org, user, parent, child
+
+
+@pytest.mark.asyncio
+async def test_get_proposal_with_zone_returns_both_rows() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, user, _parent, child = await _seed(session)
+            proposal = Proposal(
+                organization_id=org.id,
+                zone_id=child.id,
+                proposer_id=user.id,
+                title="p",
+                proposal_type="task_execution",
+            )
+            session.add(proposal)
+            await session.commit()
+
+            loaded, zone = await escalations._get_proposal_with_zone_or_404(
+                session,
+                proposal_id=proposal.id,
+                organization_id=org.id,
+            )
+            assert loaded.id == proposal.id
+            assert zone.id == child.id
+
+            with pytest.raises(HTTPException) as exc:
+                await escalations._get_proposal_with_zone_or_404(
+                    session,
+                    proposal_id=proposal.id,
+                    organization_id=uuid4(),
+                )
+            assert exc.value.status_code == 404
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_escalation_with_zone_returns_source_zone() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, user, parent, child = await _seed(session)
+            escalation = Escalation(
+                organization_id=org.id,
+                escalation_type="governance",
+                source_zone_id=child.id,
+                target_zone_id=parent.id,
+                escalator_id=user.id,
+            )
+            session.add(escalation)
+            await session.commit()
+
+            loaded, zone = await escalations._get_escalation_with_zone_or_404(
+                session,
+                escalation_id=escalation.id,
+                organization_id=org.id,
+            )
+            assert loaded.id == escalation.id
+            assert zone.id == child.id
+
+            with pytest.raises(HTTPException) as exc:
+                await escalations._get_escalation_with_zone_or_404(
+                    session,
+                    escalation_id=uuid4(),
+                    organization_id=org.id,
+                )
+            assert exc.value.status_code == 404
+    finally:
+        await engine.dispose()
+
+
+def test_escalation_list_adapter_validates_rows_in_one_pass() -> None:
+    rows = [
+        Escalation(
+            organization_id=uuid4(),
+            escalation_type=etype,
+            source_zone_id=uuid4(),
+            target_zone_id=uuid4(),
+            escalator_id=uuid4(),
+        )
+        for etype in ("action", "governance")
+    ]
+
+    result = escalations._ESCALATION_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+
+    assert [item.id for item in result] == [row.id for row in rows]
+    assert all(item.cosigners == [] for item in result)
+
+
+def test_escalation_to_read_constructs_response_with_cosigners() -> None:
+    escalation = Escalation(
+        organization_id=uuid4(),
+        escalation_type="governance",
+        source_zone_id=uuid4(),
+        target_zone_id=uuid4(),
+        escalator_id=uuid4(),
+        reason="policy drift",
+    )
+    cosigner = EscalationCosigner(escalation_id=escalation.id, user_id=uuid4())
+
+    read = escalations._escalation_to_read(escalation, [cosigner])
+    bare = escalations._escalation_to_read(escalation)
+
+    assert read.id == escalation.id
+    assert read.reason == "policy drift"
+    assert [c.user_id for c in read.cosigners] == [cosigner.user_id]
+    assert bare.cosigners == []
+    assert read.model_dump(mode="json")["cosigners"][0]["id"] == str(cosigner.id)
+
+
+@pytest.mark.asyncio
+async def test_governance_escalation_accepts_preloaded_zone() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, user, parent, child = await _seed(session)
+            child.escalation_policy = {"cosigner_threshold": 2}
+            other = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="other@example.com")
+            session.add(other)
+            await session.commit()
+
+            escalation = await create_governance_escalation(
+                session,
+                organization_id=org.id,
+                escalator_id=user.id,
+                zone_id=child.id,
+                zone=child,
+            )
+            assert escalation.source_zone_id == child.id
+            assert escalation.target_zone_id == parent.id
+
+            await add_cosigner(session, escalation=escalation, user_id=other.id, zone=child)
+
+            assert escalation.status == "accepted"
+            assert escalation.resulting_proposal_id is not None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_escalation_with_cosigners_loads_in_one_query() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, user, parent, child = await _seed(session)
+            bare = Escalation(
+                organization_id=org.id,
+                escalation_type="governance",
+                source_zone_id=child.id,
+                target_zone_id=parent.id,
+                escalator_id=user.id,
+            )
+            signed = Escalation(
+                organization_id=org.id,
+                escalation_type="governance",
+                source_zone_id=child.id,
+                target_zone_id=parent.id,
+                escalator_id=user.id,
+            )
+            other = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="other@example.com")
+            session.add_all([bare, signed, other])
+            await session.flush()
+            session.add_all(
+                [
+                    EscalationCosigner(escalation_id=signed.id, user_id=user.id),
+                    EscalationCosigner(escalation_id=signed.id, user_id=other.id),
+                ],
+            )
+            await session.commit()
+
+            loaded, cosigners = await escalations._get_escalation_with_cosigners_or_404(
+                session,
+                escalation_id=signed.id,
+                organization_id=org.id,
+            )
+            assert loaded.id == signed.id
+            assert [c.user_id for c in cosigners] == [user.id, other.id]
+
+            loaded, cosigners = await escalations._get_escalation_with_cosigners_or_404(
+                session,
+                escalation_id=bare.id,
+                organization_id=org.id,
+            )
+            assert loaded.id == bare.id
+            assert cosigners == []
+
+            with pytest.raises(HTTPException) as exc:
+                await escalations._get_escalation_with_cosigners_or_404(
+                    session,
+                    escalation_id=signed.id,
+                    organization_id=uuid4(),
+                )
+            assert exc.value.status_code == 404
+    finally:
+        await engine.dispose()
+
+
+def test_status_filter_statements_share_sql_cache_key() -> None:
+    from sqlmodel import col
+
+    from app.models.evaluations import Evaluation
+
+    # col() is a typing-only cast, so literal filter values become bound
+    # parameters and every status shares one compiled statement.
+    assert col(Escalation.status) is Escalation.status
+    for model in (Escalation, Evaluation):
+        pending = (
+            model.objects.filter_by(organization_id=uuid4())
+            .filter(col(model.status) == "pending")
+            .statement
+        )
+        other = (
+            model.objects.filter_by(organization_id=uuid4())
+            .filter(col(model.status) == "accepted")
+            .statement
+        )
+        assert pending._generate_cache_key() == other._generate_cache_key()
@@ -0,0 +1,406 @@
+# ruff: noqa
+
+from __future__ import annotations
+
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import evaluations
+from app.models.approvals import Approval  # noqa: F401 – FK target for proposals.legacy_approval_id
+from app.models.evaluations import Evaluation, EvaluationScore, IncentiveSignal
+from app.models.organizations import Organization
+from app.models.trust_zones import TrustZone
+from app.models.users import User
+
+
+async def _make_engine(tmp_path: Path) -> AsyncEngine:
+    # File-backed so independent sessions share the same database.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'evaluations.db'}")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_evaluation(session: AsyncSession) -> Evaluation:
+    org = Organization(name="test-org")
+    user = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="test@example.com")
+    session.add(org)
+    session.add(user)
+    await session.flush()
+    zone = TrustZone(organization_id=org.id, name="zone", slug="zone", created_by=user.id)
+    session.add(zone)
+    await session.flush()
+    evaluation = Evaluation(zone_id=zone.id, organization_id=org.id, executor_id=user.id)
+    session.add(evaluation)
+    await session.flush()
+    return evaluation
+
+
+@pytest.mark.asyncio
+async def test_load_scores_and_signals_reads_both_in_one_statement(tmp_path: Path) -> None:
+    engine = await _make_engine(tmp_path)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            evaluation = await _seed_evaluation(session)
+            other = await _seed_evaluation(session)
+            session.add(
+                EvaluationScore(
+                    evaluation_id=evaluation.id,
+                    evaluator_id=uuid4(),
+                    criterion_name="quality",
+                    score=0.9,
+                ),
+            )
+            session.add(
+                EvaluationScore(
+                    evaluation_id=other.id,
+                    evaluator_id=uuid4(),
+                    criterion_name="quality",
+                    score=0.1,
+                ),
+            )
+            session.add(
+                EvaluationScore(
+                    evaluation_id=evaluation.id,
+                    evaluator_id=uuid4(),
+                    criterion_name="speed",
+                    score=0.5,
+                ),
+            )
+            for signal_type in ("positive", "negative"):
+                session.add(
+                    IncentiveSignal(
+                        evaluation_id=evaluation.id,
+                        target_id=evaluation.executor_id,
+                        signal_type=signal_type,
+                    ),
+                )
+            await session.commit()
+
+            statements: list[str] = []
+
+            def _record(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+                statements.append(statement)
+
+            event.listen(engine.sync_engine, "before_cursor_execute", _record)
+            try:
+                scores, signals = await evaluations._load_scores_and_signals(session, evaluation.id)
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", _record)
+            empty_scores, empty_signals = await evaluations._load_scores_and_signals(
+                session, uuid4()
+            )
+
+        assert len(statements) == 1
+        assert sorted((s.criterion_name, s.score) for s in scores) == [
+            ("quality", 0.9),
+            ("speed", 0.5),
+        ]
+        assert sorted(s.signal_type for s in signals) == ["negative", "positive"]
+        assert empty_scores == []
+        assert empty_signals == []
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_scoring_load_skips_aggregate_column(tmp_path: Path) -> None:
+    from sqlalchemy import inspect
+
+    from app.schemas.evaluations import EvaluationScoreCreate
+    from app.services.evaluations import submit_score
+
+    engine = await _make_engine(tmp_path)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            seeded = await _seed_evaluation(session)
+            await session.commit()
+            session.expunge_all()
+
+            evaluation, zone = await evaluations._get_evaluation_with_zone_or_404(
+                session,
+                evaluation_id=seeded.id,
+                organization_id=seeded.organization_id,
+                load_aggregate=False,
+            )
+            assert zone.id == seeded.zone_id
+            assert "aggregate_result" in inspect(evaluation).unloaded
+
+            await submit_score(
+                session,
+                evaluation=evaluation,
+                evaluator_id=uuid4(),
+                payload=EvaluationScoreCreate(criterion_name="quality", score=0.7),
+            )
+
+            stored = await session.get(Evaluation, seeded.id)
+            assert stored is not None
+            assert stored.status == "in_review"
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_list_evaluations_pages_with_keyset_cursor(tmp_path: Path) -> None:
+    from datetime import timedelta
+
+    from fastapi import Response
+
+    from app.core.time import utcnow
+    from app.models.organization_members import OrganizationMember
+    from app.services.organizations import OrganizationContext
+
+    engine = await _make_engine(tmp_path)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            first = await _seed_evaluation(session)
+            base = utcnow()
+            created: list[Evaluation] = [first]
+            first.created_at = base
+            for offset in range(1, 5):
+                evaluation = Evaluation(
+                    zone_id=first.zone_id,
+                    organization_id=first.organization_id,
+                    executor_id=first.executor_id,
+                    created_at=base - timedelta(minutes=offset),
+                )
+                session.add(evaluation)
+                created.append(evaluation)
+            await session.commit()
+            org = await session.get(Organization, first.organization_id)
+            ctx = OrganizationContext(
+                organization=org,
+                member=OrganizationMember(organization_id=org.id, user_id=uuid4()),
+            )
+
+            seen: list[object] = []
+            cursor = None
+            pages = 0
+            while True:
+                response = Response()
+                page = await evaluations.list_evaluations(
+                    response=response,
+                    session=session,
+                    ctx=ctx,
+                    limit=2,
+                    cursor=cursor,
+                )
+                pages += 1
+                seen.extend(item.id for item in page)
+                cursor = response.headers.get("X-Next-Cursor")
+                if cursor is None:
+                    break
+
+            assert seen == [e.id for e in created]
+            assert pages == 3
+    finally:
+        await engine.dispose()
+
+
+def test_decode_keyset_cursor_rejects_garbage() -> None:
+    from fastapi import HTTPException
+
+    from app.core.time import utcnow
+    from app.db.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+    now = utcnow()
+    row_id = uuid4()
+    assert decode_keyset_cursor(encode_keyset_cursor(now, row_id)) == (now, row_id)
+    with pytest.raises(HTTPException) as exc:
+        decode_keyset_cursor("not-a-cursor")
+    assert exc.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_create_evaluation_checks_zone_and_executor_with_exists(tmp_path: Path) -> None:
+    from fastapi import HTTPException
+
+    from app.schemas.evaluations import EvaluationCreate
+    from app.services.evaluations import create_evaluation
+
+    engine = await _make_engine(tmp_path)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            seeded = await _seed_evaluation(session)
+            await session.commit()
+
+            assert await TrustZone.objects.by_id(seeded.zone_id).exists(session)
+            assert not await User.objects.by_id(uuid4()).exists(session)
+
+            with pytest.raises(HTTPException) as exc:
+                await create_evaluation(
+                    session,
+                    organization_id=uuid4(),
+                    creator_id=seeded.executor_id,
+                    payload=EvaluationCreate(
+                        zone_id=seeded.zone_id, executor_id=seeded.executor_id
+                    ),
+                )
+            assert exc.value.detail == "Zone not found in organization"
+
+            with pytest.raises(HTTPException) as exc:
+                await create_evaluation(
+                    session,
+                    organization_id=seeded.organization_id,
+                    creator_id=seeded.executor_id,
+                    payload=EvaluationCreate(zone_id=seeded.zone_id, executor_id=uuid4()),
+                )
+            assert exc.value.status_code == 422
+
+            created = await create_evaluation(
+                session,
+                organization_id=seeded.organization_id,
+                creator_id=seeded.executor_id,
+                payload=EvaluationCreate(zone_id=seeded.zone_id, executor_id=seeded.executor_id),
+            )
+            assert created.zone_id == seeded.zone_id
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_auto_evaluate_runs_llm_reviews_concurrently(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+
+    from app.services import evaluations as evaluation_service
+
+    in_flight = 0
+    peak = 0
+
+    async def _fake_review(criterion, evaluation, zone):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 0.8, f"reviewed {criterion['name']}"
+
+    monkeypatch.setattr(evaluation_service, "_run_llm_review", _fake_review)
+
+    engine = await _make_engine(tmp_path)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            evaluation = await _seed_evaluation(session)
+            zone = await session.get(TrustZone, evaluation.zone_id)
+            zone.evaluation_criteria = {
+                "criteria": [
+                    {"name": "quality", "type": "llm_review"},
+                    {"name": "timeliness", "type": "automated_check", "config": {"max_days": 7}},
+                    {"name": "clarity", "type": "llm_review", "weight": 2.0},
+                ],
+            }
+            await session.commit()
+
+            scores = await evaluation_service.auto_evaluate(session, evaluation, zone)
+
+            assert peak == 2
+            assert [s.criterion_name for s in scores] == ["quality", "timeliness", "clarity"]
+            assert scores[0].rationale == "reviewed quality"
+            assert scores[1].score == 1.0
+            assert scores[2].criterion_weight == 2.0
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_llm_reviews_are_bounded_by_semaphore(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+    import sys
+    from types import SimpleNamespace
+
+    from app.services import evaluations as evaluation_service
+
+    in_flight = 0
+    peak = 0
+
+    async def _create(**_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        text = '{"score": 0.7, "rationale": "ok"}'
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    fake_anthropic = SimpleNamespace(
+        AsyncAnthropic=lambda **_kwargs: SimpleNamespace(
+            messages=SimpleNamespace(create=_create),
+        ),
+    )
+    monkeypatch.setitem(sys.modules, "anthropic", fake_anthropic)
+    monkeypatch.setattr(evaluation_service, "_LLM_REVIEW_SEMAPHORE", asyncio.Semaphore(2))
+    evaluation = Evaluation(zone_id=uuid4(), organization_id=uuid4(), executor_id=uuid4())
+    zone = TrustZone(organization_id=uuid4(), name="zone", slug="zone", created_by=uuid4())
+
+    results = await asyncio.gather(
+        *(
+            evaluation_service._run_llm_review({"name": f"c{i}"}, evaluation, zone)
+            for i in range(5)
+        ),
+    )
+
+    assert results == [(0.7, "ok")] * 5
+    assert peak == 2
+
+
+def test_evaluation_to_read_validates_nested_children_in_one_pass() -> None:
+    evaluation = Evaluation(zone_id=uuid4(), organization_id=uuid4(), executor_id=uuid4())
+    score = EvaluationScore(
+        evaluation_id=evaluation.id,
+        evaluator_id=uuid4(),
+        criterion_name="quality",
+        score=0.6,
+    )
+    signal = IncentiveSignal(
+        evaluation_id=evaluation.id,
+        target_id=evaluation.executor_id,
+        signal_type="positive",
+    )
+
+    read = evaluations._evaluation_to_read(evaluation, [score], [signal])
+    bare = evaluations._evaluation_to_read(evaluation)
+
+    assert read.id == evaluation.id
+    assert [s.criterion_name for s in read.scores] == ["quality"]
+    assert [s.signal_type for s in read.incentive_signals] == ["positive"]
+    assert bare.scores == [] and bare.incentive_signals == []
+
+
+@pytest.mark.asyncio
+async def test_auto_evaluate_parses_weights_before_starting_reviews(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.services import evaluations as evaluation_service
+
+    started: list[str] = []
+
+    def _tracking_review(criterion, evaluation, zone):
+        started.append(str(criterion["name"]))
+
+        async def _review():
+            return 0.5, "ok"
+
+        return _review()
+
+    monkeypatch.setattr(evaluation_service, "_run_llm_review", _tracking_review)
+    evaluation = Evaluation(zone_id=uuid4(), organization_id=uuid4(), executor_id=uuid4())
+    zone = TrustZone(organization_id=uuid4(), name="zone", slug="zone", created_by=uuid4())
+    zone.evaluation_criteria = {
+        "criteria": [
+            {"name": "quality", "type": "llm_review"},
+            {"name": "clarity", "type": "llm_review", "weight": "heavy"},
+        ],
+    }
+
+    with pytest.raises(ValueError):
+        await evaluation_service.auto_evaluate(None, evaluation, zone)
+    assert started == []
@@ -32,8 +32,8 @@ class _FakeSession:
 
 
 @pytest.mark.asyncio
-async def test_delete_my_org_cleans_dependents_before_organization_delete() -> None:
-    """Delete flow should remove dependent rows before the organization row."""
+async def test_delete_my_org_issues_single_organization_delete() -> None:
+    """Dependents cascade in the database, so only the organization row is deleted."""
     session: Any = _FakeSession()
     org_id = uuid4()
     ctx = OrganizationContext(
@@ -51,32 +51,7 @@ async def test_delete_my_org_cleans_dependents_before_organization_delete() -> N
     )
 
     executed_tables = [statement.table.name for statement in session.executed]
-    assert executed_tables == [
-        "activity_events",
-        "activity_events",
-        "task_dependencies",
-        "task_fingerprints",
-        "approval_task_links",
-        "approvals",
-        "board_memory",
-        "board_webhook_payloads",
-        "board_webhooks",
-        "board_onboarding_sessions",
-        "organization_board_access",
-        "organization_invite_board_access",
-        "organization_board_access",
-        "organization_invite_board_access",
-        "tasks",
-        "agents",
-        "boards",
-        "board_group_memory",
-        "board_groups",
-        "gateways",
-        "organization_invites",
-        "organization_members",
-        "users",
-        "organizations",
-    ]
+    assert executed_tables == ["organizations"]
     assert session.committed == 1
 
 
@@ -103,3 +78,254 @@ async def test_delete_my_org_requires_owner_role() -> None:
     assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
     assert session.executed == []
     assert session.committed == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_my_org_cascades_dependents_in_database() -> None:
+    """Foreign keys cascade board/member rows and null users' active organization."""
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel import SQLModel, select
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.models.activity_events import ActivityEvent
+    from app.models.agents import Agent
+    from app.models.boards import Board
+    from app.models.gateways import Gateway
+    from app.models.organization_board_access import OrganizationBoardAccess
+    from app.models.tasks import Task
+    from app.models.users import User
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection: Any, _record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org = Organization(name="doomed")
+            keep = Organization(name="kept")
+            session.add_all([org, keep])
+            await session.flush()
+            user = User(
+                clerk_user_id=f"clerk_{uuid4().hex[:12]}",
+                email="owner@example.com",
+                active_organization_id=org.id,
+            )
+            session.add(user)
+            await session.flush()
+            owner = OrganizationMember(organization_id=org.id, user_id=user.id, role="owner")
+            gateway = Gateway(
+                organization_id=org.id,
+                name="gw",
+                url="https://gw.example.com",
+                workspace_root="/tmp",
+            )
+            session.add_all([owner, gateway])
+            await session.flush()
+            board = Board(organization_id=org.id, name="b", slug="b", gateway_id=gateway.id)
+            kept_board = Board(organization_id=keep.id, name="k", slug="k")
+            session.add_all([board, kept_board])
+            await session.flush()
+            agent = Agent(board_id=board.id, gateway_id=gateway.id, name="a")
+            task = Task(board_id=board.id, title="t")
+            session.add_all([agent, task])
+            await session.flush()
+            session.add_all(
+                [
+                    ActivityEvent(event_type="task.created", task_id=task.id),
+                    ActivityEvent(event_type="agent.online", agent_id=agent.id),
+                    OrganizationBoardAccess(organization_member_id=owner.id, board_id=board.id),
+                ],
+            )
+            await session.commit()
+
+            ctx = OrganizationContext(organization=org, member=owner)
+            await organizations.delete_my_org(session=session, ctx=ctx)
+            session.expunge_all()
+
+            for model in (Task, Agent, ActivityEvent, OrganizationBoardAccess, Gateway):
+                assert (await session.exec(select(model))).all() == [], model
+            assert [b.id for b in (await session.exec(select(Board))).all()] == [kept_board.id]
+            assert (await session.exec(select(OrganizationMember))).all() == []
+            reloaded = await session.get(User, user.id)
+            assert reloaded is not None
+            assert reloaded.active_organization_id is None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_delete_my_org_cascades_governance_and_catalog_rows() -> None:
+    """Zones, proposals, evaluations, tags, custom fields and skills go with the org."""
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel import SQLModel, select
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.models.approval_requests import ApprovalRequest
+    from app.models.audit_entries import AuditEntry
+    from app.models.boards import Board
+    from app.models.escalations import Escalation, EscalationCosigner
+    from app.models.evaluations import Evaluation, EvaluationScore, IncentiveSignal
+    from app.models.gardener_feedback import GardenerFeedback
+    from app.models.gateways import Gateway
+    from app.models.proposals import Proposal
+    from app.models.skills import GatewayInstalledSkill, MarketplaceSkill, SkillPack
+    from app.models.tag_assignments import TagAssignment
+    from app.models.tags import Tag
+    from app.models.task_custom_fields import (
+        BoardTaskCustomField,
+        TaskCustomFieldDefinition,
+        TaskCustomFieldValue,
+    )
+    from app.models.tasks import Task
+    from app.models.trust_zones import TrustZone
+    from app.models.users import User
+    from app.models.zone_assignments import ZoneAssignment
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection: Any, _record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org = Organization(name="doomed")
+            keep = Organization(name="kept")
+            session.add_all([org, keep])
+            await session.flush()
+            user = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="owner@example.com")
+            session.add(user)
+            await session.flush()
+            owner = OrganizationMember(organization_id=org.id, user_id=user.id, role="owner")
+            gateway = Gateway(
+                organization_id=org.id,
+                name="gw",
+                url="https://gw.example.com",
+                workspace_root="/tmp",
+            )
+            zone = TrustZone(organization_id=org.id, name="z", slug="z", created_by=user.id)
+            kept_zone = TrustZone(organization_id=keep.id, name="k", slug="k", created_by=user.id)
+            tag = Tag(organization_id=org.id, name="t", slug="t")
+            definition = TaskCustomFieldDefinition(
+                organization_id=org.id,
+                field_key="f",
+                label="F",
+            )
+            pack = SkillPack(organization_id=org.id, name="p", source_url="https://p.example")
+            session.add_all([owner, gateway, zone, kept_zone, tag, definition, pack])
+            await session.flush()
+            board = Board(organization_id=org.id, name="b", slug="b", gateway_id=gateway.id)
+            skill = MarketplaceSkill(
+                organization_id=org.id,
+                name="s",
+                source_url="https://p.example/s",
+                pack_id=pack.id,
+            )
+            proposal = Proposal(
+                organization_id=org.id,
+                zone_id=zone.id,
+                proposer_id=user.id,
+                title="p",
+                proposal_type="action",
+            )
+            evaluation = Evaluation(zone_id=zone.id, organization_id=org.id, executor_id=user.id)
+            escalation = Escalation(
+                organization_id=org.id,
+                escalation_type="action",
+                source_zone_id=zone.id,
+                target_zone_id=zone.id,
+                escalator_id=user.id,
+            )
+            session.add_all([board, skill, proposal, evaluation, escalation])
+            await session.flush()
+            task = Task(board_id=board.id, title="t")
+            session.add(task)
+            await session.flush()
+            session.add_all(
+                [
+                    TagAssignment(task_id=task.id, tag_id=tag.id),
+                    BoardTaskCustomField(
+                        board_id=board.id,
+                        task_custom_field_definition_id=definition.id,
+                    ),
+                    TaskCustomFieldValue(
+                        task_id=task.id,
+                        task_custom_field_definition_id=definition.id,
+                        value="v",
+                    ),
+                    GatewayInstalledSkill(gateway_id=gateway.id, skill_id=skill.id),
+                    ZoneAssignment(
+                        zone_id=zone.id,
+                        member_id=owner.id,
+                        role="executor",
+                        assigned_by=user.id,
+                    ),
+                    ApprovalRequest(proposal_id=proposal.id, reviewer_id=user.id),
+                    GardenerFeedback(
+                        proposal_id=proposal.id,
+                        reviewer_id=user.id,
+                        selected_by="rule_based",
+                    ),
+                    EscalationCosigner(escalation_id=escalation.id, user_id=user.id),
+                    EvaluationScore(
+                        evaluation_id=evaluation.id,
+                        evaluator_id=user.id,
+                        criterion_name="quality",
+                        score=1.0,
+                    ),
+                    IncentiveSignal(
+                        evaluation_id=evaluation.id,
+                        target_id=user.id,
+                        signal_type="positive",
+                    ),
+                    AuditEntry(
+                        organization_id=org.id,
+                        zone_id=zone.id,
+                        actor_id=user.id,
+                        actor_type="user",
+                        action="zone.created",
+                    ),
+                ],
+            )
+            await session.commit()
+
+            ctx = OrganizationContext(organization=org, member=owner)
+            await organizations.delete_my_org(session=session, ctx=ctx)
+            session.expunge_all()
+
+            for model in (
+                Tag,
+                TagAssignment,
+                TaskCustomFieldDefinition,
+                BoardTaskCustomField,
+                TaskCustomFieldValue,
+                SkillPack,
+                MarketplaceSkill,
+                GatewayInstalledSkill,
+                ZoneAssignment,
+                Proposal,
+                ApprovalRequest,
+                GardenerFeedback,
+                Escalation,
+                EscalationCosigner,
+                Evaluation,
+                EvaluationScore,
+                IncentiveSignal,
+                AuditEntry,
+            ):
+                assert (await session.exec(select(model))).all() == [], model
+            assert [z.id for z in (await session.exec(select(TrustZone))).all()] == [kept_zone.id]
+    finally:
+        await engine.dispose()
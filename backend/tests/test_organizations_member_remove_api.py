@@ -20,10 +20,14 @@ from app.services.organizations import OrganizationContext
 class _FakeExecResult:
     first_value: Any = None
     all_values: list[Any] | None = None
+    one_value: Any = None
 
     def first(self) -> Any:
         return self.first_value
 
+    def one(self) -> Any:
+        return self.one_value
+
     def __iter__(self):
         return iter(self.all_values or [])
 
@@ -46,6 +50,12 @@ class _FakeSession:
             raise AssertionError("No more exec_results left for session.exec")
         return self.exec_results.pop(0)
 
+    async def get(self, _model: Any, _ident: Any) -> Any:
+        # Primary-key lookups consume the next queued result like a SELECT would.
+        if not self.exec_results:
+            raise AssertionError("No more exec_results left for session.get")
+        return self.exec_results.pop(0).first()
+
     async def execute(self, statement: Any) -> None:
         self.executed.append(statement)
 
@@ -91,8 +101,7 @@ async def test_remove_org_member_deletes_member_access_and_member() -> None:
     session = _FakeSession(
         exec_results=[
             _FakeExecResult(first_value=member),
-            _FakeExecResult(first_value=user),
-            _FakeExecResult(first_value=fallback_org_id),
+            _FakeExecResult(first_value=(user, fallback_org_id)),
         ],
     )
     ctx = _make_ctx(org_id=org_id, user_id=actor_user_id, role="admin")
@@ -162,7 +171,7 @@ async def test_remove_org_member_rejects_removing_last_owner() -> None:
     session = _FakeSession(
         exec_results=[
             _FakeExecResult(first_value=member),
-            _FakeExecResult(all_values=[member]),
+            _FakeExecResult(one_value=1),
         ],
     )
     ctx = _make_ctx(org_id=org_id, user_id=uuid4(), role="owner")
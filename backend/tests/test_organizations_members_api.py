@@ -0,0 +1,580 @@
+# ruff: noqa
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import organizations
+from app.models.boards import Board
+from app.models.organization_board_access import OrganizationBoardAccess
+from app.models.organization_members import OrganizationMember
+from app.models.organizations import Organization
+from app.models.users import User
+from app.services.organizations import OrganizationContext
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(
+    session: AsyncSession,
+) -> tuple[Organization, OrganizationMember, OrganizationMember, list[Board]]:
+    org = Organization(name="test-org")
+    owner_user = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="owner@example.com")
+    member_user = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="member@example.com")
+    session.add_all([org, owner_user, member_user])
+    await session.flush()
+    owner = OrganizationMember(organization_id=org.id, user_id=owner_user.id, role="owner")
+    member = OrganizationMember(organization_id=org.id, user_id=member_user.id)
+    boards = [Board(organization_id=org.id, name=f"b{i}", slug=f"b{i}") for i in range(2)]
+    session.add_all([owner, member, *boards])
+    await session.flush()
+    return org, owner, member, boards
+
+
+@pytest.mark.asyncio
+async def test_get_member_detail_loads_user_and_access_together() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, owner, member, boards = await _seed(session)
+            session.add_all(
+                [
+                    OrganizationBoardAccess(organization_member_id=member.id, board_id=board.id)
+                    for board in boards
+                ],
+            )
+            await session.commit()
+
+            ctx = OrganizationContext(organization=org, member=owner)
+            read = await organizations.get_org_member(
+                member_id=member.id,
+                session=session,
+                ctx=ctx,
+            )
+            assert read.user is not None
+            assert read.user.email == "member@example.com"
+            assert sorted(a.board_id for a in read.board_access) == sorted(b.id for b in boards)
+
+            own = await organizations.get_my_membership(session=session, ctx=ctx)
+            assert own.id == owner.id
+            assert own.board_access == []
+
+            with pytest.raises(HTTPException) as exc:
+                await organizations.get_org_member(
+                    member_id=uuid4(),
+                    session=session,
+                    ctx=ctx,
+                )
+            assert exc.value.status_code == 404
+
+            with pytest.raises(HTTPException) as exc:
+                await organizations.get_org_member(
+                    member_id=owner.id,
+                    session=session,
+                    ctx=OrganizationContext(organization=org, member=member),
+                )
+            assert exc.value.status_code == 403
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_require_org_boards_reports_unknown_board_ids() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, _owner, _member, boards = await _seed(session)
+            foreign = Board(organization_id=uuid4(), name="x", slug="x")
+            session.add(foreign)
+            await session.commit()
+
+            await organizations._require_org_boards(
+                session,
+                organization_id=org.id,
+                board_ids={b.id for b in boards},
+            )
+            await organizations._require_org_boards(
+                session, organization_id=org.id, board_ids=set()
+            )
+
+            unknown = uuid4()
+            for board_ids, invalid in (
+                ({boards[0].id, foreign.id}, [foreign.id]),
+                ({unknown}, [unknown]),
+            ):
+                with pytest.raises(HTTPException) as exc:
+                    await organizations._require_org_boards(
+                        session,
+                        organization_id=org.id,
+                        board_ids=board_ids,
+                    )
+                assert exc.value.status_code == 422
+                assert exc.value.detail["invalid_board_ids"] == [str(i) for i in invalid]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_require_org_boards_binds_one_array_on_postgres() -> None:
+    from types import SimpleNamespace
+
+    from sqlalchemy.dialects import postgresql
+
+    statements: list[str] = []
+
+    class _PostgresSession:
+        def get_bind(self):
+            return SimpleNamespace(dialect=postgresql.dialect())
+
+        async def execute(self, statement):
+            statements.append(str(statement.compile(dialect=postgresql.dialect())))
+            return SimpleNamespace(scalars=lambda: [])
+
+    for count in (1, 5):
+        await organizations._require_org_boards(
+            _PostgresSession(),
+            organization_id=uuid4(),
+            board_ids={uuid4() for _ in range(count)},
+        )
+
+    assert statements[0] == statements[1]
+    assert "unnest(" in statements[0]
+    assert "UNION" not in statements[0]
+
+
+def test_member_to_read_validates_nested_rows_in_one_pass() -> None:
+    user = User(clerk_user_id="clerk_x", email="x@example.com", name="X")
+    member = OrganizationMember(organization_id=uuid4(), user_id=user.id, role="admin")
+    access = OrganizationBoardAccess(organization_member_id=member.id, board_id=uuid4())
+
+    read = organizations._member_to_read(member, user, [access])
+    bare = organizations._member_to_read(member, None)
+
+    assert read.id == member.id
+    assert read.role == "admin"
+    assert read.user is not None and read.user.email == "x@example.com"
+    assert [a.board_id for a in read.board_access] == [access.board_id]
+    assert bare.user is None
+    assert bare.board_access == []
+
+
+@pytest.mark.asyncio
+async def test_list_org_members_batches_board_access_per_page() -> None:
+    from fastapi_pagination import set_page, set_params
+    from fastapi_pagination.limit_offset import LimitOffsetParams
+
+    from app.schemas.pagination import DefaultLimitOffsetPage
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, owner, member, boards = await _seed(session)
+            session.add_all(
+                [
+                    OrganizationBoardAccess(
+                        organization_member_id=member.id, board_id=boards[0].id
+                    ),
+                    OrganizationBoardAccess(
+                        organization_member_id=member.id, board_id=boards[1].id
+                    ),
+                ],
+            )
+            await session.commit()
+
+            statements: list[str] = []
+
+            from sqlalchemy import event
+
+            @event.listens_for(engine.sync_engine, "before_cursor_execute")
+            def _record(_conn, _cursor, statement, *_args):
+                statements.append(statement)
+
+            ctx = OrganizationContext(organization=org, member=owner)
+            with (
+                set_page(DefaultLimitOffsetPage),
+                set_params(LimitOffsetParams(limit=10, offset=0)),
+            ):
+                page = await organizations.list_org_members(session=session, ctx=ctx)
+
+            by_email = {item.user.email: item for item in page.items}
+            assert by_email["owner@example.com"].board_access == []
+            assert sorted(
+                a.board_id for a in by_email["member@example.com"].board_access
+            ) == sorted(b.id for b in boards)
+            access_queries = [s for s in statements if "organization_board_access" in s]
+            assert len(access_queries) == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_create_organization_rejects_case_insensitive_duplicate() -> None:
+    from app.core.auth import AuthContext
+    from app.schemas.organizations import OrganizationCreate
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            user = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="o@example.com")
+            session.add(user)
+            await session.commit()
+            auth = AuthContext(actor_type="user", user=user)
+
+            async def _no_refresh(*_args, **_kwargs):
+                raise AssertionError("sessions keep attributes on commit; refresh is redundant")
+
+            session.refresh = _no_refresh
+            created = await organizations.create_organization(
+                payload=OrganizationCreate(name="Acme"),
+                session=session,
+                auth=auth,
+            )
+            assert created.name == "Acme"
+
+            with pytest.raises(HTTPException) as exc:
+                await organizations.create_organization(
+                    payload=OrganizationCreate(name=" acme "),
+                    session=session,
+                    auth=auth,
+                )
+            assert exc.value.status_code == 409
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_remove_org_member_moves_active_org_to_oldest_fallback() -> None:
+    from datetime import timedelta
+
+    from app.core.time import utcnow
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, owner, member, _boards = await _seed(session)
+            older = Organization(name="older")
+            newer = Organization(name="newer")
+            loner_user = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="l@example.com")
+            session.add_all([older, newer, loner_user])
+            await session.flush()
+            now = utcnow()
+            session.add_all(
+                [
+                    OrganizationMember(
+                        organization_id=newer.id,
+                        user_id=member.user_id,
+                        created_at=now,
+                    ),
+                    OrganizationMember(
+                        organization_id=older.id,
+                        user_id=member.user_id,
+                        created_at=now - timedelta(days=1),
+                    ),
+                ],
+            )
+            loner = OrganizationMember(organization_id=org.id, user_id=loner_user.id)
+            session.add(loner)
+            member_user = await session.get(User, member.user_id)
+            member_user.active_organization_id = org.id
+            loner_user.active_organization_id = org.id
+            await session.commit()
+
+            ctx = OrganizationContext(organization=org, member=owner)
+            await organizations.remove_org_member(member_id=member.id, session=session, ctx=ctx)
+            await organizations.remove_org_member(member_id=loner.id, session=session, ctx=ctx)
+
+            session.expunge_all()
+            assert (await session.get(User, member.user_id)).active_organization_id == older.id
+            assert (await session.get(User, loner_user.id)).active_organization_id is None
+            assert await session.get(OrganizationMember, member.id) is None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_member_mutations_reuse_loaded_user() -> None:
+    from app.schemas.organizations import (
+        OrganizationBoardAccessSpec,
+        OrganizationMemberAccessUpdate,
+        OrganizationMemberUpdate,
+    )
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, owner, member, boards = await _seed(session)
+            await session.commit()
+            ctx = OrganizationContext(organization=org, member=owner)
+
+            updated = await organizations.update_org_member(
+                member_id=member.id,
+                payload=OrganizationMemberUpdate(role="admin"),
+                session=session,
+                ctx=ctx,
+            )
+            assert updated.role == "admin"
+            assert updated.user is not None and updated.user.email == "member@example.com"
+
+            access = await organizations.update_member_access(
+                member_id=member.id,
+                payload=OrganizationMemberAccessUpdate(
+                    board_access=[OrganizationBoardAccessSpec(board_id=boards[0].id)],
+                ),
+                session=session,
+                ctx=ctx,
+            )
+            assert access.user is not None and access.user.email == "member@example.com"
+
+            with pytest.raises(HTTPException) as exc:
+                await organizations.update_org_member(
+                    member_id=uuid4(),
+                    payload=OrganizationMemberUpdate(role="admin"),
+                    session=session,
+                    ctx=ctx,
+                )
+            assert exc.value.status_code == 404
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_accept_org_invite_matches_only_pending_tokens() -> None:
+    from sqlalchemy import inspect
+
+    from app.core.auth import AuthContext
+    from app.schemas.organizations import OrganizationInviteAccept, OrganizationInviteCreate
+
+    engine = await _make_engine()
+    try:
+        async with engine.connect() as conn:
+            indexes = await conn.run_sync(
+                lambda sync_conn: inspect(sync_conn).get_indexes("organization_invites"),
+            )
+        assert "ix_organization_invites_pending_token" in {ix["name"] for ix in indexes}
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, owner, _member, _boards = await _seed(session)
+            invitee = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="new@example.com")
+            session.add(invitee)
+            await session.commit()
+
+            invite = await organizations.create_org_invite(
+                payload=OrganizationInviteCreate(invited_email="New@example.com"),
+                session=session,
+                ctx=OrganizationContext(organization=org, member=owner),
+            )
+            auth = AuthContext(actor_type="user", user=invitee)
+
+            accepted = await organizations.accept_org_invite(
+                payload=OrganizationInviteAccept(token=invite.token),
+                session=session,
+                auth=auth,
+            )
+            assert accepted.organization_id == org.id
+            assert accepted.user is not None and accepted.user.email == "new@example.com"
+
+            with pytest.raises(HTTPException) as exc:
+                await organizations.accept_org_invite(
+                    payload=OrganizationInviteAccept(token=invite.token),
+                    session=session,
+                    auth=auth,
+                )
+            assert exc.value.status_code == 404
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_list_org_invites_validates_page_in_bulk() -> None:
+    from fastapi_pagination import set_page, set_params
+    from fastapi_pagination.limit_offset import LimitOffsetParams
+
+    from app.models.organization_invites import OrganizationInvite
+    from app.schemas.organizations import OrganizationInviteRead
+    from app.schemas.pagination import DefaultLimitOffsetPage
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, owner, _member, _boards = await _seed(session)
+            session.add_all(
+                [
+                    OrganizationInvite(
+                        organization_id=org.id,
+                        invited_email=f"i{i}@example.com",
+                        token=f"token-{i}",
+                    )
+                    for i in range(3)
+                ],
+            )
+            await session.commit()
+
+            ctx = OrganizationContext(organization=org, member=owner)
+            with set_page(DefaultLimitOffsetPage), set_params(LimitOffsetParams(limit=2, offset=0)):
+                page = await organizations.list_org_invites(session=session, ctx=ctx)
+
+            assert page.total == 3
+            assert len(page.items) == 2
+            assert all(isinstance(item, OrganizationInviteRead) for item in page.items)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_org_member_rejects_non_admin_without_query() -> None:
+    class _NoQuerySession:
+        async def exec(self, _statement):
+            raise AssertionError("non-admin lookups of other members must not hit the DB")
+
+    org_id = uuid4()
+    caller = OrganizationMember(organization_id=org_id, user_id=uuid4(), role="member")
+    ctx = OrganizationContext(organization=Organization(id=org_id, name="o"), member=caller)
+
+    with pytest.raises(HTTPException) as exc:
+        await organizations.get_org_member(
+            member_id=uuid4(),
+            session=_NoQuerySession(),
+            ctx=ctx,
+        )
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_list_my_organizations_marks_resolved_active_org() -> None:
+    from app.core.auth import AuthContext
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, _owner, member, _boards = await _seed(session)
+            other = Organization(name="another-org")
+            session.add(other)
+            await session.flush()
+            session.add(OrganizationMember(organization_id=other.id, user_id=member.user_id))
+            user = await session.get(User, member.user_id)
+            user.active_organization_id = other.id
+            await session.commit()
+
+            items = await organizations.list_my_organizations(
+                session=session,
+                auth=AuthContext(actor_type="user", user=user),
+            )
+
+            assert [item.name for item in items] == ["another-org", "test-org"]
+            assert [item.is_active for item in items] == [True, False]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_mark_invite_accepted_claims_pending_invite_once() -> None:
+    from app.core.time import utcnow
+    from app.models.organization_invites import OrganizationInvite
+    from app.services.organizations import mark_invite_accepted
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, owner, member, _boards = await _seed(session)
+            invite = OrganizationInvite(
+                organization_id=org.id,
+                invited_email="member@example.com",
+                token="tok",
+                created_by_user_id=owner.user_id,
+            )
+            session.add(invite)
+            await session.commit()
+
+            now = utcnow()
+            assert await mark_invite_accepted(
+                session,
+                invite=invite,
+                user_id=member.user_id,
+                accepted_at=now,
+            )
+            assert not await mark_invite_accepted(
+                session,
+                invite=invite,
+                user_id=owner.user_id,
+                accepted_at=utcnow(),
+            )
+            await session.commit()
+            session.expunge_all()
+
+            stored = await session.get(OrganizationInvite, invite.id)
+            assert stored.accepted_by_user_id == member.user_id
+            assert stored.accepted_at == now == stored.updated_at
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_list_my_organizations_caches_per_user_until_invalidated() -> None:
+    from app.core.auth import AuthContext
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org, _owner, member, _boards = await _seed(session)
+            user = await session.get(User, member.user_id)
+            user.active_organization_id = org.id
+            await session.commit()
+            auth = AuthContext(actor_type="user", user=user)
+
+            first = await organizations.list_my_organizations(session=session, auth=auth)
+            session.add(Organization(name="added-later"))
+            other = Organization(name="another-org")
+            session.add(other)
+            await session.flush()
+            session.add(OrganizationMember(organization_id=other.id, user_id=user.id))
+            await session.commit()
+
+            cached = await organizations.list_my_organizations(session=session, auth=auth)
+            assert [item.id for item in cached] == [item.id for item in first] == [org.id]
+
+            organizations._invalidate_org_list(user.id)
+            fresh = await organizations.list_my_organizations(session=session, auth=auth)
+            assert [item.name for item in fresh] == ["another-org", "test-org"]
+
+            # A changed active organization misses the cache without explicit invalidation.
+            user.active_organization_id = other.id
+            switched = await organizations.list_my_organizations(session=session, auth=auth)
+            assert [item.is_active for item in switched] == [True, False]
+    finally:
+        organizations._invalidate_org_list()
+        await engine.dispose()
+
+
+def test_org_list_cache_evicts_expired_and_oldest_entries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(organizations, "_org_list_cache", {})
+    monkeypatch.setattr(organizations, "_ORG_LIST_CACHE_MAX_ENTRIES", 2)
+    clock = [100.0]
+    monkeypatch.setattr(organizations.time, "monotonic", lambda: clock[0])
+    users = [User(clerk_user_id=f"clerk_{i}", email=f"u{i}@example.com") for i in range(3)]
+
+    organizations._store_org_list(users[0].id, None, [])
+    clock[0] += organizations._ORG_LIST_TTL_SECONDS
+    assert organizations._cached_org_list(users[0]) is None
+    assert organizations._org_list_cache == {}
+
+    organizations._store_org_list(users[0].id, None, [])
+    clock[0] += organizations._ORG_LIST_TTL_SECONDS
+    organizations._store_org_list(users[1].id, None, [])
+    assert list(organizations._org_list_cache) == [users[1].id]
+
+    organizations._store_org_list(users[2].id, None, [])
+    organizations._store_org_list(users[0].id, None, [])
+    assert list(organizations._org_list_cache) == [users[2].id, users[0].id]
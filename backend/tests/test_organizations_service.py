@@ -583,11 +583,11 @@ async def test_apply_invite_to_member_upgrades_role_and_merges_access_rows(
     )
 
     # 1st exec: invite access rows list
-    # 2nd exec: existing access (none)
+    # 2nd exec: member's existing access for those boards (none)
     session = _FakeSession(
         exec_results=[
             [invite_access],
-            _FakeExecResult(first_value=None),
+            [],
         ],
     )
 
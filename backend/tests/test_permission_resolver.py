@@ -226,3 +226,36 @@ async def test_resolve_zone_permission_blocked_by_constraint() -> None:
     assert await resolve_zone_permission(
         session, member=member, zone=zone, action="zone.execute"
     ) is False
+
+
+@pytest.mark.asyncio
+async def test_resolve_zone_permission_cached_resolves_once_per_request(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.models.organizations import Organization
+    from app.services import zone_auth
+    from app.services.organizations import OrganizationContext
+
+    calls: list[str] = []
+
+    async def _fake_resolve(_session: Any, *, member: Any, zone: Any, action: str) -> bool:
+        calls.append(action)
+        return action == "escalation.trigger"
+
+    monkeypatch.setattr(zone_auth, "resolve_zone_permission", _fake_resolve)
+    org = Organization(name="org")
+    ctx = OrganizationContext(
+        organization=org,
+        member=OrganizationMember(organization_id=org.id, user_id=uuid4(), role="member"),
+    )
+    zone = TrustZone(organization_id=org.id, name="z", slug="z", created_by=uuid4())
+
+    for _ in range(3):
+        assert await zone_auth.resolve_zone_permission_cached(
+            _FakeSession(), org_ctx=ctx, zone=zone, action="escalation.trigger"
+        )
+    assert not await zone_auth.resolve_zone_permission_cached(
+        _FakeSession(), org_ctx=ctx, zone=zone, action="zone.write"
+    )
+
+    assert calls == ["escalation.trigger", "zone.write"]
@@ -0,0 +1,400 @@
+# ruff: noqa
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import proposals
+from app.core.auth import AuthContext
+from app.models.approval_requests import ApprovalRequest
+from app.models.approvals import Approval  # noqa: F401 – FK target for proposals.legacy_approval_id
+from app.models.organization_members import OrganizationMember
+from app.models.organizations import Organization
+from app.models.proposals import Proposal
+from app.models.trust_zones import TrustZone
+from app.models.users import User
+from app.services.organizations import OrganizationContext
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(
+    session: AsyncSession,
+) -> tuple[OrganizationContext, User, TrustZone]:
+    org = Organization(name="test-org")
+    user = User(clerk_user_id=f"clerk_{uuid4().hex[:12]}", email="test@example.com")
+    session.add_all([org, user])
+    await session.flush()
+    member = OrganizationMember(organization_id=org.id, user_id=user.id, role="owner")
+    zone = TrustZone(organization_id=org.id, name="zone", slug="zone", created_by=user.id)
+    session.add_all([member, zone])
+    await session.flush()
+    return OrganizationContext(organization=org, member=member), user, zone
+
+
+def _count_selects(engine: AsyncEngine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_list_pending_reviews_batches_proposal_and_request_loads() -> None:
+    from datetime import timedelta
+
+    from app.core.time import utcnow
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            ctx, user, zone = await _seed(session)
+            base = utcnow()
+            pending = [
+                Proposal(
+                    organization_id=ctx.organization.id,
+                    zone_id=zone.id,
+                    proposer_id=user.id,
+                    title=f"p{i}",
+                    proposal_type="task_execution",
+                    created_at=base - timedelta(minutes=i),
+                )
+                for i in range(3)
+            ]
+            resolved = Proposal(
+                organization_id=ctx.organization.id,
+                zone_id=zone.id,
+                proposer_id=user.id,
+                title="done",
+                proposal_type="task_execution",
+                status="approved",
+            )
+            voted = Proposal(
+                organization_id=ctx.organization.id,
+                zone_id=zone.id,
+                proposer_id=user.id,
+                title="voted",
+                proposal_type="task_execution",
+            )
+            session.add_all([*pending, resolved, voted])
+            await session.flush()
+            session.add(
+                ApprovalRequest(proposal_id=voted.id, reviewer_id=ctx.member.id, decision="reject"),
+            )
+            other_reviewer = uuid4()
+            for proposal in [*pending, resolved]:
+                session.add(ApprovalRequest(proposal_id=proposal.id, reviewer_id=ctx.member.id))
+            session.add(
+                ApprovalRequest(
+                    proposal_id=pending[0].id,
+                    reviewer_id=other_reviewer,
+                    decision="approve",
+                ),
+            )
+            await session.commit()
+
+            selects = _count_selects(engine)
+            result = await proposals.list_pending_reviews(
+                session=session,
+                auth=AuthContext(actor_type="user", user=user),
+                ctx=ctx,
+            )
+
+            # One joined proposal query plus one batched approval-request query.
+            assert len(selects) == 2
+            assert "approval_requests.decision IS NULL" in selects[0]
+            assert [item.title for item in result] == ["p0", "p1", "p2"]
+            by_title = {item.title: item for item in result}
+            assert {r.reviewer_id for r in by_title["p0"].approval_requests} == {
+                ctx.member.id,
+                other_reviewer,
+            }
+            assert [r.reviewer_id for r in by_title["p1"].approval_requests] == [ctx.member.id]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_proposal_loads_requests_in_one_query() -> None:
+    from fastapi import HTTPException
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            ctx, user, zone = await _seed(session)
+            reviewed = Proposal(
+                organization_id=ctx.organization.id,
+                zone_id=zone.id,
+                proposer_id=user.id,
+                title="reviewed",
+                proposal_type="task_execution",
+            )
+            bare = Proposal(
+                organization_id=ctx.organization.id,
+                zone_id=zone.id,
+                proposer_id=user.id,
+                title="bare",
+                proposal_type="task_execution",
+            )
+            session.add_all([reviewed, bare])
+            await session.flush()
+            reviewers = [uuid4(), uuid4()]
+            session.add_all(
+                [ApprovalRequest(proposal_id=reviewed.id, reviewer_id=r) for r in reviewers],
+            )
+            await session.commit()
+
+            selects = _count_selects(engine)
+            read = await proposals.get_proposal(
+                proposal_id=reviewed.id,
+                session=session,
+                ctx=ctx,
+            )
+            assert len(selects) == 1
+            assert sorted(r.reviewer_id for r in read.approval_requests) == sorted(reviewers)
+
+            empty = await proposals.get_proposal(proposal_id=bare.id, session=session, ctx=ctx)
+            assert empty.id == bare.id
+            assert empty.approval_requests == []
+
+            with pytest.raises(HTTPException) as exc:
+                await proposals.get_proposal(proposal_id=uuid4(), session=session, ctx=ctx)
+            assert exc.value.status_code == 404
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_vote_loads_proposal_and_zone_together() -> None:
+    from fastapi import BackgroundTasks, HTTPException
+
+    from app.schemas.proposals import VotePayload
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            ctx, user, zone = await _seed(session)
+            proposal = Proposal(
+                organization_id=ctx.organization.id,
+                zone_id=zone.id,
+                proposer_id=user.id,
+                title="vote",
+                proposal_type="task_execution",
+            )
+            session.add(proposal)
+            await session.flush()
+            session.add(ApprovalRequest(proposal_id=proposal.id, reviewer_id=ctx.member.id))
+            await session.commit()
+
+            loaded, loaded_zone = await proposals._get_proposal_with_zone_or_404(
+                session,
+                proposal_id=proposal.id,
+                organization_id=ctx.organization.id,
+            )
+            assert loaded.id == proposal.id
+            assert loaded_zone.id == zone.id
+
+            background = BackgroundTasks()
+            request = await proposals.abstain_proposal(
+                proposal_id=proposal.id,
+                payload=VotePayload(rationale="n/a"),
+                background=background,
+                session=session,
+                auth=AuthContext(actor_type="user", user=user),
+                ctx=ctx,
+            )
+            assert request.decision == "abstain"
+            # Abstentions are not audited.
+            assert background.tasks == []
+
+            with pytest.raises(HTTPException) as exc:
+                await proposals._get_proposal_with_zone_or_404(
+                    session,
+                    proposal_id=proposal.id,
+                    organization_id=uuid4(),
+                )
+            assert exc.value.status_code == 404
+            with pytest.raises(HTTPException) as exc:
+                await proposals._get_zone_or_404(
+                    session,
+                    zone_id=zone.id,
+                    organization_id=uuid4(),
+                )
+            assert exc.value.status_code == 404
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_check_zone_perm_reuses_request_permission_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from fastapi import HTTPException
+
+    from app.services import zone_auth
+
+    calls: list[str] = []
+
+    async def _fake_resolve(_session, *, member, zone, action):
+        calls.append(action)
+        return action != "proposal.reject"
+
+    monkeypatch.setattr(zone_auth, "resolve_zone_permission", _fake_resolve)
+    org = Organization(name="test-org")
+    ctx = OrganizationContext(
+        organization=org,
+        member=OrganizationMember(organization_id=org.id, user_id=uuid4()),
+    )
+    zone = TrustZone(organization_id=org.id, name="z", slug="z", created_by=uuid4())
+
+    await proposals._check_zone_perm(None, ctx, zone, "proposal.approve")
+    await proposals._check_zone_perm(None, ctx, zone, "proposal.approve")
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            await proposals._check_zone_perm(None, ctx, zone, "proposal.reject")
+        assert exc.value.status_code == 403
+
+    assert calls == ["proposal.approve", "proposal.reject"]
+
+
+@pytest.mark.asyncio
+async def test_approve_commits_once_and_defers_vote_audit() -> None:
+    from fastapi import BackgroundTasks
+    from sqlmodel import select
+
+    from app.models.audit_entries import AuditEntry
+    from app.schemas.proposals import VotePayload
+    from app.services.audit import record_audit_in_new_session
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            ctx, user, zone = await _seed(session)
+            proposal = Proposal(
+                organization_id=ctx.organization.id,
+                zone_id=zone.id,
+                proposer_id=user.id,
+                title="vote",
+                proposal_type="task_execution",
+            )
+            session.add(proposal)
+            await session.flush()
+            session.add(ApprovalRequest(proposal_id=proposal.id, reviewer_id=ctx.member.id))
+            await session.commit()
+
+            commits: list[object] = []
+            event.listen(session.sync_session, "after_commit", commits.append)
+            background = BackgroundTasks()
+            request = await proposals.approve_proposal(
+                proposal_id=proposal.id,
+                payload=VotePayload(rationale="ok"),
+                background=background,
+                session=session,
+                auth=AuthContext(actor_type="user", user=user),
+                ctx=ctx,
+            )
+
+            assert len(commits) == 1
+            assert request.decision == "approve"
+            entries = (await session.exec(select(AuditEntry))).all()
+            # The resolution is audited in the vote's commit; the vote itself after the response.
+            assert [e.action for e in entries] == ["proposal.execute"]
+            assert len(background.tasks) == 1
+            task = background.tasks[0]
+            assert task.func is record_audit_in_new_session
+            assert task.kwargs["action"] == "proposal.approve"
+            assert task.kwargs["target_id"] == proposal.id
+    finally:
+        await engine.dispose()
+
+
+def test_proposal_list_adapter_validates_rows_in_one_pass() -> None:
+    rows = [
+        Proposal(
+            organization_id=uuid4(),
+            zone_id=uuid4(),
+            proposer_id=uuid4(),
+            title=title,
+            proposal_type="task_execution",
+        )
+        for title in ("a", "b")
+    ]
+    request = ApprovalRequest(proposal_id=rows[0].id, reviewer_id=uuid4())
+
+    listed = proposals._PROPOSAL_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    read = proposals._proposal_to_read(rows[0], [request])
+
+    assert [item.id for item in listed] == [row.id for row in rows]
+    assert all(item.approval_requests == [] for item in listed)
+    assert [r.id for r in read.approval_requests] == [request.id]
+    assert proposals._proposal_to_read(rows[1]).approval_requests == []
+
+
+def test_proposal_to_read_constructs_response_with_requests() -> None:
+    proposal = Proposal(
+        organization_id=uuid4(),
+        zone_id=uuid4(),
+        proposer_id=uuid4(),
+        title="constructed",
+        proposal_type="task_execution",
+        payload={"budget_amount": 5},
+    )
+    request = ApprovalRequest(proposal_id=proposal.id, reviewer_id=uuid4(), decision="approve")
+
+    read = proposals._proposal_to_read(proposal, [request])
+    dumped = proposals._PROPOSAL_LIST_ADAPTER.dump_python([read], mode="json")
+
+    assert read.title == "constructed"
+    assert dumped[0]["payload"] == {"budget_amount": 5}
+    assert dumped[0]["approval_requests"][0]["id"] == str(request.id)
+    assert dumped[0]["approval_requests"][0]["decision"] == "approve"
+
+
+@pytest.mark.asyncio
+async def test_create_proposal_loads_zone_once() -> None:
+    from fastapi import HTTPException
+
+    from app.schemas.proposals import ProposalCreate
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            ctx, user, zone = await _seed(session)
+            zone.resource_scope = {"allowed_agent_types": ["worker"]}
+            await session.commit()
+            session.expunge_all()
+            auth = AuthContext(actor_type="user", user=user)
+
+            selects = _count_selects(engine)
+            with pytest.raises(HTTPException) as exc:
+                await proposals.create_proposal_endpoint(
+                    payload=ProposalCreate(
+                        zone_id=zone.id,
+                        title="alloc",
+                        proposal_type="resource_allocation",
+                        payload={"agent_type": "rogue"},
+                    ),
+                    session=session,
+                    auth=auth,
+                    ctx=ctx,
+                )
+            assert exc.value.status_code == 422
+            assert "Resource scope violation" in exc.value.detail
+            assert sum("FROM trust_zones" in s for s in selects) == 1
+    finally:
+        await engine.dispose()
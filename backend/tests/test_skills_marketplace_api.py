@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timedelta
 from pathlib import Path
 from uuid import uuid4
 
@@ -19,6 +20,9 @@ from app.api.gateways import router as gateways_router
 from app.api.skills_marketplace import (
     PackSkillCandidate,
     _collect_pack_skills_from_repo,
+    _normalize_pack_branch,
+    _parse_skill_header,
+    _StreamingJSONReader,
     _validate_pack_source_url,
 )
 from app.api.skills_marketplace import router as skills_marketplace_router
@@ -257,6 +261,20 @@ async def test_list_marketplace_skills_marks_installed_cards() -> None:
                     skill_id=first.id,
                 ),
             )
+            # An install on another gateway must not mark the card as installed.
+            other_gateway = Gateway(
+                organization_id=organization.id,
+                name="Gateway Two",
+                url="https://gateway-two.example.local",
+                workspace_root="/workspace/openclaw",
+            )
+            session.add(other_gateway)
+            session.add(
+                GatewayInstalledSkill(
+                    gateway_id=other_gateway.id,
+                    skill_id=second.id,
+                ),
+            )
             await session.commit()
 
         app = _build_test_app(session_maker, organization=organization)
@@ -281,6 +299,296 @@ async def test_list_marketplace_skills_marks_installed_cards() -> None:
         await engine.dispose()
 
 
+@pytest.mark.asyncio
+async def test_list_marketplace_skills_streams_unlimited_listing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.api import skills_marketplace
+
+    monkeypatch.setattr(skills_marketplace, "MARKETPLACE_STREAM_BATCH_SIZE", 2)
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_maker() as session:
+            organization, gateway = await _seed_base(session)
+            empty_organization, empty_gateway = await _seed_base(session)
+            skills = [
+                MarketplaceSkill(
+                    organization_id=organization.id,
+                    name=f"Skill {index}",
+                    source_url=f"https://example.com/skills/{index}",
+                    metadata_={"index": index},
+                )
+                for index in range(5)
+            ]
+            session.add_all(skills)
+            await session.flush()
+            session.add(GatewayInstalledSkill(gateway_id=gateway.id, skill_id=skills[0].id))
+            await session.commit()
+
+        app = _build_test_app(session_maker, organization=organization)
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            streamed = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(gateway.id)},
+            )
+            paged = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(gateway.id), "limit": "200"},
+            )
+        empty_app = _build_test_app(session_maker, organization=empty_organization)
+        async with AsyncClient(
+            transport=ASGITransport(app=empty_app),
+            base_url="http://testserver",
+        ) as client:
+            empty = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(empty_gateway.id)},
+            )
+
+        assert streamed.status_code == 200
+        assert streamed.headers["content-type"] == "application/json"
+        assert "X-Has-More" not in streamed.headers
+        assert streamed.json() == paged.json()
+        assert len(streamed.json()) == 5
+        assert sum(item["installed"] for item in streamed.json()) == 1
+        assert empty.status_code == 200
+        assert empty.json() == []
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_list_marketplace_skills_pages_with_keyset_cursor() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_maker() as session:
+            organization, gateway = await _seed_base(session)
+            created_at = datetime(2026, 1, 1)
+            skills = [
+                MarketplaceSkill(
+                    organization_id=organization.id,
+                    name=f"Skill {index}",
+                    source_url=f"https://example.com/skills/{index}",
+                    # Two rows share each timestamp so the id tiebreaker is exercised.
+                    created_at=created_at + timedelta(minutes=index // 2),
+                )
+                for index in range(5)
+            ]
+            session.add_all(skills)
+            await session.commit()
+
+        app = _build_test_app(session_maker, organization=organization)
+        seen: list[str] = []
+        totals: list[str | None] = []
+        has_more: list[str | None] = []
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            params = {"gateway_id": str(gateway.id), "limit": "2", "include_total": "true"}
+            while True:
+                response = await client.get("/api/v1/skills/marketplace", params=params)
+                assert response.status_code == 200
+                seen.extend(item["id"] for item in response.json())
+                totals.append(response.headers.get("X-Total-Count"))
+                has_more.append(response.headers.get("X-Has-More"))
+                next_cursor = response.headers.get("X-Next-Cursor")
+                if next_cursor is None:
+                    break
+                params = {**params, "cursor": next_cursor}
+
+            invalid = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(gateway.id), "cursor": "not-a-cursor"},
+            )
+            past_end = await client.get(
+                "/api/v1/skills/marketplace",
+                params={
+                    "gateway_id": str(gateway.id),
+                    "limit": "2",
+                    "offset": "10",
+                    "include_total": "true",
+                },
+            )
+            without_total = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(gateway.id), "limit": "5"},
+            )
+
+        expected = sorted(skills, key=lambda skill: (skill.created_at, skill.id), reverse=True)
+        assert seen == [str(skill.id) for skill in expected]
+        assert totals == ["5", "5", "5"]
+        assert has_more == ["true", "true", "false"]
+        assert len(without_total.json()) == 5
+        assert without_total.headers["X-Has-More"] == "false"
+        assert "X-Total-Count" not in without_total.headers
+        assert "X-Next-Cursor" not in without_total.headers
+        assert past_end.json() == []
+        assert past_end.headers["X-Total-Count"] == "5"
+        assert invalid.status_code == 422
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_list_marketplace_skills_search_is_case_insensitive() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_maker() as session:
+            organization, gateway = await _seed_base(session)
+            session.add_all(
+                [
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        name="Deploy Helper",
+                        source_url="https://example.com/skills/deploy",
+                    ),
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        name="Linter",
+                        description="Runs CI DEPLOYMENT checks",
+                        source_url="https://example.com/skills/lint",
+                    ),
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        name="Unrelated",
+                        source_url="https://example.com/skills/other",
+                    ),
+                ],
+            )
+            await session.commit()
+
+        app = _build_test_app(session_maker, organization=organization)
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            response = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(gateway.id), "search": "  dEpLoY "},
+            )
+
+        assert response.status_code == 200
+        assert sorted(item["name"] for item in response.json()) == ["Deploy Helper", "Linter"]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_list_marketplace_skills_filters_uncategorized_rows() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_maker() as session:
+            organization, gateway = await _seed_base(session)
+            session.add_all(
+                [
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        name=name,
+                        category=category,
+                        risk=risk,
+                        source_url=f"https://example.com/skills/{name}",
+                    )
+                    for name, category, risk in (
+                        ("none", None, "low"),
+                        ("blank", "   ", None),
+                        ("tagged", "Testing", "  "),
+                    )
+                ],
+            )
+            await session.commit()
+
+        app = _build_test_app(session_maker, organization=organization)
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            by_category = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(gateway.id), "category": "Uncategorized"},
+            )
+            by_risk = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(gateway.id), "risk": "uncategorized"},
+            )
+
+        assert sorted(item["name"] for item in by_category.json()) == ["blank", "none"]
+        assert sorted(item["name"] for item in by_risk.json()) == ["blank", "tagged"]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_create_marketplace_skill_upserts_by_source_url() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    source_url = "https://example.com/skills/upserted"
+    try:
+        async with session_maker() as session:
+            organization, _gateway = await _seed_base(session)
+
+        app = _build_test_app(session_maker, organization=organization)
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            created = await client.post(
+                "/api/v1/skills/marketplace",
+                json={"source_url": source_url, "description": "First"},
+            )
+            unchanged = await client.post(
+                "/api/v1/skills/marketplace",
+                json={"source_url": source_url},
+            )
+            renamed = await client.post(
+                "/api/v1/skills/marketplace",
+                json={"source_url": source_url, "name": "Renamed"},
+            )
+
+        assert created.status_code == 200
+        body = created.json()
+        assert body["name"] == "upserted"
+        assert body["description"] == "First"
+        assert body["metadata"] == {}
+        assert unchanged.json() == body
+        assert renamed.json()["id"] == body["id"]
+        assert renamed.json()["name"] == "Renamed"
+        assert renamed.json()["description"] == "First"
+        assert renamed.json()["updated_at"] >= body["updated_at"]
+        async with session_maker() as session:
+            rows = await MarketplaceSkill.objects.filter_by(source_url=source_url).all(session)
+        assert len(rows) == 1
+    finally:
+        await engine.dispose()
+
+
 @pytest.mark.asyncio
 async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPatch) -> None:
     engine = await _make_engine()
@@ -322,7 +630,7 @@ async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPat
             ),
         ]
 
-        def _fake_collect_pack_skills(source_url: str) -> list[PackSkillCandidate]:
+        async def _fake_collect_pack_skills(source_url: str) -> list[PackSkillCandidate]:
             assert source_url == "https://github.com/sickn33/antigravity-awesome-skills"
             return collected
 
@@ -396,6 +704,239 @@ async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPat
         await engine.dispose()
 
 
+@pytest.mark.asyncio
+async def test_sync_pack_writes_only_new_and_changed_skills(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    repo_url = "https://github.com/org/pack"
+    stale_at = datetime(2026, 1, 1)
+    try:
+        async with session_maker() as session:
+            organization, _gateway = await _seed_base(session)
+            pack = SkillPack(organization_id=organization.id, name="Pack", source_url=repo_url)
+            session.add(pack)
+            for slug, description in (("changed", "Old description"), ("same", "Same")):
+                session.add(
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        pack_id=pack.id,
+                        name=slug,
+                        description=description,
+                        source_url=f"{repo_url}/tree/main/skills/{slug}",
+                        source=f"skills/{slug}",
+                        created_at=stale_at,
+                        updated_at=stale_at,
+                    ),
+                )
+            await session.commit()
+
+        discovered = [
+            PackSkillCandidate(
+                name=slug,
+                description=description,
+                source_url=f"{repo_url}/tree/main/skills/{slug}",
+                source=f"skills/{slug}",
+                metadata=metadata,
+            )
+            for slug, description, metadata in (
+                ("changed", "New description", {"tags": ["fresh"]}),
+                ("same", "Same", None),
+                ("added", "Added", None),
+            )
+        ]
+
+        async def _fake_collect_pack_skills(source_url: str) -> list[PackSkillCandidate]:
+            return discovered
+
+        monkeypatch.setattr(
+            "app.api.skills_marketplace._collect_pack_skills",
+            _fake_collect_pack_skills,
+        )
+        app = _build_test_app(session_maker, organization=organization)
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            response = await client.post(f"/api/v1/skills/packs/{pack.id}/sync")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["synced"], body["created"], body["updated"]) == (3, 1, 1)
+
+        async with session_maker() as session:
+            skills = await MarketplaceSkill.objects.filter_by(
+                organization_id=organization.id,
+            ).all(session)
+        by_name = {skill.name: skill for skill in skills}
+        assert by_name["changed"].description == "New description"
+        assert by_name["changed"].metadata_ == {"tags": ["fresh"]}
+        assert by_name["changed"].updated_at > stale_at
+        assert by_name["same"].updated_at == stale_at
+        assert by_name["added"].source_url == f"{repo_url}/tree/main/skills/added"
+        assert by_name["added"].pack_id == pack.id
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_upsert_pack_skills_keeps_discovery_order_for_new_rows() -> None:
+    from app.api.skills_marketplace import _upsert_pack_skills
+
+    engine = await _make_engine()
+    repo_url = "https://github.com/org/pack"
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            organization, _gateway = await _seed_base(session)
+            pack = SkillPack(organization_id=organization.id, name="Pack", source_url=repo_url)
+            session.add(pack)
+            await session.commit()
+            slugs = [f"skill-{index}" for index in range(5)]
+
+            created, updated = await _upsert_pack_skills(
+                session=session,
+                organization_id=organization.id,
+                pack_id=pack.id,
+                candidates=[
+                    PackSkillCandidate(
+                        name=slug,
+                        description=None,
+                        source_url=f"{repo_url}/tree/main/skills/{slug}",
+                    )
+                    for slug in slugs
+                ],
+            )
+            await session.commit()
+
+            skills = (
+                await MarketplaceSkill.objects.filter_by(organization_id=organization.id)
+                .order_by(
+                    col(MarketplaceSkill.created_at).desc(),
+                    col(MarketplaceSkill.id).desc(),
+                )
+                .all(session)
+            )
+
+        assert (created, updated) == (5, 0)
+        assert [skill.name for skill in skills] == slugs[::-1]
+        assert len({skill.created_at for skill in skills}) == 5
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_upsert_pack_skills_reads_xmax_instead_of_preselecting_on_postgres() -> None:
+    from types import SimpleNamespace
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.api.skills_marketplace import _upsert_pack_skills
+
+    statements: list[str] = []
+
+    class _PostgresSession:
+        def get_bind(self):
+            return SimpleNamespace(dialect=postgresql.dialect())
+
+        async def exec(self, statement):
+            statements.append(str(statement.compile(dialect=postgresql.dialect())))
+            return SimpleNamespace(scalars=lambda: [True, False])
+
+    created, updated = await _upsert_pack_skills(
+        session=_PostgresSession(),
+        organization_id=uuid4(),
+        pack_id=uuid4(),
+        candidates=[
+            PackSkillCandidate(
+                name=slug,
+                description=None,
+                source_url=f"https://github.com/org/pack/tree/main/skills/{slug}",
+            )
+            for slug in ("new", "changed")
+        ],
+    )
+
+    assert (created, updated) == (1, 1)
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO marketplace_skills")
+    assert "RETURNING xmax = 0 AS inserted" in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_list_marketplace_skills_filters_by_pack_link() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    repo_url = "https://github.com/org/linked-pack"
+    try:
+        async with session_maker() as session:
+            organization, gateway = await _seed_base(session)
+            pack = SkillPack(organization_id=organization.id, name="Pack", source_url=repo_url)
+            session.add(pack)
+            session.add_all(
+                [
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        pack_id=pack.id,
+                        name="synced",
+                        source_url=f"{repo_url}/tree/main/skills/synced",
+                    ),
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        name="other",
+                        source_url="https://github.com/org/other/tree/main/skills/other",
+                    ),
+                ],
+            )
+            await session.commit()
+
+        app = _build_test_app(session_maker, organization=organization)
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            listed = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(gateway.id), "pack_id": str(pack.id)},
+            )
+            deleted = await client.delete(f"/api/v1/skills/packs/{pack.id}")
+
+        assert [item["name"] for item in listed.json()] == ["synced"]
+        assert deleted.status_code == 200
+        async with session_maker() as session:
+            synced = await MarketplaceSkill.objects.filter_by(name="synced").first(session)
+        assert synced is not None
+        assert synced.pack_id is None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (None, "main"),
+        ("", "main"),
+        ("  main  ", "main"),
+        ("release/1.2", "release/1.2"),
+        (" feature_x-y ", "feature_x-y"),
+        ("bad branch", "main"),
+        ("bad\tbranch", "main"),
+        ("bad\nbranch", "main"),
+        ("main;rm -rf", "main"),
+    ],
+)
+def test_normalize_pack_branch(raw: str | None, expected: str) -> None:
+    assert _normalize_pack_branch(raw) == expected
+
+
 def test_validate_pack_source_url_allows_https_github_repo_with_optional_dot_git() -> None:
     _validate_pack_source_url("https://github.com/org/repo")
     _validate_pack_source_url("https://github.com/org/repo.git")
@@ -565,6 +1106,7 @@ async def test_list_skill_packs_includes_skill_count() -> None:
                 MarketplaceSkill(
                     organization_id=organization.id,
                     name="Skill One",
+                    pack_id=pack.id,
                     source_url=(
                         "https://github.com/sickn33/antigravity-awesome-skills"
                         "/tree/main/skills/alpha"
@@ -575,6 +1117,7 @@ async def test_list_skill_packs_includes_skill_count() -> None:
                 MarketplaceSkill(
                     organization_id=organization.id,
                     name="Skill Two",
+                    pack_id=pack.id,
                     source_url=(
                         "https://github.com/sickn33/antigravity-awesome-skills"
                         "/tree/main/skills/beta"
@@ -607,6 +1150,120 @@ async def test_list_skill_packs_includes_skill_count() -> None:
         await engine.dispose()
 
 
+@pytest.mark.asyncio
+async def test_load_pack_skill_counts_groups_by_pack_link() -> None:
+    from app.api.skills_marketplace import _load_pack_skill_counts
+
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_maker() as session:
+            organization, _gateway = await _seed_base(session)
+            repo = SkillPack(
+                organization_id=organization.id,
+                name="Repo",
+                source_url="https://github.com/org/repo",
+            )
+            extended = SkillPack(
+                organization_id=organization.id,
+                name="Repo Extended",
+                source_url="https://github.com/org/repo-extended",
+            )
+            session.add_all([repo, extended])
+            for slug, pack_id in (
+                ("alpha", repo.id),
+                ("beta", repo.id),
+                ("gamma", extended.id),
+                ("delta", None),
+            ):
+                # The URL no longer matters; only the pack link is counted.
+                session.add(
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        name=slug,
+                        source_url=f"https://github.com/org/repo/tree/main/skills/{slug}",
+                        pack_id=pack_id,
+                    ),
+                )
+            await session.commit()
+
+            scoped = await _load_pack_skill_counts(
+                session=session,
+                organization_id=organization.id,
+                pack_id=repo.id,
+            )
+            unscoped = await _load_pack_skill_counts(
+                session=session,
+                organization_id=organization.id,
+            )
+
+        assert scoped == {repo.id: 2}
+        assert unscoped == {repo.id: 2, extended.id: 1}
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pack_skill_counts_reflect_catalog_writes_immediately() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    repo_url = "https://github.com/org/counted-pack"
+    try:
+        async with session_maker() as session:
+            organization, _gateway = await _seed_base(session)
+            pack = SkillPack(organization_id=organization.id, name="Pack", source_url=repo_url)
+            session.add(pack)
+            alpha = MarketplaceSkill(
+                organization_id=organization.id,
+                name="alpha",
+                source_url=f"{repo_url}/tree/main/skills/alpha",
+                pack_id=pack.id,
+            )
+            session.add(alpha)
+            await session.commit()
+
+        app = _build_test_app(session_maker, organization=organization)
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            first = await client.get("/api/v1/skills/packs")
+
+            # Rows written by another worker are counted on the next read.
+            async with session_maker() as session:
+                session.add_all(
+                    [
+                        MarketplaceSkill(
+                            organization_id=organization.id,
+                            name=slug,
+                            source_url=f"{repo_url}/tree/main/skills/{slug}",
+                            pack_id=pack.id,
+                        )
+                        for slug in ("beta", "gamma")
+                    ],
+                )
+                await session.commit()
+            second = await client.get("/api/v1/skills/packs")
+
+            deleted = await client.delete(f"/api/v1/skills/marketplace/{alpha.id}")
+            single = await client.get(f"/api/v1/skills/packs/{pack.id}")
+
+        assert first.json()[0]["skill_count"] == 1
+        assert second.json()[0]["skill_count"] == 3
+        assert deleted.status_code == 200
+        assert single.json()["skill_count"] == 2
+    finally:
+        await engine.dispose()
+
+
 @pytest.mark.asyncio
 async def test_update_skill_pack_rejects_duplicate_normalized_source_url() -> None:
     engine = await _make_engine()
@@ -847,6 +1504,55 @@ def test_collect_pack_skills_from_repo_supports_top_level_skill_folders(
     )
 
 
+def test_parse_skill_header_reads_name_and_description_in_one_pass(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    skill_file = tmp_path / "SKILL.md"
+    skill_file.write_text(
+        "---\ndescription: From frontmatter\n---\n# Heading Name\nBody line\n",
+        encoding="utf-8",
+    )
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def _counting_read_text(self: Path, *args: object, **kwargs: object) -> str:
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _counting_read_text)
+
+    assert _parse_skill_header(skill_file, fallback="my-skill") == (
+        "Heading Name",
+        "From frontmatter",
+    )
+    assert _parse_skill_header(tmp_path / "missing.md", fallback="my-skill") == (
+        "my skill",
+        None,
+    )
+    assert len(reads) == 2
+
+
+def test_collect_pack_skills_from_repo_skips_hidden_directories(tmp_path: Path) -> None:
+    repo_dir = tmp_path / "repo"
+    for rel in ("b-skill", "a-skill", "nested/deep", ".git/objects", ".github/skill"):
+        (repo_dir / rel).mkdir(parents=True)
+    for rel in ("b-skill", "a-skill", "nested/deep", ".git/objects", ".github/skill"):
+        (repo_dir / rel / "SKILL.md").write_text(f"# {rel}\n", encoding="utf-8")
+
+    skills = _collect_pack_skills_from_repo(
+        repo_dir=repo_dir,
+        source_url="https://github.com/example/walk",
+        branch="main",
+    )
+
+    assert [skill.metadata["skill_dir"] for skill in skills] == [
+        "a-skill",
+        "b-skill",
+        "nested/deep",
+    ]
+
+
 def test_collect_pack_skills_from_repo_streams_large_index(tmp_path: Path) -> None:
     repo_dir = tmp_path / "repo"
     repo_dir.mkdir()
@@ -880,3 +1586,375 @@ def test_collect_pack_skills_from_repo_streams_large_index(tmp_path: Path) -> No
         skills[0].source_url == "https://github.com/example/oversized-pack/tree/main/skills/ignored"
     )
     assert skills[0].name == "Huge Index Skill"
+
+
+def test_streaming_reader_grows_reads_for_values_spanning_many_chunks() -> None:
+    import io
+
+    class _CountingReader(io.StringIO):
+        reads = 0
+
+        def read(self, size: int | None = -1) -> str:
+            type(self).reads += 1
+            return super().read(size)
+
+    huge_description = "x" * (1024 * 1024)
+    payload = json.dumps([{"name": "big", "description": huge_description, "path": "big"}])
+
+    entries = _StreamingJSONReader(
+        _CountingReader(payload),
+        chunk_bytes=16 * 1024,
+    ).read_top_level_entries()
+
+    assert [entry["name"] for entry in entries] == ["big"]
+    # 1 MiB in 16 KiB chunks used to take 64+ decode attempts; doubling needs ~8.
+    assert _CountingReader.reads <= 10
+
+
+def test_streaming_reader_discards_decoded_prefix() -> None:
+    import io
+
+    class _TrackingReader(_StreamingJSONReader):
+        peak = 0
+
+        def _fill_buffer(self, size: int | None = None) -> None:
+            super()._fill_buffer(size)
+            type(self).peak = max(type(self).peak, len(self._buffer))
+
+    entries = [
+        {"name": f"skill-{i}", "description": "d" * 4096, "path": f"s/{i}"} for i in range(256)
+    ]
+    payload = json.dumps(entries)
+
+    result = _TrackingReader(io.StringIO(payload), chunk_bytes=16 * 1024).read_top_level_entries()
+
+    assert [entry["name"] for entry in result] == [f"skill-{i}" for i in range(256)]
+    # Only the unread window is kept, not the whole ~1 MiB document.
+    assert _TrackingReader.peak < len(payload) // 8
+
+
+def _init_pack_repo(path: Path) -> str:
+    import subprocess
+
+    path.mkdir()
+    (path / "alpha").mkdir()
+    (path / "alpha" / "SKILL.md").write_text("# Alpha Skill\nDoes alpha.\n", encoding="utf-8")
+    (path / "assets.bin").write_bytes(b"\0" * 1024)
+    for args in (
+        ["init", "-q", "-b", "main"],
+        ["add", "."],
+        ["-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "init"],
+    ):
+        subprocess.run(["git", "-C", str(path), *args], check=True, capture_output=True)
+    return path.as_uri()
+
+
+@pytest.mark.asyncio
+async def test_collect_pack_skills_clones_without_blocking(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+
+    from app.api import skills_marketplace
+
+    source_url = _init_pack_repo(tmp_path / "pack")
+    monkeypatch.setattr(skills_marketplace, "_validate_pack_source_url", lambda _url: None)
+
+    results = await asyncio.gather(
+        *(skills_marketplace._collect_pack_skills(source_url=source_url) for _ in range(3)),
+    )
+
+    for skills in results:
+        assert [skill.name for skill in skills] == ["Alpha Skill"]
+        assert skills[0].source_url == f"{source_url}/tree/main/alpha"
+
+    with pytest.raises(RuntimeError, match="unable to clone pack repository"):
+        await skills_marketplace._collect_pack_skills(source_url=f"{source_url}-missing")
+
+
+@pytest.mark.asyncio
+async def test_clone_pack_repo_checks_out_only_skill_files(tmp_path: Path) -> None:
+    from app.api import skills_marketplace
+
+    source_url = _init_pack_repo(tmp_path / "pack")
+    repo_dir = tmp_path / "clone"
+
+    await skills_marketplace._clone_pack_repo(
+        source_url=source_url,
+        repo_dir=repo_dir,
+        branch="main",
+    )
+
+    assert (repo_dir / "alpha" / "SKILL.md").is_file()
+    assert not (repo_dir / "assets.bin").exists()
+
+
+@pytest.mark.asyncio
+async def test_collect_pack_skills_reuses_discovery_until_tip_moves(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import subprocess
+
+    from app.api import skills_marketplace
+
+    repo_path = tmp_path / "pack"
+    source_url = _init_pack_repo(repo_path)
+    monkeypatch.setattr(skills_marketplace, "_validate_pack_source_url", lambda _url: None)
+    monkeypatch.setattr(skills_marketplace, "_pack_skills_cache", {})
+    clones: list[str] = []
+    original_clone = skills_marketplace._clone_pack_repo
+
+    async def _counting_clone(**kwargs: object) -> None:
+        clones.append(str(kwargs["source_url"]))
+        await original_clone(**kwargs)
+
+    monkeypatch.setattr(skills_marketplace, "_clone_pack_repo", _counting_clone)
+
+    first = await skills_marketplace._collect_pack_skills(source_url=source_url)
+    second = await skills_marketplace._collect_pack_skills(source_url=source_url)
+    assert [s.name for s in first] == [s.name for s in second] == ["Alpha Skill"]
+    assert len(clones) == 1
+
+    (repo_path / "beta").mkdir()
+    (repo_path / "beta" / "SKILL.md").write_text("# Beta Skill\n", encoding="utf-8")
+    for args in (
+        ["add", "."],
+        ["-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "beta"],
+    ):
+        subprocess.run(["git", "-C", str(repo_path), *args], check=True, capture_output=True)
+
+    third = await skills_marketplace._collect_pack_skills(source_url=source_url)
+    assert sorted(s.name for s in third) == ["Alpha Skill", "Beta Skill"]
+    assert len(clones) == 2
+
+    skills_marketplace._invalidate_pack_skills_cache(source_url)
+    assert skills_marketplace._pack_skills_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_require_gateway_and_skill_for_org_loads_both_in_one_query() -> None:
+    from fastapi import HTTPException
+    from sqlalchemy import event
+
+    from app.api.skills_marketplace import _require_gateway_and_skill_for_org
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            organization, gateway = await _seed_base(session)
+            skill = MarketplaceSkill(
+                organization_id=organization.id,
+                name="Skill",
+                source_url="https://github.com/org/repo/tree/main/skill",
+            )
+            session.add(skill)
+            await session.commit()
+            ctx = OrganizationContext(
+                organization=organization,
+                member=OrganizationMember(organization_id=organization.id, user_id=uuid4()),
+            )
+
+            selects: list[str] = []
+
+            @event.listens_for(engine.sync_engine, "before_cursor_execute")
+            def _record(_conn, _cursor, statement, *_args) -> None:
+                selects.append(statement)
+
+            loaded_gateway, loaded_skill = await _require_gateway_and_skill_for_org(
+                gateway_id=gateway.id,
+                skill_id=skill.id,
+                session=session,
+                ctx=ctx,
+            )
+            assert (loaded_gateway.id, loaded_skill.id) == (gateway.id, skill.id)
+            assert len(selects) == 1
+
+            with pytest.raises(HTTPException) as exc:
+                await _require_gateway_and_skill_for_org(
+                    gateway_id=gateway.id,
+                    skill_id=uuid4(),
+                    session=session,
+                    ctx=ctx,
+                )
+            assert exc.value.detail == "Marketplace skill not found"
+
+            with pytest.raises(HTTPException) as exc:
+                await _require_gateway_and_skill_for_org(
+                    gateway_id=uuid4(),
+                    skill_id=skill.id,
+                    session=session,
+                    ctx=ctx,
+                )
+            assert exc.value.detail == "Gateway not found"
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sync_gateway_installation_state_upserts_and_deletes() -> None:
+    from app.api.skills_marketplace import _sync_gateway_installation_state
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            organization, gateway = await _seed_base(session)
+            skill = MarketplaceSkill(
+                organization_id=organization.id,
+                name="Skill",
+                source_url="https://github.com/org/repo/tree/main/skill",
+            )
+            session.add(skill)
+            await session.commit()
+
+            for _ in range(2):
+                await _sync_gateway_installation_state(
+                    session=session,
+                    gateway_id=gateway.id,
+                    skill_id=skill.id,
+                    installed=True,
+                )
+                await session.commit()
+            rows = (await session.exec(select(GatewayInstalledSkill))).all()
+            assert len(rows) == 1
+            assert rows[0].updated_at >= rows[0].created_at
+
+            await _sync_gateway_installation_state(
+                session=session,
+                gateway_id=gateway.id,
+                skill_id=skill.id,
+                installed=False,
+            )
+            await session.commit()
+            assert (await session.exec(select(GatewayInstalledSkill))).all() == []
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_run_git_caps_buffered_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    import subprocess
+
+    from app.api import skills_marketplace
+
+    monkeypatch.setattr(skills_marketplace, "GIT_OUTPUT_LIMIT_BYTES", 32)
+
+    output = await skills_marketplace._run_git("--help", timeout=10)
+    assert len(output) == 32
+
+    with pytest.raises(subprocess.CalledProcessError) as exc:
+        await skills_marketplace._run_git("definitely-not-a-command", timeout=10)
+    assert exc.value.returncode != 0
+    assert 0 < len(exc.value.stderr) <= 32
+
+
+@pytest.mark.asyncio
+async def test_run_git_kills_the_child_on_timeout_and_cancellation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+    import subprocess
+
+    from app.api import skills_marketplace
+
+    processes: list[asyncio.subprocess.Process] = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def _hanging_exec(*_command: str, **kwargs: object) -> asyncio.subprocess.Process:
+        process = await real_exec("sleep", "30", **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _hanging_exec)
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        await skills_marketplace._run_git("clone", timeout=0.05)
+
+    task = asyncio.create_task(skills_marketplace._run_git("clone", timeout=30))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert len(processes) == 2
+    assert all(process.returncode is not None for process in processes)
+
+
+def test_collect_pack_skills_falls_back_when_index_breaks_midway(tmp_path: Path) -> None:
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    (repo_dir / "SKILL.md").write_text("# Fallback Skill\n", encoding="utf-8")
+    (repo_dir / "skills_index.json").write_text(
+        '[{"name": "Streamed", "path": "skills/streamed"}, {"name": ',
+        encoding="utf-8",
+    )
+    warnings: list[str] = []
+
+    skills = _collect_pack_skills_from_repo(
+        repo_dir=repo_dir,
+        source_url="https://github.com/example/broken-index",
+        branch="main",
+        discovery_warnings=warnings,
+    )
+
+    assert [skill.name for skill in skills] == ["Fallback Skill"]
+    assert warnings == ["Failed to parse skills_index.json: skills_index.json is not valid JSON"]
+
+
+@pytest.mark.asyncio
+async def test_collect_pack_skills_clones_under_configured_dir(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.api import skills_marketplace
+
+    source_url = _init_pack_repo(tmp_path / "pack")
+    clone_root = tmp_path / "clones"
+    clone_root.mkdir()
+    monkeypatch.setattr(skills_marketplace, "_validate_pack_source_url", lambda _url: None)
+    monkeypatch.setattr(skills_marketplace, "SKILL_PACK_CLONE_DIR", str(clone_root))
+    clone_parents: list[Path] = []
+    original_clone = skills_marketplace._clone_pack_repo
+
+    async def _recording_clone(**kwargs: object) -> None:
+        clone_parents.append(Path(str(kwargs["repo_dir"])).parent)
+        await original_clone(**kwargs)
+
+    monkeypatch.setattr(skills_marketplace, "_clone_pack_repo", _recording_clone)
+
+    skills = await skills_marketplace._collect_pack_skills(source_url=source_url)
+
+    assert [skill.name for skill in skills] == ["Alpha Skill"]
+    assert clone_parents == [clone_root]
+    assert skills_marketplace.GIT_ENV["GIT_TERMINAL_PROMPT"] == "0"
+    assert list(clone_root.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_collect_pack_skills_reports_missing_clone_dir(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.api import skills_marketplace
+
+    source_url = _init_pack_repo(tmp_path / "pack")
+    monkeypatch.setattr(skills_marketplace, "_validate_pack_source_url", lambda _url: None)
+    monkeypatch.setattr(skills_marketplace, "SKILL_PACK_CLONE_DIR", str(tmp_path / "missing"))
+
+    with pytest.raises(RuntimeError, match="clone directory"):
+        await skills_marketplace._collect_pack_skills(source_url=source_url)
+
+
+def test_pure_string_helpers_are_memoized() -> None:
+    from app.api import skills_marketplace
+
+    skills_marketplace._normalize_repo_source_url.cache_clear()
+    for _ in range(3):
+        assert (
+            skills_marketplace._normalize_repo_source_url(" https://github.com/org/repo.git/ ")
+            == "https://github.com/org/repo"
+        )
+    assert skills_marketplace._normalize_repo_source_url.cache_info().hits == 2
+    assert skills_marketplace._skills_install_dir("/workspace/") == "/workspace/skills"
+    assert skills_marketplace._normalize_pack_branch("main") == "main"
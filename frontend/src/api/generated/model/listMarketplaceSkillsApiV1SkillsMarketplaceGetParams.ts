@@ -13,7 +13,10 @@ export type ListMarketplaceSkillsApiV1SkillsMarketplaceGetParams = {
   pack_id?: string | null;
   limit?: number | null;
   /**
+   * @deprecated
    * @minimum 0
    */
   offset?: number;
+  cursor?: string | null;
+  include_total?: boolean;
 };
@@ -16,6 +16,7 @@ import {
 } from "@/api/generated/gateways/gateways";
 import type { MarketplaceSkillCardRead } from "@/api/generated/model";
 import {
+  getListMarketplaceSkillsApiV1SkillsMarketplaceGetQueryKey,
   listMarketplaceSkillsApiV1SkillsMarketplaceGet,
   type listMarketplaceSkillsApiV1SkillsMarketplaceGetResponse,
   useInstallMarketplaceSkillApiV1SkillsMarketplaceSkillIdInstallPost,
@@ -59,6 +60,8 @@ type MarketplaceSkillListParams = {
   pack_id?: string;
   limit?: number;
   offset?: number;
+  cursor?: string;
+  include_total?: boolean;
 };
 
 const RISK_SORT_ORDER: Record<string, number> = {
@@ -154,8 +157,11 @@ function parsePageSizeParam(value: string | null) {
  * - We keep a *separate* query (without pagination) for building filter option
  *   lists (categories/risks) so options don't disappear just because the current
  *   page is filtered/paginated.
- * - Total row count is best-effort: when the API provides `x-total-count`, we
- *   use it; otherwise we infer whether there is a next page from page-size.
+ * - `x-total-count` (`include_total`) is requested only until it is known for
+ *   the current filters, then kept in state; later pages and polls skip the
+ *   COUNT. The next page comes from each page's `x-has-more`.
+ * - Stepping forward follows the `x-next-cursor` keyset cursor from the page
+ *   before; pages without a recorded cursor (e.g. deep links) use offset.
  */
 export default function SkillsMarketplacePage() {
   const queryClient = useQueryClient();
@@ -194,6 +200,14 @@ export default function SkillsMarketplacePage() {
   );
   const [currentPage, setCurrentPage] = useState(initialPage);
   const [pageSize, setPageSize] = useState(initialPageSize);
+  const [pageCursors, setPageCursors] = useState<{
+    scope: string;
+    byPage: Record<number, string>;
+  }>({ scope: "", byPage: {} });
+  const [scopeTotal, setScopeTotal] = useState<{
+    scope: string;
+    total: number;
+  } | null>(null);
 
   const { sorting, onSortingChange } = useUrlSorting({
     allowedColumnIds: MARKETPLACE_SKILLS_SORTABLE_COLUMNS,
@@ -231,12 +245,40 @@ export default function SkillsMarketplacePage() {
   }, [selectedRisk]);
   const normalizedSearch = useMemo(() => searchTerm.trim(), [searchTerm]);
   const selectedPackId = searchParams.get("packId");
-  const skillsParams = useMemo<MarketplaceSkillListParams>(() => {
+  // Cursors are only valid for the filters and page size that issued them.
+  const cursorScope = useMemo(
+    () =>
+      JSON.stringify([
+        normalizedSearch,
+        normalizedCategory,
+        normalizedRisk,
+        selectedPackId,
+        pageSize,
+      ]),
+    [
+      normalizedCategory,
+      normalizedRisk,
+      normalizedSearch,
+      pageSize,
+      selectedPackId,
+    ],
+  );
+  const currentPageCursor =
+    pageCursors.scope === cursorScope
+      ? pageCursors.byPage[currentPage]
+      : undefined;
+  const knownTotal =
+    scopeTotal?.scope === cursorScope ? scopeTotal.total : undefined;
+  const pageParams = useMemo<MarketplaceSkillListParams>(() => {
     const params: MarketplaceSkillListParams = {
       gateway_id: resolvedGatewayId,
       limit: pageSize,
-      offset: (currentPage - 1) * pageSize,
     };
+    if (currentPageCursor) {
+      params.cursor = currentPageCursor;
+    } else {
+      params.offset = (currentPage - 1) * pageSize;
+    }
     if (normalizedSearch) {
       params.search = normalizedSearch;
     }
@@ -252,6 +294,7 @@ export default function SkillsMarketplacePage() {
     return params;
   }, [
     currentPage,
+    currentPageCursor,
     pageSize,
     normalizedCategory,
     normalizedRisk,
@@ -259,6 +302,16 @@ export default function SkillsMarketplacePage() {
     resolvedGatewayId,
     selectedPackId,
   ]);
+  // The footer shows "Page N of M", so the first page of each scope asks for
+  // the exact total once. The flag stays out of the query key: dropping it
+  // after the total arrives must not refetch the page.
+  const skillsParams = useMemo<MarketplaceSkillListParams>(
+    () =>
+      knownTotal === undefined
+        ? { ...pageParams, include_total: true }
+        : pageParams,
+    [knownTotal, pageParams],
+  );
   // Fetch a non-paginated (or minimally constrained) slice for building filter options.
   // Keeping this separate avoids "missing" categories/risks when the main list is paginated.
   const filterOptionsParams = useMemo<MarketplaceSkillListParams>(() => {
@@ -279,6 +332,9 @@ export default function SkillsMarketplacePage() {
     ApiError
   >(skillsParams, {
     query: {
+      queryKey: getListMarketplaceSkillsApiV1SkillsMarketplaceGetQueryKey(
+        pageParams,
+      ),
       enabled: Boolean(isSignedIn && isAdmin && resolvedGatewayId),
       refetchOnMount: "always",
       refetchInterval: 15_000,
@@ -289,6 +345,38 @@ export default function SkillsMarketplacePage() {
     () => (skillsQuery.data?.status === 200 ? skillsQuery.data.data : []),
     [skillsQuery.data],
   );
+
+  useEffect(() => {
+    if (skillsQuery.data?.status !== 200) return;
+    const nextCursor = skillsQuery.data.headers.get("x-next-cursor");
+    if (!nextCursor) return;
+    setPageCursors((previous) => {
+      const byPage = previous.scope === cursorScope ? previous.byPage : {};
+      if (byPage[currentPage + 1] === nextCursor) return previous;
+      return {
+        scope: cursorScope,
+        byPage: { ...byPage, [currentPage + 1]: nextCursor },
+      };
+    });
+  }, [currentPage, cursorScope, skillsQuery.data]);
+
+  useEffect(() => {
+    if (skillsQuery.data?.status !== 200) return;
+    const totalCountHeader = skillsQuery.data.headers.get("x-total-count");
+    if (
+      typeof totalCountHeader !== "string" ||
+      totalCountHeader.trim() === ""
+    ) {
+      return;
+    }
+    const parsed = Number(totalCountHeader);
+    if (!Number.isFinite(parsed) || parsed < 0) return;
+    setScopeTotal((previous) =>
+      previous?.scope === cursorScope && previous.total === parsed
+        ? previous
+        : { scope: cursorScope, total: parsed },
+    );
+  }, [cursorScope, skillsQuery.data]);
   const filterOptionSkillsQuery =
     useListMarketplaceSkillsApiV1SkillsMarketplaceGet<
       listMarketplaceSkillsApiV1SkillsMarketplaceGetResponse,
@@ -328,24 +416,15 @@ export default function SkillsMarketplacePage() {
   );
 
   const filteredSkills = useMemo(() => skills, [skills]);
-  // Prefer the API total-count header when available (true pagination).
-  // When missing, we fall back to a heuristic for "has next page".
-  const totalCountInfo = useMemo(() => {
-    if (skillsQuery.data?.status !== 200) {
-      return { hasKnownTotal: false, total: skills.length };
-    }
-    const totalCountHeader = skillsQuery.data.headers.get("x-total-count");
-    if (
-      typeof totalCountHeader === "string" &&
-      totalCountHeader.trim() !== ""
-    ) {
-      const parsed = Number(totalCountHeader);
-      if (Number.isFinite(parsed) && parsed >= 0) {
-        return { hasKnownTotal: true, total: parsed };
-      }
-    }
-    return { hasKnownTotal: false, total: skills.length };
-  }, [skills, skillsQuery.data]);
+  // The total fetched once for this scope labels "Page N of M"; until it
+  // arrives the footer falls back to the rows seen so far.
+  const totalCountInfo = useMemo(
+    () =>
+      knownTotal === undefined
+        ? { hasKnownTotal: false, total: skills.length }
+        : { hasKnownTotal: true, total: knownTotal },
+    [knownTotal, skills.length],
+  );
   const totalSkills = useMemo(() => {
     if (totalCountInfo.hasKnownTotal) {
       return totalCountInfo.total;
@@ -356,13 +435,23 @@ export default function SkillsMarketplacePage() {
     () => Math.max(1, Math.ceil(totalSkills / pageSize)),
     [pageSize, totalSkills],
   );
+  const hasMoreHeader =
+    skillsQuery.data?.status === 200
+      ? skillsQuery.data.headers.get("x-has-more")
+      : null;
+  // Each page reports whether another follows, so the next button never
+  // depends on a total that may have aged since it was fetched.
   const hasNextPage = useMemo(() => {
+    if (hasMoreHeader === "true" || hasMoreHeader === "false") {
+      return hasMoreHeader === "true";
+    }
     if (totalCountInfo.hasKnownTotal) {
       return currentPage < totalPages;
     }
     return skills.length === pageSize;
   }, [
     currentPage,
+    hasMoreHeader,
     pageSize,
     skills.length,
     totalCountInfo.hasKnownTotal,
@@ -445,6 +534,27 @@ export default function SkillsMarketplacePage() {
     selectedPackId,
   ]);
 
+  useEffect(() => {
+    if (knownTotal === undefined || skillsQuery.data?.status !== 200) return;
+    // Skills were synced or removed since the total was fetched; the next poll
+    // asks for it again.
+    const seenThrough = (currentPage - 1) * pageSize + skills.length;
+    const isStale =
+      seenThrough > knownTotal ||
+      (hasMoreHeader === "true" && seenThrough >= knownTotal) ||
+      (hasMoreHeader === "false" && seenThrough < knownTotal);
+    if (isStale) {
+      setScopeTotal(null);
+    }
+  }, [
+    currentPage,
+    hasMoreHeader,
+    knownTotal,
+    pageSize,
+    skills.length,
+    skillsQuery.data,
+  ]);
+
   useEffect(() => {
     if (totalCountInfo.hasKnownTotal && currentPage > totalPages) {
       setCurrentPage(totalPages);
@@ -962,11 +1072,7 @@ export default function SkillsMarketplacePage() {
                     size="sm"
                     disabled={!hasNextPage || skillsQuery.isLoading}
                     onClick={() => {
-                      setCurrentPage((prev) =>
-                        totalCountInfo.hasKnownTotal
-                          ? Math.min(totalPages, prev + 1)
-                          : prev + 1,
-                      );
+                      setCurrentPage((prev) => prev + 1);
                     }}
                   >
                     Next